@@ -9,12 +9,29 @@
 #
 ##########################################################################################
 
+import importlib
+
 from agents.base import BaseAgent, AgentConfig, AgentResponse
-from agents.orchestrator import ReleasePlanningOrchestrator
-from agents.jira_analyst import JiraAnalystAgent
-from agents.planning_agent import PlanningAgent
-from agents.vision_analyzer import VisionAnalyzerAgent
-from agents.review_agent import ReviewAgent
+
+# Concrete agents are imported on first attribute access so that importing
+# one agent module does not load every other agent's dependencies.
+_LAZY_EXPORTS = {
+    'ReleasePlanningOrchestrator': 'agents.orchestrator',
+    'JiraAnalystAgent': 'agents.jira_analyst',
+    'PlanningAgent': 'agents.planning_agent',
+    'VisionAnalyzerAgent': 'agents.vision_analyzer',
+    'ReviewAgent': 'agents.review_agent',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'BaseAgent',
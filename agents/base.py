@@ -9,6 +9,7 @@
 #
 ##########################################################################################
 
+import functools
 import json
 import logging
 import os
@@ -27,6 +28,36 @@ from tools.base import BaseTool, ToolDefinition, ToolResult
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
 
+@functools.lru_cache(maxsize=8)
+def _read_prompt(prompt_path: str, mtime: float) -> str:
+    '''
+    Read a prompt file.
+
+    Cached per (path, mtime): repeated agent construction reuses the text,
+    while an edited prompt gets a new key and is read again.
+    '''
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def load_prompt_file(prompt_path: str) -> Optional[str]:
+    '''
+    Load an agent prompt, cached until the file is modified.
+
+    Input:
+        prompt_path: Path to the prompt file.
+
+    Output:
+        The prompt text, or None if the file does not exist.  Other read
+        errors propagate so the agent can report them.
+    '''
+    # One stat for the cache key doubles as the existence check
+    try:
+        return _read_prompt(prompt_path, os.path.getmtime(prompt_path))
+    except FileNotFoundError:
+        return None
+
+
 @dataclass
 class AgentConfig:
     '''
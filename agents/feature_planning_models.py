@@ -14,7 +14,8 @@ import logging
 import os
 import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
@@ -442,6 +443,13 @@ class JiraPlan:
 # Orchestrator State
 # ---------------------------------------------------------------------------
 
+def _unwrap_mapping(value: Any) -> Any:
+    '''Return a plain dict for a MappingProxyType view; other values as-is.'''
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    return value
+
+
 @dataclass
 class FeaturePlanningState:
     '''
@@ -466,10 +474,13 @@ class FeaturePlanningState:
     project_key: str = ''
     doc_paths: List[str] = field(default_factory=list)
 
-    # Phase outputs (stored as dicts for JSON serialization)
-    research_report: Optional[Dict[str, Any]] = None
-    hw_profile: Optional[Dict[str, Any]] = None
-    feature_scope: Optional[Dict[str, Any]] = None
+    # Phase outputs (stored as dicts for JSON serialization).  The
+    # orchestrator stores research_report / hw_profile / feature_scope as
+    # read-only MappingProxyType views so sub-agents can share them by
+    # reference; to_dict() unwraps them.
+    research_report: Optional[Mapping[str, Any]] = None
+    hw_profile: Optional[Mapping[str, Any]] = None
+    feature_scope: Optional[Mapping[str, Any]] = None
     jira_plan: Optional[Dict[str, Any]] = None
 
     # Cross-cutting
@@ -492,9 +503,9 @@ class FeaturePlanningState:
             'feature_request': self.feature_request,
             'project_key': self.project_key,
             'doc_paths': self.doc_paths,
-            'research_report': self.research_report,
-            'hw_profile': self.hw_profile,
-            'feature_scope': self.feature_scope,
+            'research_report': _unwrap_mapping(self.research_report),
+            'hw_profile': _unwrap_mapping(self.hw_profile),
+            'feature_scope': _unwrap_mapping(self.feature_scope),
             'jira_plan': self.jira_plan,
             'questions_for_user': self.questions_for_user,
             'current_phase': self.current_phase,
@@ -10,20 +10,314 @@
 #
 ##########################################################################################
 
+import hashlib
+import importlib
+import io
 import json
 import logging
 import os
+import re
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 from agents.base import BaseAgent, AgentConfig, AgentResponse
 from agents.feature_planning_models import FeaturePlanningState
+from core import json_utils
 
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
 
+def _json_default(obj: Any) -> Any:
+    '''JSON fallback: unwrap read-only state views, stringify anything else.'''
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    return str(obj)
+
+
+def _dumps_indented(data: Any, default=None) -> bytes:
+    '''Serialize *data* as 2-space-indented UTF-8 JSON bytes.'''
+    return json_utils.dumps(data, indent=True, default=default)
+
+
+# Upper bound on the scope document text embedded in the scope-parser prompt.
+# Token counts are estimated at ~4 characters per token; over-long documents
+# keep their head and tail plus a Markdown heading outline of the middle.
+SCOPE_TEXT_MAX_TOKENS = 60000
+_CHARS_PER_TOKEN = 4
+_HEADING_RE = re.compile(r'^#{1,3} .+$', re.MULTILINE)
+
+# List fields counted in the per-phase summaries
+SCOPE_ITEM_KEYS = (
+    'firmware_items', 'driver_items', 'tool_items',
+    'test_items', 'integration_items', 'documentation_items',
+)
+_RESEARCH_FINDING_KEYS = (
+    'standards_and_specs', 'existing_implementations', 'internal_knowledge',
+)
+_HW_PROFILE_LIST_KEYS = (
+    'components', 'bus_interfaces', 'existing_firmware',
+    'existing_drivers', 'existing_tools', 'gaps',
+)
+
+# Concurrent create_ticket calls per Epic during execution.  Kept small to
+# stay well inside Jira Cloud rate limits.
+STORY_CREATE_WORKERS = 8
+
+# Background writer for intermediate/debug files, shared by every
+# orchestrator; one thread keeps each run's writes in submission order.
+# The thread is only started on first use.
+_WRITE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix='fpo-writer'
+)
+
+# Extracted PDF/DOCX text fed to the research / HW-analysis LLM passes is
+# capped at this many characters; page extraction stops once it is reached.
+DOC_TEXT_MAX_CHARS = 200_000
+TRUNCATED_MARKER = '\n[...truncated]'
+
+# Leading-byte signatures used to identify scope documents whose file
+# extension is missing or unrecognized.
+_MAGIC_EXTENSIONS = ((b'%PDF', '.pdf'), (b'PK\x03\x04', '.docx'))
+
+
+def _sniff_extension(raw: bytes) -> str:
+    '''Guess a document extension from its leading bytes ('' if unknown).'''
+    for magic, ext in _MAGIC_EXTENSIONS:
+        if raw.startswith(magic):
+            return ext
+    if raw.lstrip().startswith(b'{'):
+        return '.json'
+    return ''
+
+
+# Optional PDF/DOCX backends, imported on first use.  A missing backend is
+# cached as None so later documents skip the import machinery entirely.
+_LAZY_MODULES: Dict[str, Any] = {}
+
+
+def _lazy_import(name: str):
+    '''Import and cache an optional module by name; None if not installed.'''
+    try:
+        return _LAZY_MODULES[name]
+    except KeyError:
+        pass
+    try:
+        mod = importlib.import_module(name)
+    except ImportError:
+        mod = None
+    _LAZY_MODULES[name] = mod
+    return mod
+
+
+def _join_page_text(page_texts, max_chars: Optional[int] = None) -> str:
+    '''
+    Concatenate page texts with newlines, writing one page at a time.
+
+    Unlike '\n'.join() over a generator, this never holds every page string
+    at once — which matters for PDFs with hundreds of pages.  Blank pages
+    (None or '' from the backend, e.g. scanned or title pages) are skipped.
+    With *max_chars*, stops pulling pages once the budget is reached (so
+    later pages are never extracted) and ends the text with TRUNCATED_MARKER.
+    '''
+    buf = io.StringIO()
+    for page_text in page_texts:
+        if not page_text:
+            continue
+        if buf.tell():
+            buf.write('\n')
+        buf.write(page_text)
+        if max_chars is not None and buf.tell() >= max_chars:
+            return _truncate_text(buf.getvalue(), max_chars)
+    return buf.getvalue()
+
+
+def _truncate_text(text: str, max_chars: int) -> str:
+    '''Cut *text* to *max_chars* and signpost the cut.'''
+    return f'{text[:max_chars]}{TRUNCATED_MARKER}'
+
+
+# ---------------------------------------------------------------------------
+# Document text extractors.  Each takes (doc_path, data, max_chars) — data
+# being the document bytes when the caller already has them, max_chars an
+# optional text budget — and returns the text, or None when the backend is
+# missing or fails.
+# ---------------------------------------------------------------------------
+
+def _extract_pdfium(
+    doc_path: str, data: Optional[bytes], max_chars: Optional[int] = None
+) -> Optional[str]:
+    '''pypdfium2 — fast, permissively licensed, one call per page.'''
+    pdfium = _lazy_import('pypdfium2')
+    if pdfium is None:
+        return None
+    try:
+        pdf = pdfium.PdfDocument(data if data is not None else doc_path)
+        try:
+            return _join_page_text(
+                (page.get_textpage().get_text_range() for page in pdf), max_chars
+            )
+        finally:
+            pdf.close()
+    except Exception as e:
+        log.warning(f'pypdfium2 failed on {doc_path}: {e}')
+        return None
+
+
+def _extract_pymupdf(
+    doc_path: str, data: Optional[bytes], max_chars: Optional[int] = None
+) -> Optional[str]:
+    '''PyMuPDF (fitz).'''
+    fitz = _lazy_import('fitz')
+    if fitz is None:
+        return None
+    try:
+        if data is not None:
+            doc = fitz.open(stream=data, filetype='pdf')
+        else:
+            doc = fitz.open(doc_path)
+        # Context manager releases the MuPDF handle even if a page fails
+        with doc:
+            return _join_page_text((page.get_text() for page in doc), max_chars)
+    except Exception as e:
+        log.warning(f'PyMuPDF failed on {doc_path}: {e}')
+        return None
+
+
+def _extract_pdfplumber(
+    doc_path: str, data: Optional[bytes], max_chars: Optional[int] = None
+) -> Optional[str]:
+    '''pdfplumber — slower, but better on table-heavy documents.'''
+    pdfplumber = _lazy_import('pdfplumber')
+    if pdfplumber is None:
+        return None
+    try:
+        source = io.BytesIO(data) if data is not None else doc_path
+        with pdfplumber.open(source) as pdf:
+            return _join_page_text(
+                (page.extract_text() for page in pdf.pages), max_chars
+            )
+    except Exception as e:
+        log.warning(f'pdfplumber failed on {doc_path}: {e}')
+        return None
+
+
+def _extract_pypdf2(
+    doc_path: str, data: Optional[bytes], max_chars: Optional[int] = None
+) -> Optional[str]:
+    '''PyPDF2 — pure Python last resort.'''
+    PyPDF2 = _lazy_import('PyPDF2')
+    if PyPDF2 is None:
+        return None
+    try:
+        # Open the file ourselves so the stream is closed on exit
+        with (io.BytesIO(data) if data is not None
+              else open(doc_path, 'rb')) as fh:
+            reader = PyPDF2.PdfReader(fh)
+            return _join_page_text(
+                (page.extract_text() for page in reader.pages), max_chars
+            )
+    except Exception as e:
+        log.warning(f'PyPDF2 failed on {doc_path}: {e}')
+        return None
+
+
+def _extract_docx(
+    doc_path: str, data: Optional[bytes], max_chars: Optional[int] = None
+) -> Optional[str]:
+    '''python-docx — paragraph and table-cell text from the body XML.'''
+    docx = _lazy_import('docx')
+    if docx is None:
+        log.error('python-docx not installed; cannot extract DOCX')
+        return None
+    try:
+        from docx.oxml.ns import qn
+        doc = docx.Document(io.BytesIO(data) if data is not None else doc_path)
+        # Walk the body XML directly rather than building Paragraph / Run
+        # wrapper objects; this also picks up table cell text.
+        w_p, w_t, w_tab, w_br = qn('w:p'), qn('w:t'), qn('w:tab'), qn('w:br')
+        parts: List[str] = []
+        size = 0
+        for el in doc.element.body.iter(w_p, w_t, w_tab, w_br):
+            if el.tag == w_t:
+                if el.text:
+                    parts.append(el.text)
+                    size += len(el.text)
+                    if max_chars is not None and size >= max_chars:
+                        return _truncate_text(''.join(parts), max_chars)
+            elif el.tag == w_p:
+                if parts:
+                    parts.append('\n')
+                    size += 1
+            elif el.tag == w_tab:
+                parts.append('\t')
+                size += 1
+            else:
+                parts.append('\n')
+                size += 1
+        return ''.join(parts)
+    except Exception as e:
+        log.error(f'DOCX extraction failed for {doc_path}: {e}')
+        return None
+
+
+# Default PDF backend order; JIRA_PDF_BACKEND_ORDER (comma-separated names
+# from _PDF_BACKENDS) overrides it at runtime.
+_PDF_EXTRACTORS = (
+    _extract_pdfium, _extract_pymupdf, _extract_pdfplumber, _extract_pypdf2,
+)
+_PDF_BACKENDS = {
+    'pypdfium2': _extract_pdfium,
+    'pymupdf': _extract_pymupdf,
+    'pdfplumber': _extract_pdfplumber,
+    'pypdf2': _extract_pypdf2,
+}
+
+
+def _pdf_extractors() -> tuple:
+    '''
+    Return the PDF extractors in the order to try them.
+
+    Backends named in JIRA_PDF_BACKEND_ORDER come first, in that order;
+    the remaining defaults follow so a missing library never leaves a PDF
+    without a fallback.  Unknown names are ignored.
+    '''
+    order = os.getenv('JIRA_PDF_BACKEND_ORDER', '')
+    if not order:
+        return _PDF_EXTRACTORS
+    preferred = []
+    for name in order.split(','):
+        fn = _PDF_BACKENDS.get(name.strip().lower())
+        if fn is not None and fn not in preferred:
+            preferred.append(fn)
+    return tuple(preferred) + tuple(
+        fn for fn in _PDF_EXTRACTORS if fn not in preferred
+    )
+
+
+def _extract_pdf(
+    doc_path: str, data: Optional[bytes], max_chars: Optional[int] = None
+) -> Optional[str]:
+    '''Try each PDF backend in order; first non-empty text wins.'''
+    for extract in _pdf_extractors():
+        text = extract(doc_path, data, max_chars)
+        if text and text.strip():
+            return text
+    log.error(f'No PDF library available to extract {doc_path}')
+    return None
+
+
+# Text extractor per lower-cased file extension.  Supporting another format
+# is one extractor function plus one entry here.
+_EXT_DISPATCH = {
+    '.pdf': _extract_pdf,
+    '.docx': _extract_docx,
+}
+
 
 class FeaturePlanningOrchestrator(BaseAgent):
     '''
@@ -34,13 +328,27 @@ class FeaturePlanningOrchestrator(BaseAgent):
     Jira project plan from a high-level feature request.
     '''
 
-    def __init__(self, output_dir: str = '', **kwargs):
+    def __init__(
+        self,
+        output_dir: str = '',
+        doc_cache_dir: str = '',
+        skip_llm_min_findings: int = 0,
+        **kwargs,
+    ):
         '''
         Initialize the Feature Planning Orchestrator.
 
         Input:
-            output_dir: Optional directory for intermediate/debug files.
-                        If empty, intermediate files are not saved.
+            output_dir:            Optional directory for intermediate/debug files.
+                                   If empty, intermediate files are not saved.
+            doc_cache_dir:         Optional directory for cached PDF/DOCX text.
+                                   Defaults to <output_dir>/cache/doc_text.
+            skip_llm_min_findings: If > 0, research and HW analysis run their
+                                   deterministic pass first and skip the LLM
+                                   pass when it already yields at least this
+                                   many findings (research: half of them
+                                   high-confidence; HW: no recorded gaps).
+                                   0 always runs both passes concurrently.
         '''
         # Load the system prompt from config/prompts/feature_planning_orchestrator.md.
         # No hardcoded fallback — the external file is the sole source.
@@ -75,6 +383,25 @@ class FeaturePlanningOrchestrator(BaseAgent):
         # and debug output (raw LLM responses).
         self._output_dir = output_dir
         self._created_files: List[str] = []
+        # Directories already created by _ensure_dir() — avoids a redundant
+        # makedirs (stat + mkdir) round trip on every intermediate/debug save.
+        self._dirs_created: set = set()
+        # Intermediate/debug files are written on _WRITE_EXECUTOR so disk
+        # I/O overlaps the next phase's LLM call.  flush_writes() waits for
+        # this orchestrator's writes; run() always flushes before returning.
+        self._pending_writes: List[Future] = []
+
+        # Extracted PDF/DOCX text is cached on disk keyed by the SHA-256 of
+        # the document bytes.  (path, size, mtime_ns) → digest avoids
+        # re-hashing unchanged files within a session.
+        self._doc_cache_dir = doc_cache_dir
+        self._doc_digests: Dict[tuple, str] = {}
+
+        self._skip_llm_min_findings = skip_llm_min_findings
+
+        # When enabled (input_data['reuse_cache']), phases 1–3 reuse a merged
+        # result saved by an earlier run whose inputs hash identically.
+        self._reuse_cache = False
 
     # ------------------------------------------------------------------
     # Lazy sub-agent initialization
@@ -161,6 +488,12 @@ class FeaturePlanningOrchestrator(BaseAgent):
     # Intermediate / debug file helpers
     # ------------------------------------------------------------------
 
+    def _ensure_dir(self, path: str) -> None:
+        '''Create *path* (and parents) once per orchestrator instance.'''
+        if path not in self._dirs_created:
+            os.makedirs(path, exist_ok=True)
+            self._dirs_created.add(path)
+
     def _save_intermediate(self, filename: str, data: Any) -> Optional[str]:
         '''
         Save an intermediate data structure (dict/list) to the output directory.
@@ -170,19 +503,20 @@ class FeaturePlanningOrchestrator(BaseAgent):
         if not self._output_dir:
             return None
 
-        os.makedirs(self._output_dir, exist_ok=True)
+        self._ensure_dir(self._output_dir)
         filepath = os.path.join(self._output_dir, filename)
 
+        # Serialize here so the file reflects the data as of this call even
+        # if a later phase mutates it; only the disk write is deferred.
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
-            log.info(f'Saved intermediate file: {filepath}')
-            self._created_files.append(filepath)
-            return filepath
+            payload = _dumps_indented(data, default=_json_default)
         except Exception as e:
             log.warning(f'Failed to save intermediate file {filepath}: {e}')
             return None
 
+        self._submit_write(filepath, payload, 'intermediate file')
+        return filepath
+
     def _save_debug_output(self, filename: str, text: str) -> Optional[str]:
         '''
         Save raw LLM output to the debug/ subdirectory for troubleshooting.
@@ -193,18 +527,46 @@ class FeaturePlanningOrchestrator(BaseAgent):
             return None
 
         debug_dir = os.path.join(self._output_dir, 'debug')
-        os.makedirs(debug_dir, exist_ok=True)
+        self._ensure_dir(debug_dir)
         filepath = os.path.join(debug_dir, filename)
 
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(text or '')
-            log.info(f'Saved debug output: {filepath}')
+        self._submit_write(filepath, text or '', 'debug output')
+        return filepath
+
+    def _submit_write(
+        self, filepath: str, payload, label: str, track: bool = True
+    ) -> None:
+        '''
+        Queue *payload* (str or bytes) to be written to *filepath* on the
+        background writer thread.  *track* lists the file in _created_files.
+        '''
+        if track:
             self._created_files.append(filepath)
-            return filepath
+        self._pending_writes.append(
+            _WRITE_EXECUTOR.submit(self._write_file, filepath, payload, label)
+        )
+
+    @staticmethod
+    def _write_file(filepath: str, payload, label: str) -> bool:
+        '''Write str/bytes to disk, logging (not raising) on failure.'''
+        try:
+            if isinstance(payload, bytes):
+                with open(filepath, 'wb') as f:
+                    f.write(payload)
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+            log.info(f'Saved {label}: {filepath}')
+            return True
         except Exception as e:
-            log.warning(f'Failed to save debug output {filepath}: {e}')
-            return None
+            log.warning(f'Failed to save {label} {filepath}: {e}')
+            return False
+
+    def flush_writes(self) -> None:
+        '''Block until every queued background file write has finished.'''
+        pending, self._pending_writes = self._pending_writes, []
+        if pending:
+            wait(pending)
 
     # ------------------------------------------------------------------
     # Merge helpers — combine deterministic baseline + LLM enrichment
@@ -251,10 +613,12 @@ class FeaturePlanningOrchestrator(BaseAgent):
             merged[key] = baseline_items
 
         # Merge open questions
-        baseline_qs = set(q.lower() for q in merged.get('open_questions', []))
-        for q in llm_report.get('open_questions', []):
-            if q.lower() not in baseline_qs:
-                merged.setdefault('open_questions', []).append(q)
+        open_questions = merged.setdefault('open_questions', [])
+        baseline_qs = {q.casefold() for q in open_questions}
+        open_questions.extend(
+            q for q in llm_report.get('open_questions', [])
+            if q.casefold() not in baseline_qs
+        )
 
         return merged
 
@@ -291,10 +655,12 @@ class FeaturePlanningOrchestrator(BaseAgent):
             merged[key] = baseline_items
 
         # Gaps: merge with dedup
-        baseline_gaps = set(g.lower() for g in merged.get('gaps', []))
-        for gap in llm_profile.get('gaps', []):
-            if gap.lower() not in baseline_gaps:
-                merged.setdefault('gaps', []).append(gap)
+        gaps = merged.setdefault('gaps', [])
+        baseline_gaps = {g.casefold() for g in gaps}
+        gaps.extend(
+            gap for gap in llm_profile.get('gaps', [])
+            if gap.casefold() not in baseline_gaps
+        )
 
         return merged
 
@@ -317,21 +683,17 @@ class FeaturePlanningOrchestrator(BaseAgent):
         if not merged.get('summary') and baseline.get('summary'):
             merged['summary'] = baseline['summary']
 
-        # Assumptions: merge
-        baseline_assumptions = set(
-            a.lower() for a in baseline.get('assumptions', [])
-        )
-        for a in merged.get('assumptions', []):
-            baseline_assumptions.discard(a.lower())
-        # Add remaining baseline assumptions
+        # Assumptions: merge — add baseline assumptions the LLM didn't state
+        assumptions = merged.setdefault('assumptions', [])
+        seen_assumptions = {a.casefold() for a in assumptions}
         for a in baseline.get('assumptions', []):
-            if a.lower() in baseline_assumptions:
-                merged.setdefault('assumptions', []).append(a)
-                baseline_assumptions.discard(a.lower())
+            a_key = a.casefold()
+            if a_key not in seen_assumptions:
+                assumptions.append(a)
+                seen_assumptions.add(a_key)
 
         # Item lists: add baseline items whose titles don't appear in LLM scope
-        for key in ('firmware_items', 'driver_items', 'tool_items',
-                     'test_items', 'integration_items', 'documentation_items'):
+        for key in SCOPE_ITEM_KEYS:
             llm_items = merged.get(key, [])
             llm_titles = set(
                 (item.get('title', '') or '').lower() for item in llm_items
@@ -343,17 +705,18 @@ class FeaturePlanningOrchestrator(BaseAgent):
                     llm_titles.add(title)
             merged[key] = llm_items
 
-        # Open questions: merge
-        llm_qs = set()
-        for q in merged.get('open_questions', []):
-            if isinstance(q, dict):
-                llm_qs.add((q.get('question', '') or '').lower())
-            elif isinstance(q, str):
-                llm_qs.add(q.lower())
-        for q in baseline.get('open_questions', []):
-            q_text = q.get('question', '').lower() if isinstance(q, dict) else str(q).lower()
-            if q_text and q_text not in llm_qs:
-                merged.setdefault('open_questions', []).append(q)
+        # Open questions: merge.  Questions may be dicts ({question: ...}) or
+        # plain strings; each key is computed exactly once.
+        def _q_key(q: Any) -> str:
+            text = q.get('question') if isinstance(q, dict) else str(q)
+            return (text or '').casefold()
+
+        open_questions = merged.setdefault('open_questions', [])
+        llm_qs = {_q_key(q) for q in open_questions}
+        open_questions.extend(
+            q for q in baseline.get('open_questions', [])
+            if (q_key := _q_key(q)) and q_key not in llm_qs
+        )
 
         return merged
 
@@ -406,6 +769,9 @@ class FeaturePlanningOrchestrator(BaseAgent):
         # --force skips interactive duplicate-ticket confirmation prompts.
         self._force = input_data.get('force', False)
 
+        # --reuse-cache skips phases whose inputs match a cached earlier run.
+        self._reuse_cache = bool(input_data.get('reuse_cache', False))
+
         # --feature-tag overrides the auto-generated [Tag] prefix for Epics.
         # If set, this value is used instead of the computed tag.
         feature_tag = input_data.get('feature_tag', None)
@@ -464,6 +830,9 @@ class FeaturePlanningOrchestrator(BaseAgent):
                 str(e),
                 metadata={'state': self.state.to_dict()},
             )
+        finally:
+            # Callers look for the intermediate files as soon as run() returns
+            self.flush_writes()
 
     # ------------------------------------------------------------------
     # Workflow modes
@@ -699,8 +1068,12 @@ class FeaturePlanningOrchestrator(BaseAgent):
           • A Markdown / plain-text file that the LLM will parse into scope items
           • A PDF or DOCX that will be extracted to text first
 
+        Several documents may be given as a comma-separated list; they are
+        parsed concurrently and merged into a single scope.
+
         Input:
-            scope_doc: Path to the scope document.
+            scope_doc: Path to the scope document, or comma-separated paths
+                       to merge (used only when every piece is an existing file).
             execute:   Whether to create Jira tickets after plan generation.
 
         Output:
@@ -719,22 +1092,31 @@ class FeaturePlanningOrchestrator(BaseAgent):
         log.info('=' * 60)
         self._progress(f'Phase 0: Parsing scope document: {scope_doc}')
 
-        scope_result = self._parse_scope_document(scope_doc)
+        # A comma-separated value is a list only when every piece is an
+        # existing file, so a single path that contains a comma still works
+        scope_paths = [p.strip() for p in scope_doc.split(',') if p.strip()]
+        if len(scope_paths) > 1 and all(os.path.isfile(p) for p in scope_paths):
+            scope_result = self._parse_scope_documents(scope_paths)
+        else:
+            scope_result = self._parse_scope_document(scope_doc.strip())
         if scope_result is None:
             return AgentResponse.error_response(
                 f'Failed to parse scope document: {scope_doc}'
             )
 
-        self.state.feature_scope = scope_result
+        self.state.feature_scope = MappingProxyType(scope_result)
         self.state.mark_phase_complete('research')
         self.state.mark_phase_complete('hw_analysis')
         self.state.mark_phase_complete('scoping')
 
+        item_count = sum(
+            self._summarize_counts(scope_result, SCOPE_ITEM_KEYS).values()
+        )
         results.append(
             f'PHASE 0: Scope Document Parsed\n'
             f'  Source: {scope_doc}\n'
             f'  Feature: {scope_result.get("feature_name", "?")}\n'
-            f'  Items: {sum(len(scope_result.get(k, [])) for k in ("firmware_items", "driver_items", "tool_items", "test_items", "integration_items", "documentation_items"))}'
+            f'  Items: {item_count}'
         )
 
         # ---- Phase 4: Plan Generation ----
@@ -773,6 +1155,14 @@ class FeaturePlanningOrchestrator(BaseAgent):
     # Scope document parser
     # ------------------------------------------------------------------
 
+    # Scope document parsers keyed by lower-cased file extension.  Anything
+    # not listed here is treated as Markdown / plain text.
+    _SCOPE_PARSERS = {
+        '.json': '_parse_scope_json',
+        '.pdf': '_parse_scope_pdf_or_docx',
+        '.docx': '_parse_scope_pdf_or_docx',
+    }
+
     def _parse_scope_document(self, doc_path: str) -> Optional[Dict[str, Any]]:
         '''
         Parse a scope document into a FeatureScope-compatible dict.
@@ -788,28 +1178,76 @@ class FeaturePlanningOrchestrator(BaseAgent):
         Output:
             A dict matching FeatureScope.to_dict() structure, or None on failure.
         '''
-        if not os.path.exists(doc_path):
+        # Read the document once; the format handlers work on these bytes
+        # instead of re-opening the file.
+        try:
+            with open(doc_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
             log.error(f'Scope document not found: {doc_path}')
             return None
+        except OSError as e:
+            log.error(f'Failed to read scope document {doc_path}: {e}')
+            return None
 
         ext = os.path.splitext(doc_path)[1].lower()
+        if ext not in self._SCOPE_PARSERS:
+            ext = _sniff_extension(raw)
+        handler = getattr(
+            self, self._SCOPE_PARSERS.get(ext, '_parse_scope_markdown')
+        )
+        return handler(doc_path, raw)
 
-        # ---- JSON: direct load ----
-        if ext == '.json':
-            return self._parse_scope_json(doc_path)
+    def _parse_scope_documents(self, doc_paths: List[str]) -> Optional[Dict[str, Any]]:
+        '''
+        Parse several scope documents concurrently and merge them.
 
-        # ---- PDF / DOCX: extract text first ----
-        if ext in ('.pdf', '.docx'):
-            text = self._extract_document_text(doc_path)
-            if not text:
-                log.error(f'Failed to extract text from {doc_path}')
-                return None
-            return self._parse_scope_text(text, source=doc_path)
+        Text extraction and LLM parsing are I/O bound, so each document is
+        parsed on its own worker thread.  The first document is the primary
+        source (its feature name and summary win); items from later
+        documents are added when their titles are not already present.
 
-        # ---- Markdown / plain text ----
+        Input:
+            doc_paths: Paths to the scope documents.
+
+        Output:
+            A merged FeatureScope-compatible dict, or None if any document
+            failed to parse.
+        '''
+        with ThreadPoolExecutor(max_workers=min(len(doc_paths), 8)) as pool:
+            results = list(pool.map(self._parse_scope_document, doc_paths))
+
+        failed = [p for p, r in zip(doc_paths, results) if r is None]
+        if failed:
+            log.error(f'Failed to parse scope document(s): {", ".join(failed)}')
+            return None
+
+        merged = results[0]
+        for result in results[1:]:
+            merged = self._merge_scope(result, merged)
+        return merged
+
+    def _parse_scope_pdf_or_docx(
+        self, doc_path: str, raw: Optional[bytes] = None
+    ) -> Optional[Dict[str, Any]]:
+        '''Extract text from a PDF / DOCX scope document, then parse it via the LLM.'''
+        # Extract the whole document: _parse_scope_text() fits it to the
+        # prompt budget itself, keeping the tail and a heading outline.
+        text = self._cached_extract(doc_path, data=raw, max_chars=None)
+        if not text:
+            log.error(f'Failed to extract text from {doc_path}')
+            return None
+        return self._parse_scope_text(text, source=doc_path)
+
+    def _parse_scope_markdown(
+        self, doc_path: str, raw: Optional[bytes] = None
+    ) -> Optional[Dict[str, Any]]:
+        '''Read a Markdown / plain-text scope document and parse it via the LLM.'''
         try:
-            with open(doc_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            if raw is None:
+                with open(doc_path, 'rb') as f:
+                    raw = f.read()
+            text = raw.decode('utf-8')
         except Exception as e:
             log.error(f'Failed to read scope document {doc_path}: {e}')
             return None
@@ -820,20 +1258,25 @@ class FeaturePlanningOrchestrator(BaseAgent):
 
         return self._parse_scope_text(text, source=doc_path)
 
-    def _parse_scope_json(self, json_path: str) -> Optional[Dict[str, Any]]:
+    def _parse_scope_json(
+        self, json_path: str, raw: Optional[bytes] = None
+    ) -> Optional[Dict[str, Any]]:
         '''
         Load a JSON scope document.  Validates that it has at least one
         category list (firmware_items, driver_items, etc.).
 
         Input:
             json_path: Path to the JSON file.
+            raw:       File contents, if already read by the caller.
 
         Output:
             FeatureScope-compatible dict, or None on failure.
         '''
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if raw is None:
+                with open(json_path, 'rb') as f:
+                    raw = f.read()
+            data = json_utils.loads(raw)
         except Exception as e:
             log.error(f'Failed to parse JSON scope document {json_path}: {e}')
             return None
@@ -843,10 +1286,7 @@ class FeaturePlanningOrchestrator(BaseAgent):
             return None
 
         # Minimal validation: at least one item list should be present
-        item_keys = [
-            'firmware_items', 'driver_items', 'tool_items',
-            'test_items', 'integration_items', 'documentation_items',
-        ]
+        item_keys = SCOPE_ITEM_KEYS
         has_items = any(data.get(k) for k in item_keys)
 
         if not has_items:
@@ -871,7 +1311,7 @@ class FeaturePlanningOrchestrator(BaseAgent):
 
         log.info(
             f'Loaded JSON scope: {data.get("feature_name", "?")} — '
-            f'{sum(len(data.get(k, [])) for k in item_keys)} items'
+            f'{sum(self._summarize_counts(data, item_keys).values())} items'
         )
         return data
 
@@ -934,9 +1374,8 @@ class FeaturePlanningOrchestrator(BaseAgent):
         Output:
             FeatureScope-compatible dict, or None on failure.
         '''
-        import re
-
         log.info(f'Parsing scope text via LLM ({len(text)} chars from {source})')
+        text = self._fit_scope_text_to_budget(text, source=source)
 
         # Load the scope document parser prompt from external file
         parse_prompt = self._load_scope_parser_prompt()
@@ -971,10 +1410,7 @@ class FeaturePlanningOrchestrator(BaseAgent):
                 return None
 
             # Ensure all required keys
-            item_keys = [
-                'firmware_items', 'driver_items', 'tool_items',
-                'test_items', 'integration_items', 'documentation_items',
-            ]
+            item_keys = SCOPE_ITEM_KEYS
             data.setdefault('feature_name', '')
             data.setdefault('summary', '')
             for k in item_keys:
@@ -983,7 +1419,7 @@ class FeaturePlanningOrchestrator(BaseAgent):
             data.setdefault('assumptions', [])
             data.setdefault('confidence_report', {})
 
-            total = sum(len(data.get(k, [])) for k in item_keys)
+            total = sum(self._summarize_counts(data, item_keys).values())
             log.info(f'LLM parsed scope: {data.get("feature_name", "?")} — {total} items')
             return data
 
@@ -995,84 +1431,193 @@ class FeaturePlanningOrchestrator(BaseAgent):
             return None
 
     @staticmethod
-    def _extract_document_text(doc_path: str) -> Optional[str]:
+    def _fit_scope_text_to_budget(
+        text: str, source: str = '', max_tokens: int = SCOPE_TEXT_MAX_TOKENS
+    ) -> str:
         '''
-        Extract plain text from a PDF or DOCX file.
+        Trim scope text that would exceed the LLM token budget.
 
-        Uses the same library fallback chain as knowledge_tools:
-        PDF:  PyMuPDF → pdfplumber → PyPDF2
-        DOCX: python-docx
+        Keeps the first and last portions of the document and replaces the
+        middle with an outline of its Markdown headings, so the LLM still
+        sees the overall structure.  Text within budget is returned as-is.
 
         Input:
-            doc_path: Path to the document.
+            text:       The raw scope document text.
+            source:     Original file path (for logging).
+            max_tokens: Estimated token budget for the document text.
+
+        Output:
+            The text, trimmed to roughly max_tokens tokens if needed.
+        '''
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+
+        # Keep the first half and last quarter of the budget verbatim; the
+        # heading outline of the omitted middle is capped at 10%.
+        head_chars = max_chars // 2
+        tail_chars = max_chars // 4
+        middle = text[head_chars:len(text) - tail_chars]
+        outline = '\n'.join(_HEADING_RE.findall(middle))[:max_chars // 10]
+
+        omitted = len(middle)
+        log.warning(
+            f'Scope text from {source or "document"} is ~{len(text) // _CHARS_PER_TOKEN} '
+            f'tokens (budget {max_tokens}); omitting {omitted} chars from the middle'
+        )
+        return (
+            f'{text[:head_chars]}\n\n'
+            f'[... {omitted} characters omitted to fit the token budget. '
+            f'Outline of the omitted section: ...]\n'
+            f'{outline}\n'
+            f'[... end of outline ...]\n\n'
+            f'{text[len(text) - tail_chars:]}'
+        )
+
+    def _document_digest(self, doc_path: str, data: Optional[bytes] = None) -> str:
+        '''
+        Return the SHA-256 hex digest of a document's bytes.
+
+        Digests are remembered per (path, size, mtime_ns) so a file that has
+        not changed is hashed at most once per orchestrator instance.
+        '''
+        try:
+            st = os.stat(doc_path)
+            stat_key = (os.path.abspath(doc_path), st.st_size, st.st_mtime_ns)
+        except OSError:
+            stat_key = None
+
+        if stat_key in self._doc_digests:
+            return self._doc_digests[stat_key]
+
+        hasher = hashlib.sha256()
+        if data is not None:
+            hasher.update(data)
+        else:
+            with open(doc_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(chunk)
+        digest = hasher.hexdigest()
+
+        if stat_key is not None:
+            self._doc_digests[stat_key] = digest
+        return digest
+
+    def _cached_extract(
+        self,
+        doc_path: str,
+        data: Optional[bytes] = None,
+        max_chars: Optional[int] = DOC_TEXT_MAX_CHARS,
+    ) -> Optional[str]:
+        '''
+        Extract text from a PDF or DOCX, reusing earlier extractions.
+
+        Extracted text is stored as <cache_dir>/<sha256>.txt (or
+        <sha256>-<max_chars>.txt when capped), so identical documents are
+        parsed once across reruns and resumes.  Without a cache directory
+        this is a plain _extract_document_text() call.
+
+        Input:
+            doc_path:  Path to the document.
+            data:      Document bytes, if already read by the caller.
+            max_chars: Text budget (see _extract_document_text); None for all.
 
         Output:
             Extracted text, or None on failure.
         '''
-        ext = os.path.splitext(doc_path)[1].lower()
+        cache_dir = self._doc_cache_dir or (
+            os.path.join(self._output_dir, 'cache', 'doc_text')
+            if self._output_dir else ''
+        )
+        if not cache_dir:
+            return self._extract_document_text(doc_path, data=data, max_chars=max_chars)
 
-        if ext == '.pdf':
-            # Try PyMuPDF first
-            try:
-                import fitz  # PyMuPDF
-                doc = fitz.open(doc_path)
-                text = '\n'.join(page.get_text() for page in doc)
-                doc.close()
-                if text.strip():
-                    return text
-            except ImportError:
-                pass
-            except Exception as e:
-                log.warning(f'PyMuPDF failed on {doc_path}: {e}')
+        try:
+            digest = self._document_digest(doc_path, data)
+        except OSError as e:
+            log.warning(f'Could not fingerprint {doc_path}; skipping text cache: {e}')
+            return self._extract_document_text(doc_path, data=data, max_chars=max_chars)
 
-            # Try pdfplumber
+        cache_name = digest if max_chars is None else f'{digest}-{max_chars}'
+        cache_path = os.path.join(cache_dir, f'{cache_name}.txt')
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            log.info(f'Using cached text for {doc_path} ({cache_path})')
+            return text
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.warning(f'Failed to read cached text {cache_path}: {e}')
+
+        text = self._extract_document_text(doc_path, data=data, max_chars=max_chars)
+        if text:
+            # Write to a temp file and rename so readers never see a partial file
+            tmp_path = f'{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
             try:
-                import pdfplumber
-                with pdfplumber.open(doc_path) as pdf:
-                    text = '\n'.join(
-                        page.extract_text() or '' for page in pdf.pages
-                    )
-                if text.strip():
-                    return text
-            except ImportError:
-                pass
-            except Exception as e:
-                log.warning(f'pdfplumber failed on {doc_path}: {e}')
+                self._ensure_dir(cache_dir)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                log.warning(f'Failed to cache extracted text for {doc_path}: {e}')
+        return text
+
+    def _extract_documents(self, doc_paths: List[str]) -> Dict[str, Optional[str]]:
+        '''
+        Extract text from several PDF/DOCX documents concurrently.
 
-            # Try PyPDF2
-            try:
-                from PyPDF2 import PdfReader
-                reader = PdfReader(doc_path)
-                text = '\n'.join(
-                    page.extract_text() or '' for page in reader.pages
-                )
-                if text.strip():
-                    return text
-            except ImportError:
-                pass
-            except Exception as e:
-                log.warning(f'PyPDF2 failed on {doc_path}: {e}')
+        The native PDF backends release the GIL while parsing, so a small
+        thread pool gives a near-linear speedup across documents.  Results
+        also land in the text cache (see _cached_extract).
 
-            log.error(f'No PDF library available to extract {doc_path}')
-            return None
+        Input:
+            doc_paths: Paths to PDF / DOCX documents.
 
-        elif ext == '.docx':
-            try:
-                from docx import Document
-                doc = Document(doc_path)
-                text = '\n'.join(p.text for p in doc.paragraphs)
-                if text.strip():
-                    return text
-            except ImportError:
-                log.error('python-docx not installed; cannot extract DOCX')
-            except Exception as e:
-                log.error(f'DOCX extraction failed for {doc_path}: {e}')
-            return None
+        Output:
+            Dict mapping each path to its extracted text (None on failure).
+        '''
+        if not doc_paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(doc_paths))) as pool:
+            texts = list(pool.map(self._cached_extract, doc_paths))
+        return dict(zip(doc_paths, texts))
 
-        else:
+    @staticmethod
+    def _extract_document_text(
+        doc_path: str,
+        data: Optional[bytes] = None,
+        max_chars: Optional[int] = DOC_TEXT_MAX_CHARS,
+    ) -> Optional[str]:
+        '''
+        Extract plain text from a PDF or DOCX file.
+
+        Library fallback chain (first non-empty result wins):
+        PDF:  pypdfium2 → PyMuPDF → pdfplumber → PyPDF2
+              (reorder with JIRA_PDF_BACKEND_ORDER, e.g. "pdfplumber,pymupdf")
+        DOCX: python-docx
+
+        Input:
+            doc_path: Path to the document.
+            data:      Document bytes, if already read by the caller.  The
+                       libraries then parse from memory instead of the path.
+            max_chars: Stop extracting once the text reaches this length and
+                       mark it truncated; None for the whole document.
+
+        Output:
+            Extracted text, or None on failure.
+        '''
+        ext = os.path.splitext(doc_path)[1].lower()
+        handler = _EXT_DISPATCH.get(ext)
+        if handler is None and data is not None:
+            handler = _EXT_DISPATCH.get(_sniff_extension(data))
+        if handler is None:
             log.error(f'Unsupported document type for extraction: {ext}')
             return None
 
+        text = handler(doc_path, data, max_chars)
+        return text if text and text.strip() else None
+
     # ------------------------------------------------------------------
     # User-facing progress output
     # ------------------------------------------------------------------
@@ -1178,15 +1723,198 @@ class FeaturePlanningOrchestrator(BaseAgent):
             },
         )
 
+    # ------------------------------------------------------------------
+    # Phase result cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _phase_inputs_hash(phase: str, inputs: Dict[str, Any]) -> str:
+        '''Fingerprint a phase's inputs (BLAKE2b-128 over canonical JSON).'''
+        blob = json.dumps(
+            {'phase': phase, 'inputs': inputs}, sort_keys=True, default=_json_default
+        ).encode('utf-8')
+        return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+    def _doc_fingerprints(self) -> List[str]:
+        '''Content digests of the user's doc_paths (path if unreadable).'''
+        fingerprints = []
+        for doc_path in self.state.doc_paths or []:
+            try:
+                fingerprints.append(self._document_digest(doc_path))
+            except OSError:
+                fingerprints.append(doc_path)
+        return fingerprints
+
+    def _phase_cache_path(self, phase: str, inputs: Dict[str, Any]) -> str:
+        '''Cache file for (phase, inputs), or '' when caching is off.'''
+        if not (self._reuse_cache and self._output_dir):
+            return ''
+        digest = self._phase_inputs_hash(phase, inputs)
+        return os.path.join(
+            self._output_dir, 'cache', 'phase', f'{phase}-{digest}.json'
+        )
+
+    def _load_phase_cache(
+        self, phase: str, inputs: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        '''
+        Return the cached {'result': ..., 'summary': ...} for a phase whose
+        inputs are unchanged since an earlier run, or None on a miss.
+        '''
+        cache_path = self._phase_cache_path(phase, inputs)
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                raw = f.read()
+            cached = json_utils.loads(raw)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning(f'Ignoring unreadable phase cache {cache_path}: {e}')
+            return None
+        if not isinstance(cached, dict) or 'result' not in cached:
+            return None
+        log.info(f'Reusing cached {phase} result: {cache_path}')
+        return cached
+
+    def _store_phase_cache(
+        self, phase: str, inputs: Dict[str, Any],
+        result: Dict[str, Any], summary: str,
+    ) -> None:
+        '''Queue a phase's merged result and summary for the phase cache.'''
+        cache_path = self._phase_cache_path(phase, inputs)
+        if not cache_path:
+            return
+        entry = {'result': result, 'summary': summary}
+        try:
+            payload = json_utils.dumps(entry, default=_json_default)
+        except Exception as e:
+            log.warning(f'Failed to cache {phase} result: {e}')
+            return
+        self._ensure_dir(os.path.dirname(cache_path))
+        self._submit_write(cache_path, payload, 'phase cache', track=False)
+
     # ------------------------------------------------------------------
     # Individual phases
     # ------------------------------------------------------------------
 
+    # Phase summary templates, filled with str.format_map() from one
+    # precomputed context dict per phase.
+    _RESEARCH_SUMMARY = (
+        'PHASE 1: Research — COMPLETE ({duration:.1f}s)\n'
+        '  Domain overview: {domain_overview} chars\n'
+        '  Standards/specs: {standards_and_specs}\n'
+        '  Implementations: {existing_implementations}\n'
+        '  Internal knowledge: {internal_knowledge}\n'
+        '  Total findings: {total_findings} '
+        '(baseline={baseline_count}, LLM={llm_count})\n'
+        '  Confidence: {high} high, {medium} medium, {low} low\n'
+        '  Open questions: {open_questions}'
+    )
+    _HW_SUMMARY = (
+        'PHASE 2: Hardware Analysis — COMPLETE ({duration:.1f}s)\n'
+        '  Product: {product_name}\n'
+        '  Components: {components}\n'
+        '  Bus interfaces: {bus_interfaces}\n'
+        '  Existing firmware: {existing_firmware}\n'
+        '  Existing drivers: {existing_drivers}\n'
+        '  Existing tools: {existing_tools}\n'
+        '  Knowledge gaps: {gaps}\n'
+        '  Sources: baseline={baseline_count}, LLM={llm_count}'
+    )
+    _SCOPING_SUMMARY = (
+        'PHASE 3: SW/FW Scoping — COMPLETE ({duration:.1f}s)\n'
+        '  Total items: {total_items}\n'
+        '  By category: {by_category}\n'
+        '  By confidence: {by_confidence}\n'
+        '  By complexity: {by_complexity}\n'
+        '  Open questions: {total_questions} ({blocking_questions} blocking)\n'
+        '  Sources: baseline={baseline_count}, LLM={llm_count}'
+    )
+    _SCOPING_SUMMARY_DEFAULTS = {
+        'total_items': 0, 'by_category': {}, 'by_confidence': {},
+        'by_complexity': {}, 'total_questions': 0, 'blocking_questions': 0,
+    }
+    _PLAN_SUMMARY = (
+        'PHASE 4: Jira Plan Generation — COMPLETE ({duration:.1f}s)\n'
+        '  Project: {project_key}\n'
+        '  Epics: {total_epics}\n'
+        '  Stories: {total_stories}\n'
+        '  Total tickets: {total_tickets}'
+    )
+    _PLAN_SUMMARY_DEFAULTS = {
+        'project_key': '?', 'total_epics': 0, 'total_stories': 0, 'total_tickets': 0,
+    }
+    _EXECUTION_SUMMARY = (
+        'PHASE 6: Jira Execution — COMPLETE\n'
+        '  Created: {created} tickets\n'
+        '  Skipped: {skipped} (duplicates)\n'
+        '  Links:   {links} "Relates" links'
+        ' ({epic_links} Epic↔Epic, {story_links} Story↔Story)\n'
+        '  Errors:  {errors}\n'
+    )
+
+    @staticmethod
+    def _summarize_counts(report: Dict[str, Any], keys) -> Dict[str, int]:
+        '''Return {key: len(report[key])} for each key, treating missing/None as 0.'''
+        return {k: len(report.get(k) or ()) for k in keys}
+
+    @staticmethod
+    def _run_two_pass(baseline_call, llm_call, skip_llm=None) -> tuple:
+        '''
+        Run a phase's deterministic Pass 1 and LLM Pass 2 concurrently.
+
+        The passes only read workflow state and are merged afterwards, so
+        the LLM latency overlaps the tool calls instead of adding to them.
+
+        With *skip_llm*, Pass 1 runs first instead and Pass 2 only runs if
+        skip_llm(pass1_result) is false — trading the overlap for not
+        spending an LLM call on a baseline that is already good enough.
+
+        Input:
+            baseline_call: Zero-argument callable for Pass 1.
+            llm_call:      Zero-argument callable for Pass 2.
+            skip_llm:      Optional predicate over the Pass 1 result.
+
+        Output:
+            (pass1_result, pass2_result).  pass2_result is None when Pass 2
+            was skipped.  Exceptions from either pass propagate.
+        '''
+        if skip_llm is not None:
+            baseline = baseline_call()
+            if skip_llm(baseline):
+                return baseline, None
+            return baseline, llm_call()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            baseline_future = pool.submit(baseline_call)
+            llm_future = pool.submit(llm_call)
+            return baseline_future.result(), llm_future.result()
+
+    def _pass_ordering(self) -> str:
+        '''Describe how research / HW analysis passes run, for progress output.'''
+        return 'in sequence' if self._skip_llm_min_findings > 0 else 'concurrently'
+
+    def _research_baseline_sufficient(self, report) -> bool:
+        '''True if a research baseline meets the skip_llm_min_findings bar.'''
+        findings = report.all_findings
+        high = sum(1 for f in findings if f.confidence == 'high')
+        return (
+            len(findings) >= self._skip_llm_min_findings
+            and high * 2 >= len(findings)
+        )
+
+    def _hw_baseline_sufficient(self, profile) -> bool:
+        '''True if a HW baseline meets the skip_llm_min_findings bar.'''
+        count = len(profile.components) + len(profile.existing_firmware)
+        return count >= self._skip_llm_min_findings and not profile.gaps
+
     def _phase_research(self) -> str:
         '''
         Phase 1: Research the feature domain.
 
-        Hybrid two-pass approach:
+        Hybrid two-pass approach (the passes run concurrently):
           Pass 1 — deterministic tool calls (guaranteed baseline)
           Pass 2 — LLM with tools (enrichment via JSON output)
           Merge  — LLM wins where it has content, baseline fills gaps
@@ -1195,71 +1923,107 @@ class FeaturePlanningOrchestrator(BaseAgent):
         start = time.time()
 
         try:
-            # Pass 1: Deterministic baseline (guaranteed non-empty)
-            self._progress('  → Pass 1: deterministic tool research...')
-            log.info('Phase 1 — Pass 1: deterministic research')
-            baseline_report = self.research_agent.research(
-                self.state.feature_request,
-                self.state.doc_paths or None,
+            # The skip bar decides whether the LLM pass ran, so it is part
+            # of what produced the cached result
+            cache_inputs = {
+                'feature_request': self.state.feature_request,
+                'docs': self._doc_fingerprints(),
+                'skip_llm_min_findings': self._skip_llm_min_findings,
+            } if self._reuse_cache else {}
+            cached = self._load_phase_cache('research', cache_inputs)
+            if cached is not None:
+                self.state.research_report = MappingProxyType(cached['result'])
+                self.state.mark_phase_complete('research')
+                self._save_intermediate('research.json', cached['result'])
+                return f'{cached["summary"]}\n  (reused cached result)'
+
+            # Extract PDF/DOCX user documents up front, in parallel, so the
+            # baseline research does not parse them one after another.
+            binary_docs = [
+                p for p in self.state.doc_paths or []
+                if os.path.splitext(p)[1].lower() in _EXT_DISPATCH
+            ]
+            doc_texts = {
+                path: text
+                for path, text in self._extract_documents(binary_docs).items()
+                if text
+            }
+
+            # Pass 1 (deterministic baseline, guaranteed non-empty) and
+            # Pass 2 (LLM enrichment) are independent — run them together
+            # unless Pass 2 may be skipped on a sufficient baseline.
+            self._progress('  → Pass 1 (deterministic tool research) and Pass 2 '
+                           f'(LLM enrichment) running {self._pass_ordering()} '
+                           '(this may take a few minutes)...')
+            log.info('Phase 1 — Pass 1 + Pass 2: deterministic research and LLM enrichment')
+            agent = self.research_agent
+            baseline_report, llm_response = self._run_two_pass(
+                lambda: agent.research(
+                    self.state.feature_request,
+                    self.state.doc_paths or None,
+                    doc_texts=doc_texts or None,
+                ),
+                lambda: agent.run({
+                    'feature_request': self.state.feature_request,
+                    'doc_paths': self.state.doc_paths,
+                }),
+                skip_llm=(self._research_baseline_sufficient
+                          if self._skip_llm_min_findings > 0 else None),
             )
             baseline_dict = baseline_report.to_dict()
             baseline_count = len(baseline_report.all_findings)
             log.info(f'Phase 1 — Pass 1 complete: {baseline_count} findings')
 
-            # Pass 2: LLM enrichment (may produce richer content)
-            self._progress(f'  → Pass 1 done ({baseline_count} findings). '
-                           f'Pass 2: LLM enrichment (this may take a few minutes)...')
-            log.info('Phase 1 — Pass 2: LLM enrichment')
-            llm_response = self.research_agent.run({
-                'feature_request': self.state.feature_request,
-                'doc_paths': self.state.doc_paths,
-            })
-
             llm_report = {}
-            if llm_response.success:
+            if llm_response is None:
+                log.info('Phase 1 — Pass 2 skipped: baseline is sufficient')
+            elif llm_response.success:
                 llm_report = llm_response.metadata.get('research_report', {})
                 # Save raw LLM output for debugging
                 self._save_debug_output(
                     'phase1_research_llm.md', llm_response.content
                 )
 
-            llm_count = (
-                len(llm_report.get('standards_and_specs', []))
-                + len(llm_report.get('existing_implementations', []))
-                + len(llm_report.get('internal_knowledge', []))
+            llm_count = sum(
+                self._summarize_counts(llm_report, _RESEARCH_FINDING_KEYS).values()
             )
             log.info(f'Phase 1 — Pass 2 complete: {llm_count} LLM findings')
 
             # Merge: LLM wins where it has content, baseline fills gaps
-            self._progress(f'  → Pass 2 done ({llm_count} LLM findings). Merging...')
-            merged = self._merge_research(baseline_dict, llm_report)
-            self.state.research_report = merged
+            if llm_response is None:
+                self._progress(f'  → Baseline sufficient ({baseline_count} '
+                               f'findings) — LLM enrichment skipped')
+                merged = baseline_dict
+            else:
+                self._progress(f'  → Passes done ({baseline_count} baseline, '
+                               f'{llm_count} LLM findings). Merging...')
+                merged = self._merge_research(baseline_dict, llm_report)
+            # Read-only view: both passes of later phases share it by reference
+            self.state.research_report = MappingProxyType(merged)
             self.state.mark_phase_complete('research')
 
             # Save intermediate file
             self._save_intermediate('research.json', merged)
 
-            duration = time.time() - start
-            report = merged
-            conf = report.get('confidence_summary', {})
-
-            specs = len(report.get('standards_and_specs', []))
-            impls = len(report.get('existing_implementations', []))
-            internal = len(report.get('internal_knowledge', []))
-
-            return (
-                f'PHASE 1: Research — COMPLETE ({duration:.1f}s)\n'
-                f'  Domain overview: {len(report.get("domain_overview", ""))} chars\n'
-                f'  Standards/specs: {specs}\n'
-                f'  Implementations: {impls}\n'
-                f'  Internal knowledge: {internal}\n'
-                f'  Total findings: {specs + impls + internal} '
-                f'(baseline={baseline_count}, LLM={llm_count})\n'
-                f'  Confidence: {conf.get("high", 0)} high, '
-                f'{conf.get("medium", 0)} medium, '
-                f'{conf.get("low", 0)} low\n'
-                f'  Open questions: {len(report.get("open_questions", []))}'
+            conf = merged.get('confidence_summary') or {}
+            ctx = self._summarize_counts(
+                merged,
+                _RESEARCH_FINDING_KEYS + ('domain_overview', 'open_questions'),
             )
+            ctx.update(
+                duration=time.time() - start,
+                total_findings=sum(ctx[k] for k in _RESEARCH_FINDING_KEYS),
+                baseline_count=baseline_count,
+                llm_count=llm_count,
+                high=conf.get('high', 0),
+                medium=conf.get('medium', 0),
+                low=conf.get('low', 0),
+            )
+            summary = self._RESEARCH_SUMMARY.format_map(ctx)
+            # A run whose LLM pass failed is not worth replaying
+            if llm_response is None or llm_response.success:
+                self._store_phase_cache('research', cache_inputs, merged, summary)
+            return summary
 
         except Exception as e:
             self.state.errors.append(f'Research exception: {e}')
@@ -1270,7 +2034,7 @@ class FeaturePlanningOrchestrator(BaseAgent):
         '''
         Phase 2: Analyze the hardware product.
 
-        Hybrid two-pass approach:
+        Hybrid two-pass approach (the passes run concurrently):
           Pass 1 — deterministic tool calls (guaranteed baseline)
           Pass 2 — LLM with tools (enrichment via JSON output)
           Merge  — LLM wins where it has content, baseline fills gaps
@@ -1279,13 +2043,39 @@ class FeaturePlanningOrchestrator(BaseAgent):
         start = time.time()
 
         try:
-            # Pass 1: Deterministic baseline
-            self._progress('  → Pass 1: deterministic HW analysis...')
-            log.info('Phase 2 — Pass 1: deterministic HW analysis')
-            baseline_profile = self.hw_analyst.analyze(
-                self.state.feature_request,
-                self.state.project_key,
-                self.state.research_report or None,
+            cache_inputs = {
+                'feature_request': self.state.feature_request,
+                'project_key': self.state.project_key,
+                'research_report': self.state.research_report,
+                'skip_llm_min_findings': self._skip_llm_min_findings,
+            } if self._reuse_cache else {}
+            cached = self._load_phase_cache('hw_analysis', cache_inputs)
+            if cached is not None:
+                self.state.hw_profile = MappingProxyType(cached['result'])
+                self.state.mark_phase_complete('hw_analysis')
+                self._save_intermediate('hw_profile.json', cached['result'])
+                return f'{cached["summary"]}\n  (reused cached result)'
+
+            # Pass 1 (deterministic baseline) and Pass 2 (LLM enrichment)
+            # run concurrently unless Pass 2 may be skipped
+            self._progress('  → Pass 1 (deterministic HW analysis) and Pass 2 '
+                           f'(LLM enrichment) running {self._pass_ordering()} '
+                           '(this may take a few minutes)...')
+            log.info('Phase 2 — Pass 1 + Pass 2: deterministic HW analysis and LLM enrichment')
+            agent = self.hw_analyst
+            baseline_profile, llm_response = self._run_two_pass(
+                lambda: agent.analyze(
+                    self.state.feature_request,
+                    self.state.project_key,
+                    self.state.research_report or None,
+                ),
+                lambda: agent.run({
+                    'feature_request': self.state.feature_request,
+                    'project_key': self.state.project_key,
+                    'research_report': self.state.research_report or {},
+                }),
+                skip_llm=(self._hw_baseline_sufficient
+                          if self._skip_llm_min_findings > 0 else None),
             )
             baseline_dict = baseline_profile.to_dict()
             baseline_count = (
@@ -1294,52 +2084,46 @@ class FeaturePlanningOrchestrator(BaseAgent):
             )
             log.info(f'Phase 2 — Pass 1 complete: {baseline_count} items')
 
-            # Pass 2: LLM enrichment
-            self._progress(f'  → Pass 1 done ({baseline_count} items). '
-                           f'Pass 2: LLM enrichment (this may take a few minutes)...')
-            log.info('Phase 2 — Pass 2: LLM enrichment')
-            llm_response = self.hw_analyst.run({
-                'feature_request': self.state.feature_request,
-                'project_key': self.state.project_key,
-                'research_report': self.state.research_report or {},
-            })
-
             llm_profile = {}
-            if llm_response.success:
+            if llm_response is None:
+                log.info('Phase 2 — Pass 2 skipped: baseline is sufficient')
+            elif llm_response.success:
                 llm_profile = llm_response.metadata.get('hw_profile', {})
                 self._save_debug_output(
                     'phase2_hw_analysis_llm.md', llm_response.content
                 )
 
-            llm_count = (
-                len(llm_profile.get('components', []))
-                + len(llm_profile.get('existing_firmware', []))
-            )
+            llm_count = sum(self._summarize_counts(
+                llm_profile, ('components', 'existing_firmware')
+            ).values())
             log.info(f'Phase 2 — Pass 2 complete: {llm_count} LLM items')
 
             # Merge
-            self._progress(f'  → Pass 2 done ({llm_count} LLM items). Merging...')
-            merged = self._merge_hw_profile(baseline_dict, llm_profile)
-            self.state.hw_profile = merged
+            if llm_response is None:
+                self._progress(f'  → Baseline sufficient ({baseline_count} '
+                               f'items) — LLM enrichment skipped')
+                merged = baseline_dict
+            else:
+                self._progress(f'  → Passes done ({baseline_count} baseline, '
+                               f'{llm_count} LLM items). Merging...')
+                merged = self._merge_hw_profile(baseline_dict, llm_profile)
+            self.state.hw_profile = MappingProxyType(merged)
             self.state.mark_phase_complete('hw_analysis')
 
             # Save intermediate file
             self._save_intermediate('hw_profile.json', merged)
 
-            duration = time.time() - start
-            profile = merged
-
-            return (
-                f'PHASE 2: Hardware Analysis — COMPLETE ({duration:.1f}s)\n'
-                f'  Product: {profile.get("product_name", "Unknown")}\n'
-                f'  Components: {len(profile.get("components", []))}\n'
-                f'  Bus interfaces: {len(profile.get("bus_interfaces", []))}\n'
-                f'  Existing firmware: {len(profile.get("existing_firmware", []))}\n'
-                f'  Existing drivers: {len(profile.get("existing_drivers", []))}\n'
-                f'  Existing tools: {len(profile.get("existing_tools", []))}\n'
-                f'  Knowledge gaps: {len(profile.get("gaps", []))}\n'
-                f'  Sources: baseline={baseline_count}, LLM={llm_count}'
+            ctx = self._summarize_counts(merged, _HW_PROFILE_LIST_KEYS)
+            ctx.update(
+                duration=time.time() - start,
+                product_name=merged.get('product_name', 'Unknown'),
+                baseline_count=baseline_count,
+                llm_count=llm_count,
             )
+            summary = self._HW_SUMMARY.format_map(ctx)
+            if llm_response is None or llm_response.success:
+                self._store_phase_cache('hw_analysis', cache_inputs, merged, summary)
+            return summary
 
         except Exception as e:
             self.state.errors.append(f'HW analysis exception: {e}')
@@ -1350,7 +2134,7 @@ class FeaturePlanningOrchestrator(BaseAgent):
         '''
         Phase 3: Scope the SW/FW work.
 
-        Hybrid two-pass approach:
+        Hybrid two-pass approach (the passes run concurrently):
           Pass 1 — deterministic scoping (guaranteed baseline)
           Pass 2 — LLM with tools (enrichment via JSON output)
           Merge  — LLM scope items preferred (richer), baseline fills gaps
@@ -1359,28 +2143,44 @@ class FeaturePlanningOrchestrator(BaseAgent):
         start = time.time()
 
         try:
-            # Pass 1: Deterministic baseline
-            self._progress('  → Pass 1: deterministic scoping...')
-            log.info('Phase 3 — Pass 1: deterministic scoping')
-            baseline_scope = self.scoping_agent.scope(
-                self.state.feature_request,
-                self.state.research_report or None,
-                self.state.hw_profile or None,
+            cache_inputs = {
+                'feature_request': self.state.feature_request,
+                'research_report': self.state.research_report,
+                'hw_profile': self.state.hw_profile,
+            } if self._reuse_cache else {}
+            cached = self._load_phase_cache('scoping', cache_inputs)
+            if cached is not None:
+                self.state.feature_scope = MappingProxyType(cached['result'])
+                self.state.mark_phase_complete('scoping')
+                self.state.questions_for_user.extend(
+                    cached['result'].get('open_questions', [])
+                )
+                self._save_intermediate('scope.json', cached['result'])
+                return f'{cached["summary"]}\n  (reused cached result)'
+
+            # Pass 1 (deterministic baseline) and Pass 2 (LLM enrichment)
+            # run concurrently
+            self._progress('  → Pass 1 (deterministic scoping) and Pass 2 '
+                           '(LLM enrichment) running concurrently '
+                           '(this may take a few minutes)...')
+            log.info('Phase 3 — Pass 1 + Pass 2: deterministic scoping and LLM enrichment')
+            agent = self.scoping_agent
+            baseline_scope, llm_response = self._run_two_pass(
+                lambda: agent.scope(
+                    self.state.feature_request,
+                    self.state.research_report or None,
+                    self.state.hw_profile or None,
+                ),
+                lambda: agent.run({
+                    'feature_request': self.state.feature_request,
+                    'research_report': self.state.research_report or {},
+                    'hw_profile': self.state.hw_profile or {},
+                }),
             )
             baseline_dict = baseline_scope.to_dict()
             baseline_count = len(baseline_scope.all_items)
             log.info(f'Phase 3 — Pass 1 complete: {baseline_count} items')
 
-            # Pass 2: LLM enrichment
-            self._progress(f'  → Pass 1 done ({baseline_count} items). '
-                           f'Pass 2: LLM enrichment (this may take a few minutes)...')
-            log.info('Phase 3 — Pass 2: LLM enrichment')
-            llm_response = self.scoping_agent.run({
-                'feature_request': self.state.feature_request,
-                'research_report': self.state.research_report or {},
-                'hw_profile': self.state.hw_profile or {},
-            })
-
             llm_scope = {}
             if llm_response.success:
                 llm_scope = llm_response.metadata.get('feature_scope', {})
@@ -1389,16 +2189,15 @@ class FeaturePlanningOrchestrator(BaseAgent):
                 )
 
             llm_count = sum(
-                len(llm_scope.get(k, []))
-                for k in ('firmware_items', 'driver_items', 'tool_items',
-                          'test_items', 'integration_items', 'documentation_items')
+                self._summarize_counts(llm_scope, SCOPE_ITEM_KEYS).values()
             )
             log.info(f'Phase 3 — Pass 2 complete: {llm_count} LLM items')
 
             # Merge: LLM scope items preferred (richer), baseline fills gaps
-            self._progress(f'  → Pass 2 done ({llm_count} LLM items). Merging...')
+            self._progress(f'  → Passes done ({baseline_count} baseline, '
+                           f'{llm_count} LLM items). Merging...')
             merged = self._merge_scope(baseline_dict, llm_scope)
-            self.state.feature_scope = merged
+            self.state.feature_scope = MappingProxyType(merged)
             self.state.mark_phase_complete('scoping')
 
             # Accumulate questions
@@ -1409,19 +2208,20 @@ class FeaturePlanningOrchestrator(BaseAgent):
             # Save intermediate file
             self._save_intermediate('scope.json', merged)
 
-            duration = time.time() - start
-            conf = scope.get('confidence_report', {})
-
-            return (
-                f'PHASE 3: SW/FW Scoping — COMPLETE ({duration:.1f}s)\n'
-                f'  Total items: {conf.get("total_items", 0)}\n'
-                f'  By category: {conf.get("by_category", {})}\n'
-                f'  By confidence: {conf.get("by_confidence", {})}\n'
-                f'  By complexity: {conf.get("by_complexity", {})}\n'
-                f'  Open questions: {conf.get("total_questions", 0)} '
-                f'({conf.get("blocking_questions", 0)} blocking)\n'
-                f'  Sources: baseline={baseline_count}, LLM={llm_count}'
+            conf = scope.get('confidence_report') or {}
+            ctx = {
+                k: conf.get(k, default)
+                for k, default in self._SCOPING_SUMMARY_DEFAULTS.items()
+            }
+            ctx.update(
+                duration=time.time() - start,
+                baseline_count=baseline_count,
+                llm_count=llm_count,
             )
+            summary = self._SCOPING_SUMMARY.format_map(ctx)
+            if llm_response.success:
+                self._store_phase_cache('scoping', cache_inputs, merged, summary)
+            return summary
 
         except Exception as e:
             self.state.errors.append(f'Scoping exception: {e}')
@@ -1444,16 +2244,13 @@ class FeaturePlanningOrchestrator(BaseAgent):
                 self.state.jira_plan = response.metadata.get('jira_plan', {})
                 self.state.mark_phase_complete('plan_generation')
 
-                duration = time.time() - start
                 plan = self.state.jira_plan or {}
-
-                return (
-                    f'PHASE 4: Jira Plan Generation — COMPLETE ({duration:.1f}s)\n'
-                    f'  Project: {plan.get("project_key", "?")}\n'
-                    f'  Epics: {plan.get("total_epics", 0)}\n'
-                    f'  Stories: {plan.get("total_stories", 0)}\n'
-                    f'  Total tickets: {plan.get("total_tickets", 0)}'
-                )
+                ctx = {
+                    k: plan.get(k, default)
+                    for k, default in self._PLAN_SUMMARY_DEFAULTS.items()
+                }
+                ctx['duration'] = time.time() - start
+                return self._PLAN_SUMMARY.format_map(ctx)
             else:
                 error = response.error or 'Unknown error'
                 self.state.errors.append(f'Plan generation failed: {error}')
@@ -2211,6 +3008,9 @@ class FeaturePlanningOrchestrator(BaseAgent):
             # Create Stories under this Epic, collecting keys for linking
             epic_story_keys: List[str] = []
 
+            # Duplicate checks may prompt the user, so they run sequentially;
+            # the approved Stories are then created concurrently.
+            stories_to_create: List[tuple] = []
             for story_data in epic_data.get('stories', []):
                 story_summary_raw = story_data.get('summary', '')
 
@@ -2227,20 +3027,37 @@ class FeaturePlanningOrchestrator(BaseAgent):
                         log.info(f'Skipped duplicate Story: "{story_summary}"')
                         continue
 
+                stories_to_create.append((story_data, story_summary))
+
+            def _create_story(story_data: Dict[str, Any], story_summary: str):
+                # Fall back to summary when description is empty.
+                story_description = story_data.get('description', '') or story_summary
+                return create_ticket(
+                    project_key=project_key,
+                    summary=story_summary,
+                    issue_type='Story',
+                    description=story_description,
+                    components=story_data.get('components'),
+                    labels=story_data.get('labels'),
+                    parent_key=epic_key,
+                    assignee=story_data.get('assignee'),
+                    product_family=product_family,
+                )
+
+            story_futures = []
+            if stories_to_create:
+                with ThreadPoolExecutor(
+                    max_workers=min(STORY_CREATE_WORKERS, len(stories_to_create))
+                ) as pool:
+                    story_futures = [
+                        pool.submit(_create_story, story_data, story_summary)
+                        for story_data, story_summary in stories_to_create
+                    ]
+
+            # Collect results in plan order so Story links stay sequential
+            for (_, story_summary), future in zip(stories_to_create, story_futures):
                 try:
-                    # Fall back to summary when description is empty.
-                    story_description = story_data.get('description', '') or story_summary
-                    story_result = create_ticket(
-                        project_key=project_key,
-                        summary=story_summary,
-                        issue_type='Story',
-                        description=story_description,
-                        components=story_data.get('components'),
-                        labels=story_data.get('labels'),
-                        parent_key=epic_key,
-                        assignee=story_data.get('assignee'),
-                        product_family=product_family,
-                    )
+                    story_result = future.result()
 
                     if hasattr(story_result, 'is_success') and story_result.is_success:
                         story_key = story_result.data.get('key')
@@ -2319,7 +3136,7 @@ class FeaturePlanningOrchestrator(BaseAgent):
             import csv as _csv
             csv_name = 'created_tickets.csv'
             csv_dir = getattr(self, '_output_dir', '') or '.'
-            os.makedirs(csv_dir, exist_ok=True)
+            self._ensure_dir(csv_dir)
             created_csv_path = os.path.join(csv_dir, csv_name)
             try:
                 with open(created_csv_path, 'w', newline='', encoding='utf-8') as cf:
@@ -2349,47 +3166,48 @@ class FeaturePlanningOrchestrator(BaseAgent):
                        or not any(t['key'] == l['to'] and t['type'] == 'Epic'
                                   for t in created_tickets)]
         epic_link_count = len(created_links) - len(story_links)
-        lines = [
-            'PHASE 6: Jira Execution — COMPLETE',
-            f'  Created: {len(created_tickets)} tickets',
-            f'  Skipped: {len(skipped_tickets)} (duplicates)',
-            f'  Links:   {len(created_links)} "Relates" links'
-            f' ({epic_link_count} Epic↔Epic, {len(story_links)} Story↔Story)',
-            f'  Errors:  {len(errors)}',
-        ]
+        # Write the summary straight into a buffer — one line per ticket can
+        # run to hundreds of lines for a large plan.
+        buf = io.StringIO()
+        write = buf.write
+        write(self._EXECUTION_SUMMARY.format_map({
+            'created': len(created_tickets),
+            'skipped': len(skipped_tickets),
+            'links': len(created_links),
+            'epic_links': epic_link_count,
+            'story_links': len(story_links),
+            'errors': len(errors),
+        }))
         if initiative_key:
-            lines.append(
-                f'  Initiative: {initiative_key}'
-                f'{" (auto-created)" if was_auto else " (supplied)"}'
-                f' — Epics linked as children'
-            )
+            write(f'  Initiative: {initiative_key}'
+                  f'{" (auto-created)" if was_auto else " (supplied)"}'
+                  f' — Epics linked as children\n')
         elif initiative_warning:
             # Initiative type was unavailable — Epics created without parent
-            lines.append(f'  Initiative: SKIPPED — {initiative_warning}')
-        lines.append('')
+            write(f'  Initiative: SKIPPED — {initiative_warning}\n')
 
         if created_tickets:
-            lines.append('Created Tickets:')
+            write('\nCreated Tickets:')
             for t in created_tickets:
                 parent = f" (under {t['parent']})" if t.get('parent') else ''
-                lines.append(f"  [{t['type']}] {t['key']}: {t['summary']}{parent}")
+                write(f"\n  [{t['type']}] {t['key']}: {t['summary']}{parent}")
 
         if skipped_tickets:
-            lines.extend(['', 'Skipped (duplicates):'])
+            write('\n\nSkipped (duplicates):')
             for s in skipped_tickets:
-                lines.append(f"  ⊘ [{s['type']}] {s['summary']}")
+                write(f"\n  ⊘ [{s['type']}] {s['summary']}")
 
         if errors:
-            lines.extend(['', 'Errors:'])
+            write('\n\nErrors:')
             for e in errors:
-                lines.append(f'  ! {e}')
-
-        content = '\n'.join(lines)
+                write(f'\n  ! {e}')
 
         if created_csv_path:
-            lines.extend(['', f'Cleanup CSV: {created_csv_path}',
-                           '  To undo all created tickets:',
-                           f'  python pm_agent.py --cleanup {created_csv_path} --execute'])
+            write(f'\n\nCleanup CSV: {created_csv_path}'
+                  '\n  To undo all created tickets:'
+                  f'\n  python pm_agent.py --cleanup {created_csv_path} --execute')
+
+        content = buf.getvalue()
 
         return AgentResponse.success_response(
             content=content,
@@ -2417,24 +3235,21 @@ class FeaturePlanningOrchestrator(BaseAgent):
     @staticmethod
     def _format_blocking_questions(questions: List[Dict[str, Any]]) -> str:
         '''Format blocking questions for display.'''
-        lines = [
-            '⚠️  BLOCKING QUESTIONS — Human input required before proceeding:',
-            '',
-        ]
+        buf = io.StringIO()
+        write = buf.write
+        write('⚠️  BLOCKING QUESTIONS — Human input required before proceeding:\n\n')
         for i, q in enumerate(questions, 1):
-            lines.append(f'  {i}. {q.get("question", "?")}')
+            write(f'  {i}. {q.get("question", "?")}\n')
             context = q.get('context', '')
             if context:
-                lines.append(f'     Context: {context}')
+                write(f'     Context: {context}\n')
             options = q.get('options', [])
             if options:
-                lines.append(f'     Options: {", ".join(options)}')
-            lines.append('')
+                write(f'     Options: {", ".join(options)}\n')
+            write('\n')
 
-        lines.append(
-            'Please answer these questions and re-run the workflow to continue.'
-        )
-        return '\n'.join(lines)
+        write('Please answer these questions and re-run the workflow to continue.')
+        return buf.getvalue()
 
     # ------------------------------------------------------------------
     # Helpers — plan review formatting
@@ -2446,38 +3261,29 @@ class FeaturePlanningOrchestrator(BaseAgent):
         if not plan:
             return 'PHASE 5: Plan Review — NO PLAN AVAILABLE'
 
-        lines = [
-            '=' * 60,
-            'PHASE 5: Plan Review — READY FOR APPROVAL',
-            '=' * 60,
-            '',
-        ]
+        rule = '=' * 60
+        buf = io.StringIO()
+        write = buf.write
+        write(f'{rule}\nPHASE 5: Plan Review — READY FOR APPROVAL\n{rule}\n\n')
 
         # Include the Markdown summary if available
         markdown = plan.get('summary_markdown', '')
         if markdown:
-            lines.append(markdown)
+            write(markdown)
         else:
             # Fallback: basic summary
-            lines.extend([
-                f'Project: {plan.get("project_key", "?")}',
-                f'Feature: {plan.get("feature_name", "?")}',
-                f'Epics: {plan.get("total_epics", 0)}',
-                f'Stories: {plan.get("total_stories", 0)}',
-                f'Total tickets: {plan.get("total_tickets", 0)}',
-            ])
-
-        lines.extend([
-            '',
-            '=' * 60,
-            '',
-            'To execute this plan and create tickets in Jira, re-run with --execute.',
-            'To modify the plan, adjust the feature request or provide additional docs.',
-            '',
-            '=' * 60,
-        ])
+            write(f'Project: {plan.get("project_key", "?")}\n'
+                  f'Feature: {plan.get("feature_name", "?")}\n'
+                  f'Epics: {plan.get("total_epics", 0)}\n'
+                  f'Stories: {plan.get("total_stories", 0)}\n'
+                  f'Total tickets: {plan.get("total_tickets", 0)}')
 
-        return '\n'.join(lines)
+        write(f'\n\n{rule}\n\n'
+              'To execute this plan and create tickets in Jira, re-run with --execute.\n'
+              'To modify the plan, adjust the feature request or provide additional docs.\n'
+              f'\n{rule}')
+
+        return buf.getvalue()
 
     # ------------------------------------------------------------------
     # State management
@@ -2503,12 +3309,17 @@ class FeaturePlanningOrchestrator(BaseAgent):
             errors=state_dict.get('errors', []),
         )
 
-    def save_plan_to_file(self, output_path: str) -> str:
+    def save_plan_to_file(self, output_path: str, sync: bool = False) -> str:
         '''
         Save the Jira plan to a JSON file.
 
+        The plan is serialized immediately; unless *sync* is set, the disk
+        write happens on the background writer thread — call flush_writes()
+        before reading the file back.
+
         Input:
             output_path: Path to write the JSON file.
+            sync:        Write before returning (errors are raised).
 
         Output:
             The path written to.
@@ -2517,18 +3328,19 @@ class FeaturePlanningOrchestrator(BaseAgent):
         if not plan:
             raise ValueError('No Jira plan to save')
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(plan, f, indent=2)
-
-        log.info(f'Saved Jira plan to: {output_path}')
+        self._write_output(output_path, _dumps_indented(plan), 'Jira plan', sync)
         return output_path
 
-    def save_markdown_to_file(self, output_path: str) -> str:
+    def save_markdown_to_file(self, output_path: str, sync: bool = False) -> str:
         '''
         Save the plan's Markdown summary to a file.
 
+        Written on the background writer thread unless *sync* is set; see
+        save_plan_to_file().
+
         Input:
             output_path: Path to write the Markdown file.
+            sync:        Write before returning (errors are raised).
 
         Output:
             The path written to.
@@ -2541,8 +3353,18 @@ class FeaturePlanningOrchestrator(BaseAgent):
         if not markdown:
             raise ValueError('No Markdown summary in the plan')
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(markdown)
-
-        log.info(f'Saved plan Markdown to: {output_path}')
+        self._write_output(output_path, markdown, 'plan Markdown', sync)
         return output_path
+
+    def _write_output(self, output_path: str, payload, label: str, sync: bool) -> None:
+        '''Write a final output file now (sync) or via the background writer.'''
+        if not sync:
+            self._submit_write(output_path, payload, label, track=False)
+            return
+        if isinstance(payload, bytes):
+            with open(output_path, 'wb') as f:
+                f.write(payload)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+        log.info(f'Saved {label}: {output_path}')
@@ -10,22 +10,212 @@
 #
 ##########################################################################################
 
+import functools
 import json
 import logging
 import os
 import re
 import sys
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
-from agents.base import BaseAgent, AgentConfig, AgentResponse
+from agents.base import BaseAgent, AgentConfig, AgentResponse, load_prompt_file
 from agents.feature_planning_models import (
     HardwareProfile,
     ResearchReport,
 )
 
+# Tools the deterministic analysis calls directly, imported once; a None
+# sentinel means the tool module is unavailable.
+try:
+    from tools.jira_tools import get_components, get_project_info, search_tickets
+except ImportError:
+    get_components = get_project_info = search_tickets = None
+
+try:
+    from tools.knowledge_tools import read_knowledge_file
+except ImportError:
+    read_knowledge_file = None
+
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
+# Worker threads for the deterministic analysis's independent, read-only
+# tool calls (knowledge base + Jira lookups).
+HW_TOOL_WORKERS = 8
+
+# Shared by every agent's analyze(); threads are only started on first use.
+# Tasks never wait on other tasks in the pool, so concurrent analyses only
+# queue behind each other.
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=HW_TOOL_WORKERS, thread_name_prefix='hw-analyst'
+)
+
+# Ticket fields _load_jira_info reads (the key is always returned); asking
+# Jira for just these keeps the search payload small.
+_TICKET_FIELDS = ['summary', 'status']
+
+# Default number of related tickets pulled from Jira, and the page size used
+# to fetch them (one round-trip covers even a much larger limit).
+HW_TICKET_LIMIT = 20
+HW_TICKET_BATCH_SIZE = 500
+
+# Jira component name tokens -> HardwareProfile list they are filed under.
+# Plural / long forms are listed explicitly since matching is per token.
+_COMPONENT_BUCKETS = MappingProxyType({
+    'firmware': 'existing_firmware',
+    'fw': 'existing_firmware',
+    'embedded': 'existing_firmware',
+    'driver': 'existing_drivers',
+    'drivers': 'existing_drivers',
+    'kernel': 'existing_drivers',
+    'hfi': 'existing_drivers',
+    'hfi1': 'existing_drivers',
+    'tool': 'existing_tools',
+    'tools': 'existing_tools',
+    'tooling': 'existing_tools',
+    'cli': 'existing_tools',
+    'util': 'existing_tools',
+    'utils': 'existing_tools',
+    'utility': 'existing_tools',
+    'utilities': 'existing_tools',
+    'diag': 'existing_tools',
+    'diags': 'existing_tools',
+    'diagnostic': 'existing_tools',
+    'diagnostics': 'existing_tools',
+})
+# Precedence when a name hits several buckets
+_COMPONENT_BUCKET_ORDER = ('existing_firmware', 'existing_drivers', 'existing_tools')
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Targeted ticket searches as (profile list, JQL summary clause), in filing
+# precedence: a ticket returned by several searches is filed under the first.
+_TICKET_QUERIES = (
+    ('existing_firmware', 'summary ~ "firmware" OR summary ~ "fw"'),
+    ('existing_drivers', 'summary ~ "driver"'),
+    ('existing_tools', 'summary ~ "tool" OR summary ~ "diagnostic"'),
+)
+
+# Product knowledge file read by the deterministic analysis
+PRODUCT_KNOWLEDGE_PATH = 'data/knowledge/cornelis_products.md'
+
+# Markdown fallback section headings as (keyword, section), in precedence
+# order: when a line mentions several keywords the earliest entry wins.
+_SECTION_KEYWORDS = (
+    ('product overview', 'overview'),
+    ('product name', 'overview'),
+    ('architecture', 'architecture'),
+    ('firmware', 'firmware'),
+    ('driver', 'drivers'),
+    ('existing tool', 'tools'),
+    ('tools', 'tools'),
+    ('interface', 'buses'),
+    ('integration point', 'integration'),
+    ('gap', 'gaps'),
+    ('missing', 'gaps'),
+)
+_SECTION_RANK = {
+    keyword: (rank, section)
+    for rank, (keyword, section) in enumerate(_SECTION_KEYWORDS)
+}
+_SECTION_RE = re.compile('|'.join(re.escape(kw) for kw, _ in _SECTION_KEYWORDS))
+# One line of LLM output (without its newline); iterated lazily rather than
+# materialising splitlines() for long reports.
+_LINE_RE = re.compile(r'([^\n]*)\n?')
+# Fenced mermaid block carrying the block diagram.  The language tag is
+# required so ```json data blocks are never taken as the diagram.
+_DIAGRAM_RE = re.compile(r'```(?:mermaid)\s*\n(.*?)\n```', re.DOTALL)
+
+# Bus/interface keywords recognised in research findings as (keyword,
+# canonical name) pairs.  Longer spellings come first so the alternation
+# prefers them ('pci express' before 'pcie', 'qspi' before 'spi').
+_BUS_KEYWORDS = (
+    ('pci express', 'PCIe'),
+    ('pcie', 'PCIe'),
+    ('qspi', 'QSPI'),
+    ('spi', 'SPI'),
+    ('i2c', 'I2C'),
+    ('uart', 'UART'),
+    ('jtag', 'JTAG'),
+    ('usb', 'USB'),
+    ('ethernet', 'Ethernet'),
+    ('mdio', 'MDIO'),
+    ('smbus', 'SMBus'),
+)
+_BUS_CANON = MappingProxyType(dict(_BUS_KEYWORDS))
+_BUS_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(kw) for kw, _ in _BUS_KEYWORDS) + r')s?\b'
+)
+# Lowercased canonical name per keyword, used to dedupe against the profile
+_BUS_SEEN_KEY = MappingProxyType({kw: canon.lower() for kw, canon in _BUS_KEYWORDS})
+
+
+def _result_items(result: Any, *keys: str) -> List[Dict[str, Any]]:
+    '''
+    Return the item list from a tool result.
+
+    Tools return either a bare list or a dict wrapping the list under one of
+    *keys* (checked in order).
+    '''
+    data = result.data if hasattr(result, 'data') else result
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in keys:
+            if key in data:
+                return data[key] or []
+    return []
+
+
+def _match_section(lower: str) -> str:
+    '''
+    Return the section a lowercased Markdown line introduces, or ''.
+
+    One regex scan collects every heading keyword on the line; the
+    highest-precedence one decides the section.
+    '''
+    matches = _SECTION_RE.findall(lower)
+    if not matches:
+        return ''
+    return min(_SECTION_RANK[m] for m in matches)[1]
+
+
+def _classify_component(name: str) -> str:
+    '''
+    Return the HardwareProfile list a Jira component belongs in, or '' for
+    a plain hardware component.
+    '''
+    tokens = set(_TOKEN_RE.findall(name.lower()))
+    buckets = {_COMPONENT_BUCKETS[t] for t in tokens & _COMPONENT_BUCKETS.keys()}
+    for bucket in _COMPONENT_BUCKET_ORDER:
+        if bucket in buckets:
+            return bucket
+    return ''
+
+
+@functools.lru_cache(maxsize=4)
+def _read_cornelis_products(mtime: float) -> Tuple[Optional[str], str]:
+    '''
+    Read the product knowledge file and derive the profile basics.
+
+    Cached per file mtime so repeated analyze() calls skip the read and the
+    product-name scan until the file changes.
+
+    Output:
+        (product_name or None, description) — both empty when the knowledge
+        tool returns no content.
+    '''
+    result = read_knowledge_file(file_path=PRODUCT_KNOWLEDGE_PATH)
+    data = result.data if hasattr(result, 'data') else result
+    if not (isinstance(data, dict) and data.get('content')):
+        return None, ''
+
+    content = data['content']
+    product_name = None
+    if 'OPX' in content or 'Omni-Path' in content:
+        product_name = 'Omni-Path Express (OPX)'
+    return product_name, content[:1000]
 
 
 class HardwareAnalystAgent(BaseAgent):
@@ -36,11 +226,15 @@ class HardwareAnalystAgent(BaseAgent):
     base, and searches MCP/GitHub to construct a HardwareProfile.
     '''
 
-    def __init__(self, **kwargs):
+    def __init__(self, ticket_limit: int = HW_TICKET_LIMIT, **kwargs):
         '''
         Initialize the Hardware Analyst Agent.
 
         Registers Jira, knowledge, MCP, and web search tools.
+
+        Input:
+            ticket_limit: Maximum number of related Jira tickets analyze()
+                pulls into the profile.
         '''
         # Load the system prompt from config/prompts/hardware_analyst.md.
         # No hardcoded fallback — the external file is the sole source.
@@ -61,6 +255,8 @@ class HardwareAnalystAgent(BaseAgent):
         super().__init__(config=config, **kwargs)
         self._register_hw_tools()
 
+        self.ticket_limit = ticket_limit
+
     # ------------------------------------------------------------------
     # Tool registration
     # ------------------------------------------------------------------
@@ -122,13 +318,11 @@ class HardwareAnalystAgent(BaseAgent):
     def _load_prompt_file() -> Optional[str]:
         '''Load the hardware analyst prompt from config/prompts/.'''
         prompt_path = os.path.join('config', 'prompts', 'hardware_analyst.md')
-        if os.path.exists(prompt_path):
-            try:
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except Exception as e:
-                log.warning(f'Failed to load hardware analyst prompt: {e}')
-        return None
+        try:
+            return load_prompt_file(prompt_path)
+        except Exception as e:
+            log.warning(f'Failed to load hardware analyst prompt: {e}')
+            return None
 
     # ------------------------------------------------------------------
     # Main entry point
@@ -191,7 +385,10 @@ class HardwareAnalystAgent(BaseAgent):
         '''
         Analyze hardware programmatically without LLM reasoning.
 
-        Deterministic fallback that calls tools directly.
+        Deterministic fallback that calls tools directly.  The knowledge
+        base read and the Jira lookups are independent network/disk calls,
+        so they run concurrently; each fills its own result and the main
+        thread merges them before the research enrichment.
 
         Input:
             feature_request:  The feature description.
@@ -205,13 +402,21 @@ class HardwareAnalystAgent(BaseAgent):
 
         profile = HardwareProfile()
 
-        # --- Product knowledge base ---------------------------------------
-        profile = self._load_product_knowledge(profile)
+        # --- Product knowledge base (background) --------------------------
+        knowledge_future = _TOOL_EXECUTOR.submit(
+            self._load_product_knowledge, HardwareProfile()
+        )
 
         # --- Jira project info --------------------------------------------
         if project_key:
             profile = self._load_jira_info(profile, project_key)
 
+        # Knowledge base results take precedence, as when it was read first
+        knowledge = knowledge_future.result()
+        profile.product_name = knowledge.product_name or profile.product_name
+        profile.description = knowledge.description or profile.description
+        profile.gaps[:0] = knowledge.gaps
+
         # --- Enrich from research report ----------------------------------
         if research_report:
             profile = self._enrich_from_research(profile, research_report)
@@ -275,24 +480,23 @@ class HardwareAnalystAgent(BaseAgent):
 
     def _load_product_knowledge(self, profile: HardwareProfile) -> HardwareProfile:
         '''Load product information from the knowledge base.'''
-        try:
-            from tools.knowledge_tools import search_knowledge, read_knowledge_file
-        except ImportError:
+        if read_knowledge_file is None:
             profile.gaps.append('Knowledge tools unavailable')
             return profile
 
+        # A missing file is not an error — there is simply nothing to add
+        try:
+            mtime = os.path.getmtime(PRODUCT_KNOWLEDGE_PATH)
+        except OSError:
+            return profile
+
         # Read the main product knowledge file
         try:
-            result = read_knowledge_file(
-                file_path='data/knowledge/cornelis_products.md'
-            )
-            data = result.data if hasattr(result, 'data') else result
-            if isinstance(data, dict) and data.get('content'):
-                content = data['content']
-                # Extract product name from content
-                if 'OPX' in content or 'Omni-Path' in content:
-                    profile.product_name = profile.product_name or 'Omni-Path Express (OPX)'
-                profile.description = content[:1000]
+            product_name, description = _read_cornelis_products(mtime)
+            if product_name:
+                profile.product_name = profile.product_name or product_name
+            if description:
+                profile.description = description
         except Exception as e:
             log.warning(f'Failed to read product knowledge: {e}')
             profile.gaps.append('Could not read product knowledge base')
@@ -302,20 +506,36 @@ class HardwareAnalystAgent(BaseAgent):
     def _load_jira_info(
         self, profile: HardwareProfile, project_key: str
     ) -> HardwareProfile:
-        '''Load hardware information from Jira.'''
-        try:
-            from tools.jira_tools import (
-                get_project_info,
-                get_components,
-                search_tickets,
-            )
-        except ImportError:
+        '''
+        Load hardware information from Jira.
+
+        The project, component and ticket lookups are independent read-only
+        calls, so they are submitted together; their results are merged into
+        *profile* on the calling thread in a fixed order.
+        '''
+        if get_project_info is None:
             profile.gaps.append('Jira tools unavailable')
             return profile
 
+        pool = _TOOL_EXECUTOR
+        project_future = pool.submit(get_project_info, project_key=project_key)
+        components_future = pool.submit(get_components, project_key=project_key)
+        ticket_futures = [
+            (bucket, pool.submit(
+                search_tickets,
+                jql=f'project = {project_key} AND ({clause}) AND '
+                    f'type in (Epic, Story) '
+                    f'ORDER BY created DESC',
+                limit=self.ticket_limit,
+                fields=_TICKET_FIELDS,
+                batch_size=HW_TICKET_BATCH_SIZE,
+            ))
+            for bucket, clause in _TICKET_QUERIES
+        ]
+
         # Get project info
         try:
-            result = get_project_info(project_key=project_key)
+            result = project_future.result()
             data = result.data if hasattr(result, 'data') else result
             if isinstance(data, dict):
                 profile.product_name = (
@@ -326,74 +546,54 @@ class HardwareAnalystAgent(BaseAgent):
 
         # Get components — these map to SW/FW areas
         try:
-            result = get_components(project_key=project_key)
-            data = result.data if hasattr(result, 'data') else result
-            if isinstance(data, dict):
-                for comp in data.get('components', []):
-                    name = comp.get('name', '')
-                    desc = comp.get('description', '')
-                    lower = name.lower()
-
-                    if any(kw in lower for kw in ('firmware', 'fw', 'embedded')):
-                        profile.existing_firmware.append({
-                            'name': name,
-                            'description': desc,
-                            'source': 'jira_component',
-                        })
-                    elif any(kw in lower for kw in ('driver', 'kernel', 'hfi')):
-                        profile.existing_drivers.append({
-                            'name': name,
-                            'description': desc,
-                            'source': 'jira_component',
-                        })
-                    elif any(kw in lower for kw in ('tool', 'cli', 'util', 'diag')):
-                        profile.existing_tools.append({
-                            'name': name,
-                            'description': desc,
-                            'source': 'jira_component',
-                        })
-                    else:
-                        profile.components.append({
-                            'name': name,
-                            'description': desc,
-                            'type': 'jira_component',
-                        })
+            classified = [
+                (_classify_component(comp.get('name', '')), comp)
+                for comp in _result_items(components_future.result(), 'components')
+            ]
+            for bucket in _COMPONENT_BUCKET_ORDER:
+                getattr(profile, bucket).extend([
+                    {
+                        'name': comp.get('name', ''),
+                        'description': comp.get('description', ''),
+                        'source': 'jira_component',
+                    }
+                    for comp_bucket, comp in classified
+                    if comp_bucket == bucket
+                ])
+            profile.components.extend([
+                {
+                    'name': comp.get('name', ''),
+                    'description': comp.get('description', ''),
+                    'type': 'jira_component',
+                }
+                for comp_bucket, comp in classified
+                if not comp_bucket
+            ])
         except Exception as e:
             log.warning(f'Failed to get Jira components: {e}')
 
-        # Search for firmware-related tickets
-        try:
-            result = search_tickets(
-                jql=f'project = {project_key} AND '
-                    f'(summary ~ "firmware" OR summary ~ "driver" OR '
-                    f'summary ~ "hardware") AND '
-                    f'type in (Epic, Story) '
-                    f'ORDER BY created DESC',
-                limit=20,
-            )
-            data = result.data if hasattr(result, 'data') else result
-            if isinstance(data, dict):
-                for ticket in data.get('tickets', data.get('issues', [])):
-                    summary = ticket.get('summary', '')
-                    key = ticket.get('key', '')
-                    status = ticket.get('status', '')
-                    lower = summary.lower()
-
-                    entry = {
-                        'name': summary,
-                        'jira_key': key,
-                        'status': status,
-                        'source': 'jira_ticket',
-                    }
+        # Firmware / driver / tool tickets — Jira already filtered each
+        # search, so results are filed by the query that returned them
+        seen_keys = set()
+        for bucket, future in ticket_futures:
+            try:
+                tickets = _result_items(future.result(), 'tickets', 'issues')
+            except Exception as e:
+                log.warning(f'Failed to search Jira tickets: {e}')
+                continue
 
-                    if 'firmware' in lower or 'fw' in lower:
-                        profile.existing_firmware.append(entry)
-                    elif 'driver' in lower:
-                        profile.existing_drivers.append(entry)
-                    elif 'tool' in lower or 'diagnostic' in lower:
-                        profile.existing_tools.append(entry)
-        except Exception as e:
-            log.warning(f'Failed to search Jira tickets: {e}')
+            entries = getattr(profile, bucket)
+            for ticket in tickets:
+                key = ticket.get('key', '')
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                entries.append({
+                    'name': ticket.get('summary', ''),
+                    'jira_key': key,
+                    'status': ticket.get('status', ''),
+                    'source': 'jira_ticket',
+                })
 
         return profile
 
@@ -410,33 +610,21 @@ class HardwareAnalystAgent(BaseAgent):
             + research_report.get('internal_knowledge', [])
         )
 
-        bus_keywords = {
-            'pcie': 'PCIe',
-            'pci express': 'PCIe',
-            'spi': 'SPI',
-            'i2c': 'I2C',
-            'uart': 'UART',
-            'jtag': 'JTAG',
-            'usb': 'USB',
-            'ethernet': 'Ethernet',
-            'mdio': 'MDIO',
-            'smbus': 'SMBus',
-            'qspi': 'QSPI',
-        }
-
         seen_buses = {b.get('name', '').lower() for b in profile.bus_interfaces}
 
         for finding in all_findings:
             content = finding.get('content', '').lower()
-            for keyword, bus_name in bus_keywords.items():
-                if keyword in content and bus_name.lower() not in seen_buses:
+            for keyword in _BUS_RE.findall(content):
+                seen_key = _BUS_SEEN_KEY[keyword]
+                if seen_key not in seen_buses:
+                    bus_name = _BUS_CANON[keyword]
                     profile.bus_interfaces.append({
                         'name': bus_name,
                         'protocol': bus_name,
                         'description': f'Identified from research: {finding.get("content", "")[:100]}',
                         'source': 'research_inference',
                     })
-                    seen_buses.add(bus_name.lower())
+                    seen_buses.add(seen_key)
 
         # Carry over open questions as gaps
         for question in research_report.get('open_questions', []):
@@ -533,85 +721,67 @@ class HardwareAnalystAgent(BaseAgent):
 
         current_section = ''
 
-        for line in llm_output.splitlines():
-            stripped = line.strip()
-            lower = stripped.lower()
-
-            # Detect section headings
-            if 'product overview' in lower or 'product name' in lower:
-                current_section = 'overview'
-            elif 'hardware architecture' in lower or 'architecture' in lower:
-                current_section = 'architecture'
-            elif 'existing firmware' in lower or 'firmware' in lower:
-                current_section = 'firmware'
-            elif 'existing driver' in lower or 'driver' in lower:
-                current_section = 'drivers'
-            elif 'existing tool' in lower or 'tools' in lower:
-                current_section = 'tools'
-            elif 'bus interface' in lower or 'interface' in lower:
-                current_section = 'buses'
-            elif 'integration point' in lower:
-                current_section = 'integration'
-            elif 'knowledge gap' in lower or 'gap' in lower or 'missing' in lower:
-                current_section = 'gaps'
-
-            # Parse bullet points
-            if stripped.startswith(('-', '*', '•')):
-                content = stripped.lstrip('-*• ').strip()
-                if not content:
-                    continue
-
-                if current_section == 'overview':
-                    if not profile.product_name and ':' in content:
-                        profile.product_name = content.split(':', 1)[1].strip()
-                    elif not profile.description:
-                        profile.description = content
-
-                elif current_section == 'firmware':
-                    profile.existing_firmware.append({
-                        'name': content[:100],
-                        'description': content,
-                        'source': 'llm_analysis',
-                    })
-
-                elif current_section == 'drivers':
-                    profile.existing_drivers.append({
-                        'name': content[:100],
-                        'description': content,
-                        'source': 'llm_analysis',
-                    })
-
-                elif current_section == 'tools':
-                    profile.existing_tools.append({
-                        'name': content[:100],
-                        'description': content,
-                        'source': 'llm_analysis',
-                    })
-
-                elif current_section == 'buses':
-                    profile.bus_interfaces.append({
-                        'name': content.split(':')[0].strip() if ':' in content else content[:50],
-                        'description': content,
-                        'source': 'llm_analysis',
-                    })
-
-                elif current_section == 'architecture':
-                    profile.components.append({
-                        'name': content.split(':')[0].strip() if ':' in content else content[:50],
-                        'description': content,
-                        'type': 'hardware',
-                    })
-
-                elif current_section == 'gaps':
-                    profile.gaps.append(content)
+        for line_match in _LINE_RE.finditer(llm_output):
+            stripped = line_match.group(1).strip()
+
+            # Bullets never introduce a section, so only other lines (bold
+            # '**Heading**' lines included) go through heading detection
+            if not stripped.startswith(('-', '*', '•')) or stripped.startswith('**'):
+                current_section = _match_section(stripped.lower()) or current_section
+                continue
+
+            # Parse bullet points under the current section
+            content = stripped.lstrip('-*• ').strip()
+            if not content:
+                continue
+
+            if current_section == 'overview':
+                if not profile.product_name and ':' in content:
+                    profile.product_name = content.split(':', 1)[1].strip()
+                elif not profile.description:
+                    profile.description = content
+
+            elif current_section == 'firmware':
+                profile.existing_firmware.append({
+                    'name': content[:100],
+                    'description': content,
+                    'source': 'llm_analysis',
+                })
+
+            elif current_section == 'drivers':
+                profile.existing_drivers.append({
+                    'name': content[:100],
+                    'description': content,
+                    'source': 'llm_analysis',
+                })
+
+            elif current_section == 'tools':
+                profile.existing_tools.append({
+                    'name': content[:100],
+                    'description': content,
+                    'source': 'llm_analysis',
+                })
+
+            elif current_section == 'buses':
+                profile.bus_interfaces.append({
+                    'name': content.split(':')[0].strip() if ':' in content else content[:50],
+                    'description': content,
+                    'source': 'llm_analysis',
+                })
+
+            elif current_section == 'architecture':
+                profile.components.append({
+                    'name': content.split(':')[0].strip() if ':' in content else content[:50],
+                    'description': content,
+                    'type': 'hardware',
+                })
+
+            elif current_section == 'gaps':
+                profile.gaps.append(content)
 
         # If we got a block diagram section, try to extract it
         # (skip ```json blocks — those are for structured data, not diagrams)
-        diagram_match = re.search(
-            r'```(?:mermaid)\s*\n(.*?)\n```',
-            llm_output,
-            re.DOTALL,
-        )
+        diagram_match = _DIAGRAM_RE.search(llm_output)
         if diagram_match:
             profile.block_diagram = diagram_match.group(1).strip()
 
@@ -11,8 +11,12 @@
 
 import logging
 import os
+import re
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from agents.base import BaseAgent, AgentConfig, AgentResponse
 from tools.jira_tools import JiraTools
@@ -20,6 +24,63 @@ from tools.jira_tools import JiraTools
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
+# Tickets kept per release in get_release_structure, and the page size used
+# for the single cross-release search that feeds it.
+RELEASE_TICKET_LIMIT = 200
+RELEASE_TICKET_BATCH_SIZE = 1000
+
+# Fields that search requests for release tickets; everything else is left
+# off the wire. Add to this list before reading more ticket fields.
+RELEASE_TICKET_FIELDS = ['summary', 'issuetype', 'status', 'fixVersions']
+
+# Shared pool for analyze_project's independent metadata lookups; threads
+# are only started on first use.
+_ANALYSIS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=5, thread_name_prefix='jira-analyst'
+)
+
+# Project metadata (info, components, workflows, issue types) changes on the
+# order of weeks, so successful lookups are reused for this many seconds.
+METADATA_CACHE_TTL = 600.0
+
+# (lookup function, project key) -> (fetched at, ToolResult)
+_metadata_cache: Dict[Tuple[Callable, str], Tuple[float, Any]] = {}
+
+
+def _cached_metadata(fetch: Callable, project_key: str) -> Any:
+    '''
+    Call fetch(project_key), reusing a successful result that is younger
+    than METADATA_CACHE_TTL.  Failures are never cached.
+    '''
+    key = (fetch, project_key)
+    now = time.monotonic()
+    cached = _metadata_cache.get(key)
+    if cached is not None and now - cached[0] < METADATA_CACHE_TTL:
+        return cached[1]
+
+    result = fetch(project_key)
+    if result.is_success:
+        _metadata_cache[key] = (now, result)
+    return result
+
+
+def invalidate_metadata_cache(project_key: Optional[str] = None) -> None:
+    '''
+    Drop cached project metadata.
+
+    Input:
+        project_key: Project to invalidate; None clears every project.
+    '''
+    for key in list(_metadata_cache):
+        if project_key is None or key[1] == project_key:
+            _metadata_cache.pop(key, None)
+
+
+def _jql_quote(value: str) -> str:
+    '''Quote a value as a JQL string literal.'''
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
 class JiraAnalystAgent(BaseAgent):
     '''
     Agent for analyzing Jira project state.
@@ -64,6 +125,10 @@ class JiraAnalystAgent(BaseAgent):
         super().__init__(config=config, tools=[jira_tools], **kwargs)
         
         self.project_key = project_key
+        
+        # Full release list per project from analyze_project, reused by
+        # get_release_structure for the rest of the workflow
+        self._releases_cache: Dict[str, List[Dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------
     # Prompt loading
@@ -152,40 +217,31 @@ Focus on information relevant for release planning.'''
             'errors': []
         }
         
-        # Get project info
-        result = get_project_info(project_key)
-        if result.is_success:
-            analysis['project_info'] = result.data
-        else:
-            analysis['errors'].append(f'Project info: {result.error}')
-        
-        # Get releases
-        result = get_releases(project_key)
-        if result.is_success:
-            analysis['releases'] = result.data
-        else:
-            analysis['errors'].append(f'Releases: {result.error}')
-        
-        # Get components
-        result = get_components(project_key)
-        if result.is_success:
-            analysis['components'] = result.data
-        else:
-            analysis['errors'].append(f'Components: {result.error}')
-        
-        # Get workflows
-        result = get_project_workflows(project_key)
-        if result.is_success:
-            analysis['workflows'] = result.data
-        else:
-            analysis['errors'].append(f'Workflows: {result.error}')
+        # (output key, tool, error label, TTL-cached). The lookups are
+        # independent HTTP calls, so issue them together; everything but the
+        # release list is slow-changing and cached.
+        calls = (
+            ('project_info', get_project_info, 'Project info', True),
+            ('releases', get_releases, 'Releases', False),
+            ('components', get_components, 'Components', True),
+            ('workflows', get_project_workflows, 'Workflows', True),
+            ('issue_types', get_project_issue_types, 'Issue types', True),
+        )
+        submit = _ANALYSIS_EXECUTOR.submit
+        futures = [
+            (key, label, submit(_cached_metadata, fn, project_key) if cached
+             else submit(fn, project_key))
+            for key, fn, label, cached in calls
+        ]
         
-        # Get issue types
-        result = get_project_issue_types(project_key)
-        if result.is_success:
-            analysis['issue_types'] = result.data
-        else:
-            analysis['errors'].append(f'Issue types: {result.error}')
+        for key, label, future in futures:
+            result = future.result()
+            if result.is_success:
+                analysis[key] = result.data
+                if key == 'releases':
+                    self._releases_cache[project_key] = result.data
+            else:
+                analysis['errors'].append(f'{label}: {result.error}')
         
         # Add summary statistics
         analysis['summary'] = {
@@ -198,6 +254,18 @@ Focus on information relevant for release planning.'''
         
         return analysis
     
+    def clear_release_cache(self, project_key: Optional[str] = None) -> None:
+        '''
+        Forget cached release lists (e.g. after versions were created).
+        
+        Input:
+            project_key: Project to forget; None clears every project.
+        '''
+        if project_key is None:
+            self._releases_cache.clear()
+        else:
+            self._releases_cache.pop(project_key, None)
+    
     def get_release_structure(
         self,
         project_key: str,
@@ -215,54 +283,107 @@ Focus on information relevant for release planning.'''
         '''
         log.debug(f'get_release_structure(project_key={project_key})')
         
-        from tools.jira_tools import get_releases, get_release_tickets
+        from tools.jira_tools import get_releases, search_tickets
         
         structure = {
             'project_key': project_key,
             'releases': []
         }
         
-        # Get releases
-        result = get_releases(project_key, pattern=release_pattern, include_released=False)
-        if result.is_error:
-            return {'error': result.error}
-        
-        releases = result.data
+        # Get unreleased versions, from the analyze_project list when we have it
+        compiled = re.compile(release_pattern, re.IGNORECASE) if release_pattern else None
+        cached = self._releases_cache.get(project_key)
+        if cached is not None:
+            releases = [
+                r for r in cached
+                if not r.get('released')
+                and (compiled is None or compiled.search(r['name']))
+            ]
+        else:
+            result = get_releases(project_key, pattern=compiled, include_released=False)
+            if result.is_error:
+                return {'error': result.error}
+            releases = result.data
         
-        # Get tickets for each release
+        release_map = {}
         for release in releases:
-            release_name = release['name']
-            
-            tickets_result = get_release_tickets(project_key, release_name, limit=200)
-            
             release_data = {
-                'name': release_name,
+                'name': release['name'],
                 'id': release['id'],
                 'release_date': release.get('releaseDate'),
                 'tickets': [],
                 'ticket_count': 0,
-                'by_type': {},
-                'by_status': {}
+                'by_type': Counter(),
+                'by_status': Counter()
             }
-            
-            if tickets_result.is_success:
-                tickets = tickets_result.data
-                release_data['tickets'] = tickets
-                release_data['ticket_count'] = len(tickets)
-                
-                # Group by type
-                for ticket in tickets:
-                    ticket_type = ticket.get('type', 'Unknown')
-                    if ticket_type not in release_data['by_type']:
-                        release_data['by_type'][ticket_type] = []
-                    release_data['by_type'][ticket_type].append(ticket['key'])
-                    
-                    # Group by status
-                    status = ticket.get('status', 'Unknown')
-                    if status not in release_data['by_status']:
-                        release_data['by_status'][status] = []
-                    release_data['by_status'][status].append(ticket['key'])
-            
+            release_map[release['name']] = release_data
             structure['releases'].append(release_data)
         
+        if not release_map:
+            return structure
+        
+        # One paged search across all releases instead of one per release;
+        # tickets are then filed under each of their fix versions
+        names = ', '.join(_jql_quote(name) for name in release_map)
+        limit = RELEASE_TICKET_LIMIT * len(release_map)
+        tickets_result = search_tickets(
+            f'project = {project_key} AND fixVersion IN ({names}) '
+            f'ORDER BY created DESC',
+            limit=limit,
+            fields=RELEASE_TICKET_FIELDS,
+            batch_size=RELEASE_TICKET_BATCH_SIZE,
+        )
+        if tickets_result.is_error:
+            log.warning(f'Failed to get release tickets: {tickets_result.error}')
+            tickets = []
+        else:
+            tickets = tickets_result.data
+        
+        for ticket in tickets:
+            for version in ticket.get('fix_versions', []):
+                release_data = release_map.get(version)
+                if release_data is not None:
+                    self._file_release_ticket(release_data, ticket)
+        
+        # A truncated search can starve releases with older tickets: busy
+        # releases fill the shared limit first.  Fetch any release left
+        # under its cap on its own.
+        if len(tickets) >= limit:
+            for name, release_data in release_map.items():
+                if len(release_data['tickets']) >= RELEASE_TICKET_LIMIT:
+                    continue
+                release_result = search_tickets(
+                    f'project = {project_key} AND fixVersion = {_jql_quote(name)} '
+                    f'ORDER BY created DESC',
+                    limit=RELEASE_TICKET_LIMIT,
+                    fields=RELEASE_TICKET_FIELDS,
+                )
+                if release_result.is_error:
+                    log.warning(
+                        f'Failed to get tickets for {name}: {release_result.error}'
+                    )
+                    continue
+                release_data['tickets'] = []
+                release_data['by_type'] = Counter()
+                release_data['by_status'] = Counter()
+                for ticket in release_result.data:
+                    self._file_release_ticket(release_data, ticket)
+        
+        # Hand back plain dicts
+        for release_data in structure['releases']:
+            release_data['ticket_count'] = len(release_data['tickets'])
+            release_data['by_type'] = dict(release_data['by_type'])
+            release_data['by_status'] = dict(release_data['by_status'])
+        
         return structure
+    
+    @staticmethod
+    def _file_release_ticket(release_data: Dict[str, Any], ticket: Dict[str, Any]) -> None:
+        '''Add a ticket to a release's list and counts, up to RELEASE_TICKET_LIMIT.'''
+        if len(release_data['tickets']) >= RELEASE_TICKET_LIMIT:
+            return
+        release_data['tickets'].append(ticket)
+        
+        # Count by type and status; the keys live in 'tickets'
+        release_data['by_type'][ticket.get('type', 'Unknown')] += 1
+        release_data['by_status'][ticket.get('status', 'Unknown')] += 1
@@ -12,19 +12,26 @@
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+from dataclasses import dataclass, field, fields
+from functools import cached_property
 
 from agents.base import BaseAgent, AgentConfig, AgentResponse
-from agents.jira_analyst import JiraAnalystAgent
-from agents.planning_agent import PlanningAgent
-from agents.vision_analyzer import VisionAnalyzerAgent
-from agents.review_agent import ReviewAgent
 
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
-@dataclass
+# Report rules shared by the formatters
+_HDR = '=' * 60
+_SEP = '-' * 40
+_WIDE_SEP = '-' * 60
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a
+# regular instance dict.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class WorkflowState:
     '''
     State of the release planning workflow.
@@ -50,18 +57,19 @@ class WorkflowState:
     errors: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'roadmap_files': self.roadmap_files,
-            'org_chart_file': self.org_chart_file,
-            'project_key': self.project_key,
-            'roadmap_data': self.roadmap_data,
-            'org_chart_data': self.org_chart_data,
-            'jira_state': self.jira_state,
-            'release_plan': self.release_plan,
-            'execution_results': self.execution_results,
-            'current_step': self.current_step,
-            'errors': self.errors
-        }
+        '''Shallow field -> value mapping; nested data is shared, not copied.'''
+        return {name: getattr(self, name) for name in _WORKFLOW_STATE_FIELDS}
+
+
+_WORKFLOW_STATE_FIELDS = tuple(f.name for f in fields(WorkflowState))
+
+
+class StepResult(NamedTuple):
+    '''
+    Outcome of one step of the full workflow.
+    '''
+    name: str
+    response: AgentResponse
 
 
 class ReleasePlanningOrchestrator(BaseAgent):
@@ -94,15 +102,35 @@ class ReleasePlanningOrchestrator(BaseAgent):
         
         super().__init__(config=config, **kwargs)
         
-        # Initialize sub-agents
-        self.vision_analyzer = VisionAnalyzerAgent()
-        self.jira_analyst = JiraAnalystAgent()
-        self.planning_agent = PlanningAgent()
-        self.review_agent = ReviewAgent()
-        
         # Workflow state
         self.state = WorkflowState()
 
+    # ------------------------------------------------------------------
+    # Sub-agents
+    # ------------------------------------------------------------------
+    # Each is imported and constructed on first access, so a mode only pays
+    # for the agents (and their Jira/LLM clients) it actually uses.
+
+    @cached_property
+    def vision_analyzer(self):
+        from agents.vision_analyzer import VisionAnalyzerAgent
+        return VisionAnalyzerAgent()
+
+    @cached_property
+    def jira_analyst(self):
+        from agents.jira_analyst import JiraAnalystAgent
+        return JiraAnalystAgent()
+
+    @cached_property
+    def planning_agent(self):
+        from agents.planning_agent import PlanningAgent
+        return PlanningAgent()
+
+    @cached_property
+    def review_agent(self):
+        from agents.review_agent import ReviewAgent
+        return ReviewAgent()
+
     # ------------------------------------------------------------------
     # Prompt loading
     # ------------------------------------------------------------------
@@ -170,25 +198,45 @@ class ReleasePlanningOrchestrator(BaseAgent):
         '''Run only the analysis phase.'''
         self.state.current_step = 'analysis'
         
-        # Analyze roadmap files
-        if self.state.roadmap_files:
-            self.state.roadmap_data = self.vision_analyzer.analyze_multiple(
-                self.state.roadmap_files
-            )
-        
-        # Analyze org chart
-        if self.state.org_chart_file:
-            from tools.drawio_tools import get_responsibilities
-            result = get_responsibilities(self.state.org_chart_file)
-            if result.is_success:
-                self.state.org_chart_data = result.data
-            else:
-                self.state.errors.append(f'Org chart: {result.error}')
-        
-        # Analyze Jira state
-        self.state.jira_state = self.jira_analyst.analyze_project(
-            self.state.project_key
-        )
+        # Roadmap vision, org chart parsing and Jira analysis share no data,
+        # so run them side by side and collect the results in order. Parts
+        # already populated (e.g. a re-entered workflow) are not recomputed.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            roadmap_future = None
+            if self.state.roadmap_files and not self.state.roadmap_data:
+                roadmap_future = executor.submit(
+                    self.vision_analyzer.analyze_multiple_parallel,
+                    self.state.roadmap_files,
+                )
+            
+            org_chart_future = None
+            if self.state.org_chart_file and not self.state.org_chart_data:
+                from tools.drawio_tools import get_responsibilities
+                org_chart_future = executor.submit(
+                    get_responsibilities, self.state.org_chart_file
+                )
+            
+            jira_future = None
+            if not self.state.jira_state:
+                jira_future = executor.submit(
+                    self.jira_analyst.analyze_project, self.state.project_key
+                )
+            
+            # Analyze roadmap files
+            if roadmap_future is not None:
+                self.state.roadmap_data = roadmap_future.result()
+            
+            # Analyze org chart
+            if org_chart_future is not None:
+                result = org_chart_future.result()
+                if result.is_success:
+                    self.state.org_chart_data = result.data
+                else:
+                    self.state.errors.append(f'Org chart: {result.error}')
+            
+            # Analyze Jira state
+            if jira_future is not None:
+                self.state.jira_state = jira_future.result()
         
         return AgentResponse.success_response(
             content=self._format_analysis_results(),
@@ -236,16 +284,22 @@ class ReleasePlanningOrchestrator(BaseAgent):
         if response.success:
             self.state.execution_results = response.metadata.get('results', [])
         
+        # Execution may have changed the project; don't serve stale metadata
+        from agents.jira_analyst import invalidate_metadata_cache
+        invalidate_metadata_cache(self.state.project_key)
+        if 'jira_analyst' in self.__dict__:
+            self.jira_analyst.clear_release_cache(self.state.project_key)
+        
         return response
     
     def _run_full_workflow(self) -> AgentResponse:
         '''Run the complete workflow with human review.'''
-        results = []
+        results: List[StepResult] = []
         
         # Step 1: Analysis
         log.info('Step 1: Analyzing inputs...')
         analysis_result = self._run_analysis()
-        results.append(('analysis', analysis_result))
+        results.append(StepResult('analysis', analysis_result))
         
         if not analysis_result.success:
             return AgentResponse.error_response(
@@ -255,7 +309,7 @@ class ReleasePlanningOrchestrator(BaseAgent):
         # Step 2: Planning
         log.info('Step 2: Creating release plan...')
         planning_result = self._run_planning()
-        results.append(('planning', planning_result))
+        results.append(StepResult('planning', planning_result))
         
         if not planning_result.success:
             return AgentResponse.error_response(
@@ -268,7 +322,7 @@ class ReleasePlanningOrchestrator(BaseAgent):
             'plan': self.state.release_plan,
             'mode': 'review'
         })
-        results.append(('review', review_result))
+        results.append(StepResult('review', review_result))
         
         # Return the plan for human review
         # Execution will be triggered separately after approval
@@ -290,122 +344,125 @@ class ReleasePlanningOrchestrator(BaseAgent):
     
     def _format_analysis_results(self) -> str:
         '''Format analysis results for display.'''
-        lines = [
-            '=' * 60,
-            'ANALYSIS RESULTS',
-            '=' * 60,
-            ''
-        ]
+        return '\n'.join(self._analysis_lines())
+    
+    def _analysis_lines(self) -> Iterator[str]:
+        '''Yield the lines of the analysis results report.'''
+        yield _HDR
+        yield 'ANALYSIS RESULTS'
+        yield _HDR
+        yield ''
         
         # Roadmap data
-        lines.append('ROADMAP DATA:')
-        lines.append('-' * 40)
+        yield 'ROADMAP DATA:'
+        yield _SEP
         rd = self.state.roadmap_data
-        lines.append(f"  Files analyzed: {len(rd.get('files_analyzed', []))}")
-        lines.append(f"  Releases found: {len(rd.get('releases', []))}")
-        lines.append(f"  Features found: {len(rd.get('features', []))}")
-        lines.append(f"  Timeline items: {len(rd.get('timeline', []))}")
+        yield f"  Files analyzed: {len(rd.get('files_analyzed', []))}"
+        yield f"  Releases found: {len(rd.get('releases', []))}"
+        yield f"  Features found: {len(rd.get('features', []))}"
+        yield f"  Timeline items: {len(rd.get('timeline', []))}"
         
         if rd.get('releases'):
-            lines.append('\n  Releases:')
+            yield '\n  Releases:'
             for r in rd['releases'][:5]:
-                lines.append(f"    - {r.get('version', 'Unknown')}")
+                yield f"    - {r.get('version', 'Unknown')}"
         
         # Jira state
-        lines.append('\nJIRA STATE:')
-        lines.append('-' * 40)
+        yield '\nJIRA STATE:'
+        yield _SEP
         js = self.state.jira_state
         summary = js.get('summary', {})
-        lines.append(f"  Existing releases: {summary.get('total_releases', 0)}")
-        lines.append(f"  Unreleased: {summary.get('unreleased_count', 0)}")
-        lines.append(f"  Components: {summary.get('component_count', 0)}")
+        yield f"  Existing releases: {summary.get('total_releases', 0)}"
+        yield f"  Unreleased: {summary.get('unreleased_count', 0)}"
+        yield f"  Components: {summary.get('component_count', 0)}"
         
         # Org chart
         if self.state.org_chart_data:
-            lines.append('\nORG CHART:')
-            lines.append('-' * 40)
+            yield '\nORG CHART:'
+            yield _SEP
             oc = self.state.org_chart_data
-            lines.append(f"  Areas: {len(oc.get('by_area', {}))}")
-            lines.append(f"  Team leads: {len(oc.get('team_leads', []))}")
+            yield f"  Areas: {len(oc.get('by_area', {}))}"
+            yield f"  Team leads: {len(oc.get('team_leads', []))}"
         
         # Errors
         if self.state.errors:
-            lines.append('\nERRORS:')
-            lines.append('-' * 40)
+            yield '\nERRORS:'
+            yield _SEP
             for error in self.state.errors:
-                lines.append(f"  ! {error}")
-        
-        lines.append('')
-        lines.append('=' * 60)
+                yield f"  ! {error}"
         
-        return '\n'.join(lines)
+        yield ''
+        yield _HDR
     
     def _format_plan(self) -> str:
         '''Format the release plan for display.'''
-        lines = [
-            '=' * 60,
-            'RELEASE PLAN',
-            '=' * 60,
-            ''
-        ]
+        return '\n'.join(self._plan_lines())
+    
+    def _plan_lines(self) -> Iterator[str]:
+        '''Yield the lines of the release plan report.'''
+        yield _HDR
+        yield 'RELEASE PLAN'
+        yield _HDR
+        yield ''
         
         plan = self.state.release_plan
         
-        lines.append(f"Project: {plan.get('project_key')}")
-        lines.append(f"Total releases: {plan.get('total_releases', 0)}")
-        lines.append(f"Total tickets: {plan.get('total_tickets', 0)}")
-        lines.append('')
+        yield f"Project: {plan.get('project_key')}"
+        yield f"Total releases: {plan.get('total_releases', 0)}"
+        yield f"Total tickets: {plan.get('total_tickets', 0)}"
+        yield ''
         
         for release in plan.get('releases', []):
-            lines.append(f"\nRELEASE: {release.get('name')}")
-            lines.append('-' * 40)
+            yield f"\nRELEASE: {release.get('name')}"
+            yield _SEP
             
             if release.get('release_date'):
-                lines.append(f"  Date: {release['release_date']}")
+                yield f"  Date: {release['release_date']}"
             
-            lines.append(f"  Tickets: {len(release.get('tickets', []))}")
+            tickets = release.get('tickets') or []
+            ticket_count = len(tickets)
+            yield f"  Tickets: {ticket_count}"
             
-            for ticket in release.get('tickets', [])[:10]:
+            for ticket in tickets[:10]:
                 issue_type = ticket.get('issue_type', 'Story')
                 summary = ticket.get('summary', '')[:50]
-                lines.append(f"    [{issue_type}] {summary}")
+                yield f"    [{issue_type}] {summary}"
             
-            if len(release.get('tickets', [])) > 10:
-                lines.append(f"    ... and {len(release['tickets']) - 10} more")
+            if ticket_count > 10:
+                yield f"    ... and {ticket_count - 10} more"
         
-        lines.append('')
-        lines.append('=' * 60)
+        yield ''
+        yield _HDR
         
         if plan.get('summary'):
-            lines.append('')
-            lines.append(plan['summary'])
-        
-        return '\n'.join(lines)
+            yield ''
+            yield plan['summary']
     
     def _format_full_workflow_results(
         self,
-        results: List[tuple]
+        results: List[StepResult]
     ) -> str:
         '''Format full workflow results.'''
-        lines = [
-            '=' * 60,
-            'RELEASE PLANNING WORKFLOW COMPLETE',
-            '=' * 60,
-            ''
-        ]
-        
-        for step_name, result in results:
-            status = '✓' if result.success else '✗'
-            lines.append(f'{status} {step_name.upper()}')
-        
-        lines.append('')
-        lines.append('-' * 60)
-        lines.append('')
-        lines.append('The release plan is ready for review.')
-        lines.append('Please review the plan above and approve items for execution.')
-        lines.append('')
-        lines.append('To execute approved items, call execute_approved_plan()')
-        lines.append('')
-        lines.append('=' * 60)
-        
-        return '\n'.join(lines)
+        return '\n'.join(self._workflow_lines(results))
+    
+    @staticmethod
+    def _workflow_lines(results: List[StepResult]) -> Iterator[str]:
+        '''Yield the lines of the full workflow summary.'''
+        yield _HDR
+        yield 'RELEASE PLANNING WORKFLOW COMPLETE'
+        yield _HDR
+        yield ''
+        
+        for step in results:
+            status = '✓' if step.response.success else '✗'
+            yield f'{status} {step.name.upper()}'
+        
+        yield ''
+        yield _WIDE_SEP
+        yield ''
+        yield 'The release plan is ready for review.'
+        yield 'Please review the plan above and approve items for execution.'
+        yield ''
+        yield 'To execute approved items, call execute_approved_plan()'
+        yield ''
+        yield _HDR
@@ -9,21 +9,117 @@
 #
 ##########################################################################################
 
+import functools
+import hashlib
+import json
 import logging
 import os
+import re
 import sys
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple
 from dataclasses import dataclass, field
 
 from agents.base import BaseAgent, AgentConfig, AgentResponse
-from tools.file_tools import FileTools
+from tools.base import ToolResult
+from core import json_utils
 
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a
+# regular instance dict.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
+TEMPLATE_DIR = os.path.join('data', 'templates')
 
-@dataclass
+# Issue types and priority the planner assigns
+ISSUE_TYPE_EPIC = 'Epic'
+ISSUE_TYPE_STORY = 'Story'
+PRIORITY_MEDIUM = 'Medium'
+
+# Jira Cloud's bulk issue-create endpoint accepts at most 50 issues per call
+BULK_CREATE_BATCH_SIZE = 50
+
+# Plans remembered per agent, keyed by a fingerprint of create_plan's inputs
+PLAN_CACHE_SIZE = 16
+
+# Fallback keywords per component area, used when no component name appears
+# in a feature's text; an area maps to the first component containing it.
+_COMPONENT_KEYWORDS = MappingProxyType({
+    'driver': ('driver', 'kernel', 'module'),
+    'firmware': ('firmware', 'fw', 'embedded'),
+    'tools': ('tool', 'utility', 'cli'),
+    'documentation': ('doc', 'documentation', 'guide'),
+    'testing': ('test', 'qa', 'validation'),
+})
+
+
+@functools.lru_cache(maxsize=4)
+def _read_templates(
+    template_dir: str,
+    signature: Tuple[Tuple[str, int], ...],
+) -> Dict[str, Dict]:
+    '''
+    Parse the JSON ticket templates in a directory.
+
+    Cached per (directory, (file name, mtime) pairs): repeated PlanningAgent
+    construction reuses the parsed templates, while adding, removing or
+    editing a template changes the key and re-reads the directory.
+    Files are read as bytes and parsed with json_utils (orjson when
+    available).
+    '''
+    templates = {}
+    for filename, _ in signature:
+        try:
+            with open(os.path.join(template_dir, filename), 'rb') as f:
+                raw = f.read()
+            templates[filename[:-len('.json')]] = json_utils.loads(raw)
+        except Exception as e:
+            log.warning('Failed to load template %s: %s', filename, e)
+    return templates
+
+
+@functools.lru_cache(maxsize=32)
+def _component_regex(
+    components: Tuple[str, ...],
+) -> Tuple[Optional[Pattern[str]], Tuple[str, ...]]:
+    '''
+    Build _match_component's matcher for one component list.
+
+    The alternatives are the component names (in order) followed by the
+    keywords of every area that resolves to a component (in area order).
+    Each is its own group inside a lookahead, so every text position reports
+    the first alternative starting there. The lowest group seen anywhere is
+    therefore the highest-priority substring present.
+
+    Output:
+        (pattern, components by group number - 1); pattern is None when
+        there is nothing to match.
+    '''
+    names = [(c.lower(), c) for c in components]
+    alternatives: Dict[str, str] = {}
+    for lower, component in names:
+        alternatives.setdefault(lower, component)
+    for area, area_keywords in _COMPONENT_KEYWORDS.items():
+        component = next((c for lower, c in names if area in lower), None)
+        if component is None:
+            continue
+        for keyword in area_keywords:
+            alternatives.setdefault(keyword, component)
+    
+    if not alternatives:
+        return None, ()
+    pattern = re.compile(
+        '(?=' + '|'.join(f'({re.escape(alt)})' for alt in alternatives) + ')',
+        re.IGNORECASE,
+    )
+    return pattern, tuple(alternatives.values())
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PlannedTicket:
     '''
     Represents a planned Jira ticket.
@@ -31,13 +127,13 @@ class PlannedTicket:
     key: Optional[str] = None  # Will be assigned after creation
     summary: str = ''
     description: str = ''
-    issue_type: str = 'Story'
+    issue_type: str = ISSUE_TYPE_STORY
     parent_key: Optional[str] = None
     components: List[str] = field(default_factory=list)
     fix_versions: List[str] = field(default_factory=list)
     assignee: Optional[str] = None
     labels: List[str] = field(default_factory=list)
-    priority: str = 'Medium'
+    priority: str = PRIORITY_MEDIUM
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -46,15 +142,15 @@ class PlannedTicket:
             'description': self.description,
             'issue_type': self.issue_type,
             'parent_key': self.parent_key,
-            'components': self.components,
-            'fix_versions': self.fix_versions,
+            'components': self.components.copy(),
+            'fix_versions': self.fix_versions.copy(),
             'assignee': self.assignee,
-            'labels': self.labels,
+            'labels': self.labels.copy(),
             'priority': self.priority
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PlannedRelease:
     '''
     Represents a planned release version.
@@ -75,7 +171,7 @@ class PlannedRelease:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ReleasePlan:
     '''
     Complete release plan with versions and tickets.
@@ -84,14 +180,70 @@ class ReleasePlan:
     releases: List[PlannedRelease] = field(default_factory=list)
     summary: str = ''
     
+    @property
+    def total_tickets(self) -> int:
+        return sum(len(r.tickets) for r in self.releases)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             'project_key': self.project_key,
             'releases': [r.to_dict() for r in self.releases],
             'summary': self.summary,
             'total_releases': len(self.releases),
-            'total_tickets': sum(len(r.tickets) for r in self.releases)
+            'total_tickets': self.total_tickets
         }
+    
+    def to_bulk_payload(
+        self,
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        '''
+        Yield the plan's tickets in batches for bulk creation.
+        
+        Input:
+            batch_size: Maximum tickets per batch.
+        
+        Output:
+            Lists of ticket dicts, in plan order, keyed like create_ticket()'s
+            arguments.
+        '''
+        batch = []
+        for release in self.releases:
+            for ticket in release.tickets:
+                batch.append({
+                    'project_key': self.project_key,
+                    'summary': ticket.summary,
+                    'issue_type': ticket.issue_type,
+                    'description': ticket.description,
+                    'assignee': ticket.assignee,
+                    'components': ticket.components.copy(),
+                    'fix_versions': ticket.fix_versions.copy(),
+                    'labels': ticket.labels.copy(),
+                    'parent_key': ticket.parent_key,
+                })
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+    
+    def to_json(self) -> bytes:
+        '''
+        Serialize to_dict()'s content as UTF-8 JSON.
+        
+        With orjson the releases and tickets are encoded straight from the
+        dataclasses (field order matches to_dict), skipping the intermediate
+        dicts; otherwise this is json.dumps(to_dict()).
+        '''
+        if json_utils.orjson is None:
+            return json.dumps(self.to_dict()).encode('utf-8')
+        return json_utils.orjson.dumps({
+            'project_key': self.project_key,
+            'releases': self.releases,
+            'summary': self.summary,
+            'total_releases': len(self.releases),
+            'total_tickets': self.total_tickets
+        })
 
 
 class PlanningAgent(BaseAgent):
@@ -121,10 +273,57 @@ class PlanningAgent(BaseAgent):
             instruction=instruction
         )
         
-        # Initialize with file tools for reading templates
-        file_tools = FileTools()
+        super().__init__(config=config, **kwargs)
+        
+        # File tools (for reading templates) are only needed by the LLM
+        # path; create_plan() never touches them
+        self._file_tools = None
         
-        super().__init__(config=config, tools=[file_tools], **kwargs)
+        # Load ticket templates if available
+        self.templates = self._load_templates()
+        
+        # create_plan results, most recently used last
+        self._plan_cache: 'OrderedDict[str, ReleasePlan]' = OrderedDict()
+
+    @property
+    def file_tools(self):
+        '''FileTools collection, created and registered on first use.'''
+        self._ensure_file_tools()
+        return self._file_tools
+
+    def _ensure_file_tools(self) -> None:
+        '''
+        Create and register the FileTools collection if not done yet.
+
+        Called from every entry point that exposes or runs tools, so the
+        LLM path always sees them while create_plan() never pays for them.
+        '''
+        if self._file_tools is None:
+            from tools.file_tools import FileTools
+            self._file_tools = FileTools()
+            self.register_tool(self._file_tools)
+
+    def _run_with_tools(
+        self,
+        user_input: str,
+        max_iterations: Optional[int] = None,
+        timeout: Optional[int] = None
+    ) -> AgentResponse:
+        '''Register the file tools, then run the base tool loop.'''
+        self._ensure_file_tools()
+        return super()._run_with_tools(
+            user_input, max_iterations=max_iterations, timeout=timeout
+        )
+
+    def get_tool_schemas(self) -> List[Dict[str, Any]]:
+        '''Tool schemas for the LLM, including the lazily added file tools.'''
+        self._ensure_file_tools()
+        return super().get_tool_schemas()
+
+    def execute_tool(self, name: str, arguments: Dict[str, Any]) -> ToolResult:
+        '''Execute a tool, registering the file tools first if needed.'''
+        self._ensure_file_tools()
+        return super().execute_tool(name, arguments)
 
     # ------------------------------------------------------------------
     # Prompt loading
@@ -141,27 +340,21 @@ class PlanningAgent(BaseAgent):
             except Exception as e:
                 log.warning(f'Failed to load planning agent prompt: {e}')
         return None
-        
-        # Load ticket templates if available
-        self.templates = self._load_templates()
     
     def _load_templates(self) -> Dict[str, Dict]:
         '''Load ticket templates from data/templates directory.'''
-        templates = {}
-        template_dir = 'data/templates'
-        
-        if os.path.exists(template_dir):
-            for filename in os.listdir(template_dir):
-                if filename.endswith('.json'):
-                    try:
-                        import json
-                        with open(os.path.join(template_dir, filename)) as f:
-                            template_name = filename.replace('.json', '')
-                            templates[template_name] = json.load(f)
-                    except Exception as e:
-                        log.warning(f'Failed to load template {filename}: {e}')
-        
-        return templates
+        template_dir = os.path.abspath(TEMPLATE_DIR)
+        try:
+            with os.scandir(template_dir) as entries:
+                signature = tuple(sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in entries
+                    if entry.name.endswith('.json')
+                ))
+        except OSError:
+            return {}
+        
+        return dict(_read_templates(template_dir, signature))
     
     def run(self, input_data: Any) -> AgentResponse:
         '''
@@ -173,11 +366,13 @@ class PlanningAgent(BaseAgent):
                 - jira_state: Current Jira project state
                 - org_chart: Organization chart data
                 - project_key: Target Jira project
+                - use_llm: False to build the plan with create_plan()
+                  instead of prompting the LLM (default True)
         
         Output:
             AgentResponse with the release plan.
         '''
-        log.debug(f'PlanningAgent.run()')
+        log.debug('PlanningAgent.run()')
         
         if not isinstance(input_data, dict):
             return AgentResponse.error_response('Invalid input: expected dict with roadmap_data, jira_state, org_chart')
@@ -190,6 +385,14 @@ class PlanningAgent(BaseAgent):
         if not project_key:
             return AgentResponse.error_response('No project_key provided')
         
+        # Deterministic path: no prompt to format
+        if not input_data.get('use_llm', True):
+            plan = self.create_plan(project_key, roadmap_data, jira_state, org_chart)
+            return AgentResponse.success_response(
+                content=plan.summary,
+                metadata={'plan': plan.to_dict()}
+            )
+        
         # Build the planning request
         user_input = f'''Create a release plan for project "{project_key}".
 
@@ -232,10 +435,53 @@ Output the plan in a structured format that can be reviewed and executed.'''
             org_chart: Organization chart data.
         
         Output:
-            ReleasePlan object with planned releases and tickets.
+            ReleasePlan object with planned releases and tickets.  Plans are
+            memoized on their inputs, so the object may be shared with
+            earlier and later calls: treat it as read-only (to_dict() gives
+            an independent copy).
         '''
-        log.debug(f'create_plan(project_key={project_key})')
+        log.debug('create_plan(project_key=%s)', project_key)
+        
+        # The plan depends only on the inputs, so identical inputs reuse
+        # the earlier plan object as-is.
+        try:
+            key = self._plan_inputs_hash(project_key, roadmap_data, jira_state, org_chart)
+        except json_utils.ENCODE_ERRORS:
+            key = None
+        
+        if key is not None and key in self._plan_cache:
+            self._plan_cache.move_to_end(key)
+            return self._plan_cache[key]
         
+        plan = self._build_plan(project_key, roadmap_data, jira_state, org_chart)
+        
+        if key is not None:
+            self._plan_cache[key] = plan
+            if len(self._plan_cache) > PLAN_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
+        
+        return plan
+    
+    @staticmethod
+    def _plan_inputs_hash(
+        project_key: str,
+        roadmap_data: Dict[str, Any],
+        jira_state: Dict[str, Any],
+        org_chart: Dict[str, Any]
+    ) -> str:
+        '''Fingerprint create_plan's inputs (BLAKE2b-128 over canonical JSON).'''
+        inputs = [project_key, roadmap_data, jira_state, org_chart]
+        blob = json_utils.dumps(inputs, sort_keys=True)
+        return hashlib.blake2b(blob, digest_size=16).hexdigest()
+    
+    def _build_plan(
+        self,
+        project_key: str,
+        roadmap_data: Dict[str, Any],
+        jira_state: Dict[str, Any],
+        org_chart: Dict[str, Any]
+    ) -> ReleasePlan:
+        '''Build a release plan from scratch (see create_plan).'''
         plan = ReleasePlan(project_key=project_key)
         
         # Extract releases from roadmap
@@ -244,15 +490,39 @@ Output the plan in a structured format that can be reviewed and executed.'''
         roadmap_timeline = roadmap_data.get('timeline', [])
         
         # Get existing releases to avoid duplicates
-        existing_releases = set()
-        for release in jira_state.get('releases', []):
-            existing_releases.add(release.get('name', ''))
+        existing_releases = {
+            release.get('name', '') for release in jira_state.get('releases', [])
+        }
         
         # Get components for assignment
         components = {c['name']: c for c in jira_state.get('components', [])}
-        
-        # Get responsibilities from org chart
-        responsibilities = org_chart.get('by_area', {})
+        component_names = tuple(components)
+        
+        # Get responsibilities from org chart, reduced to one owner per area
+        area_owners = self._area_owners(org_chart.get('by_area', {}))
+        
+        # Component and owner depend only on the feature text, so resolve
+        # them once here rather than once per release; owners once per
+        # component
+        feature_rows = []
+        owners = {}
+        for feature in roadmap_features:
+            feature_text = feature.get('text', '')
+            if not feature_text:
+                continue
+            component = self._match_component(feature_text, component_names)
+            if component not in owners:
+                owners[component] = self._match_assignee(component, area_owners)
+            feature_rows.append((
+                feature_text[:100],  # Truncate for summary
+                feature_text,
+                component,
+                owners[component],
+            ))
+        
+        timeline_pairs = [
+            (item.get('context', ''), item.get('date')) for item in roadmap_timeline
+        ]
         
         # Create releases from roadmap
         for roadmap_release in roadmap_releases:
@@ -261,50 +531,38 @@ Output the plan in a structured format that can be reviewed and executed.'''
                 continue
             
             # Find timeline for this release
-            release_date = None
-            for timeline_item in roadmap_timeline:
-                if version in timeline_item.get('context', ''):
-                    release_date = timeline_item.get('date')
-                    break
-            
-            planned_release = PlannedRelease(
-                name=version,
-                description=f'Release {version}',
-                release_date=release_date
+            release_date = next(
+                (date for context, date in timeline_pairs if version in context),
+                None,
             )
             
-            # Create Epic for the release
+            # Epic for the release, then a Story per feature
             epic = PlannedTicket(
                 summary=f'Release {version} Implementation',
                 description=f'Epic for tracking all work in release {version}',
-                issue_type='Epic',
+                issue_type=ISSUE_TYPE_EPIC,
                 fix_versions=[version],
                 labels=['release-tracking']
             )
-            planned_release.tickets.append(epic)
-            
-            # Create Stories from features
-            for feature in roadmap_features:
-                feature_text = feature.get('text', '')
-                if not feature_text:
-                    continue
-                
-                # Determine component based on feature text
-                component = self._match_component(feature_text, list(components.keys()))
-                
-                # Determine assignee based on component and org chart
-                assignee = self._match_assignee(component, responsibilities)
-                
-                story = PlannedTicket(
-                    summary=feature_text[:100],  # Truncate for summary
+            stories = [
+                PlannedTicket(
+                    summary=summary,
                     description=feature_text,
-                    issue_type='Story',
+                    issue_type=ISSUE_TYPE_STORY,
                     parent_key=None,  # Will link to Epic after creation
                     components=[component] if component else [],
                     fix_versions=[version],
                     assignee=assignee
                 )
-                planned_release.tickets.append(story)
+                for summary, feature_text, component, assignee in feature_rows
+            ]
+            
+            planned_release = PlannedRelease(
+                name=version,
+                description=f'Release {version}',
+                release_date=release_date,
+                tickets=[epic, *stories]
+            )
             
             plan.releases.append(planned_release)
         
@@ -315,132 +573,129 @@ Output the plan in a structured format that can be reviewed and executed.'''
     
     def _format_roadmap(self, roadmap_data: Dict) -> str:
         '''Format roadmap data for the prompt.'''
-        lines = []
-        
+        return '\n'.join(self._roadmap_lines(roadmap_data)) or 'No roadmap data available'
+    
+    @staticmethod
+    def _roadmap_lines(roadmap_data: Dict) -> Iterator[str]:
+        '''Yield the prompt lines for the roadmap data.'''
         releases = roadmap_data.get('releases', [])
         if releases:
-            lines.append('Releases:')
+            yield 'Releases:'
             for r in releases[:10]:
-                lines.append(f"  - {r.get('version', 'Unknown')}")
+                yield f"  - {r.get('version', 'Unknown')}"
         
         features = roadmap_data.get('features', [])
         if features:
-            lines.append('\nFeatures:')
+            yield '\nFeatures:'
             for f in features[:20]:
-                lines.append(f"  - {f.get('text', '')[:100]}")
+                yield f"  - {f.get('text', '')[:100]}"
         
         timeline = roadmap_data.get('timeline', [])
         if timeline:
-            lines.append('\nTimeline:')
+            yield '\nTimeline:'
             for t in timeline[:10]:
-                lines.append(f"  - {t.get('date', '')}: {t.get('context', '')[:50]}")
-        
-        return '\n'.join(lines) if lines else 'No roadmap data available'
+                yield f"  - {t.get('date', '')}: {t.get('context', '')[:50]}"
     
     def _format_jira_state(self, jira_state: Dict) -> str:
         '''Format Jira state for the prompt.'''
-        lines = []
-        
+        return '\n'.join(self._jira_state_lines(jira_state)) or 'No Jira state available'
+    
+    @staticmethod
+    def _jira_state_lines(jira_state: Dict) -> Iterator[str]:
+        '''Yield the prompt lines for the Jira state.'''
         project_info = jira_state.get('project_info', {})
         if project_info:
-            lines.append(f"Project: {project_info.get('name', 'Unknown')}")
+            yield f"Project: {project_info.get('name', 'Unknown')}"
         
         releases = jira_state.get('releases', [])
         if releases:
-            lines.append(f'\nExisting Releases ({len(releases)}):')
+            yield f'\nExisting Releases ({len(releases)}):'
             for r in releases[:10]:
                 status = 'Released' if r.get('released') else 'Unreleased'
-                lines.append(f"  - {r.get('name', 'Unknown')} ({status})")
+                yield f"  - {r.get('name', 'Unknown')} ({status})"
         
         components = jira_state.get('components', [])
         if components:
-            lines.append(f'\nComponents ({len(components)}):')
+            yield f'\nComponents ({len(components)}):'
             for c in components[:10]:
-                lines.append(f"  - {c.get('name', 'Unknown')}")
-        
-        return '\n'.join(lines) if lines else 'No Jira state available'
+                yield f"  - {c.get('name', 'Unknown')}"
     
     def _format_org_chart(self, org_chart: Dict) -> str:
         '''Format org chart for the prompt.'''
-        lines = []
-        
+        return '\n'.join(self._org_chart_lines(org_chart)) or 'No org chart available'
+    
+    @staticmethod
+    def _org_chart_lines(org_chart: Dict) -> Iterator[str]:
+        '''Yield the prompt lines for the org chart.'''
         by_area = org_chart.get('by_area', {})
         if by_area:
-            lines.append('Responsibilities by Area:')
-            for area, people in list(by_area.items())[:10]:
+            yield 'Responsibilities by Area:'
+            for area, people in islice(by_area.items(), 10):
                 names = [p.get('name', '') for p in people[:3]]
-                lines.append(f"  - {area}: {', '.join(names)}")
+                yield f"  - {area}: {', '.join(names)}"
         
         team_leads = org_chart.get('team_leads', [])
         if team_leads:
-            lines.append('\nTeam Leads:')
+            yield '\nTeam Leads:'
             for lead in team_leads[:10]:
-                lines.append(f"  - {lead.get('name', '')}: {lead.get('title', '')}")
-        
-        return '\n'.join(lines) if lines else 'No org chart available'
+                yield f"  - {lead.get('name', '')}: {lead.get('title', '')}"
     
-    def _match_component(self, text: str, components: List[str]) -> Optional[str]:
-        '''Match text to a component based on keywords.'''
-        text_lower = text.lower()
-        
-        for component in components:
-            if component.lower() in text_lower:
-                return component
-        
-        # Try keyword matching
-        keyword_map = {
-            'driver': ['driver', 'kernel', 'module'],
-            'firmware': ['firmware', 'fw', 'embedded'],
-            'tools': ['tool', 'utility', 'cli'],
-            'documentation': ['doc', 'documentation', 'guide'],
-            'testing': ['test', 'qa', 'validation'],
-        }
+    def _match_component(self, text: str, components: Sequence[str]) -> Optional[str]:
+        '''Match text to a component by name, then by area keywords.'''
+        pattern, targets = _component_regex(tuple(components))
+        if pattern is None:
+            return None
         
-        for component, keywords in keyword_map.items():
-            if any(kw in text_lower for kw in keywords):
-                # Find matching component
-                for c in components:
-                    if component.lower() in c.lower():
-                        return c
+        best = min((m.lastindex for m in pattern.finditer(text)), default=None)
+        return targets[best - 1] if best is not None else None
+    
+    @staticmethod
+    def _area_owners(responsibilities: Dict[str, List]) -> List[Tuple[str, Optional[str]]]:
+        '''
+        Reduce org-chart responsibilities to (lowercased area, owner) pairs.
         
-        return None
+        The owner is the area's first lead, or else its first person; areas
+        with nobody listed are left out.
+        '''
+        area_owners = []
+        for area, people in responsibilities.items():
+            if not people:
+                continue
+            lead = next((p for p in people if p.get('is_lead')), people[0])
+            area_owners.append((area.lower(), lead.get('name')))
+        return area_owners
     
     def _match_assignee(
         self,
         component: Optional[str],
-        responsibilities: Dict[str, List]
+        area_owners: List[Tuple[str, Optional[str]]]
     ) -> Optional[str]:
-        '''Match component to an assignee based on responsibilities.'''
+        '''Match component to an assignee from _area_owners() pairs.'''
         if not component:
             return None
         
-        # Look for area matching the component
-        for area, people in responsibilities.items():
-            if component.lower() in area.lower() or area.lower() in component.lower():
-                # Return the first lead, or first person
-                for person in people:
-                    if person.get('is_lead'):
-                        return person.get('name')
-                if people:
-                    return people[0].get('name')
+        # First area whose name contains, or is contained in, the component
+        component_lower = component.lower()
+        for area_lower, owner in area_owners:
+            if component_lower in area_lower or area_lower in component_lower:
+                return owner
         
         return None
     
     def _generate_summary(self, plan: ReleasePlan) -> str:
         '''Generate a summary of the release plan.'''
         total_releases = len(plan.releases)
-        total_tickets = sum(len(r.tickets) for r in plan.releases)
-        
-        epic_count = sum(
-            1 for r in plan.releases
-            for t in r.tickets
-            if t.issue_type == 'Epic'
-        )
-        story_count = sum(
-            1 for r in plan.releases
-            for t in r.tickets
-            if t.issue_type == 'Story'
-        )
+        total_tickets = plan.total_tickets
+        
+        # One pass over the tickets for both type counts
+        epic_count = story_count = 0
+        for release in plan.releases:
+            for ticket in release.tickets:
+                issue_type = ticket.issue_type
+                if issue_type == ISSUE_TYPE_EPIC:
+                    epic_count += 1
+                elif issue_type == ISSUE_TYPE_STORY:
+                    story_count += 1
         
         return (
             f'Release Plan Summary:\n'
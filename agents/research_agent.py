@@ -11,22 +11,411 @@
 #
 ##########################################################################################
 
+import hashlib
+import io
 import json
 import logging
 import os
 import re
 import sys
-from typing import Any, Dict, List, Optional
-
-from agents.base import BaseAgent, AgentConfig, AgentResponse
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agents.base import BaseAgent, AgentConfig, AgentResponse, load_prompt_file
 from agents.feature_planning_models import (
     ResearchFinding,
     ResearchReport,
 )
+from core import json_utils
+
+# Tool modules the deterministic research() path calls, imported once; a
+# None sentinel means the module is unavailable.  Tools are looked up on the
+# module at call time.
+try:
+    from tools import web_search_tools
+except ImportError:
+    web_search_tools = None
+
+try:
+    from tools import mcp_tools
+except ImportError:
+    mcp_tools = None
+
+try:
+    from tools import knowledge_tools
+except ImportError:
+    knowledge_tools = None
 
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
+# Upper bound on concurrent read_document calls in _do_document_read.
+DOC_READ_WORKERS = 8
+
+# Characters of each user document kept as a finding; read_document stops
+# extracting once it has this much text.
+DOC_FINDING_CHARS = 3000
+
+# Characters of the pretty-printed MCP response kept as a finding.
+MCP_FINDING_CHARS = 2000
+
+# Research tool results are kept in an in-memory LFU of this many entries.
+# Setting RESEARCH_CACHE_DIR also mirrors them to a JSON-lines file there
+# (readable only by the owner) so later runs can reuse them; cached MCP
+# responses may hold internal data, so nothing is written by default.
+RESEARCH_CACHE_SIZE = 512
+RESEARCH_CACHE_FILE = 'results.jsonl'
+
+# Seconds a cached result stays valid, per tool.  Public web results drift
+# much faster than the internal knowledge base.
+RESEARCH_CACHE_TTL = MappingProxyType({
+    'web_search': 24 * 3600,
+    'mcp_search': 24 * 3600,
+    'search_knowledge': 7 * 24 * 3600,
+    # Whole search reports bundle web results, so they expire with them
+    'research_report': 24 * 3600,
+})
+
+# Keyword extraction: split on non-alphanumeric runs, drop these stop words.
+_TOKEN_SPLIT_PATTERN = re.compile(r'[^a-zA-Z0-9]+')
+_STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'can', 'shall',
+    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
+    'as', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'between', 'out', 'off', 'over', 'under', 'again',
+    'further', 'then', 'once', 'and', 'but', 'or', 'nor', 'not',
+    'so', 'yet', 'both', 'each', 'few', 'more', 'most', 'other',
+    'some', 'such', 'no', 'only', 'own', 'same', 'than', 'too',
+    'very', 'just', 'because', 'if', 'when', 'where', 'how',
+    'what', 'which', 'who', 'whom', 'this', 'that', 'these',
+    'those', 'it', 'its', 'we', 'our', 'us', 'i', 'me', 'my',
+    'you', 'your', 'he', 'she', 'they', 'them', 'their',
+})
+
+# Markdown fallback parser patterns for _parse_report.  A finding is a bullet
+# with a "(... Confidence: HIGH ...)" tag and an optional "Source: ..." entry.
+_SECTION_SPLIT_PATTERN = re.compile(r'\n(?=#{1,3}\s|[A-Z][A-Z\s&]+:)')
+_CONFIDENCE_PATTERN = re.compile(
+    r'[-*]\s+(.+?)\s*\(.*?[Cc]onfidence:\s*(HIGH|MEDIUM|LOW).*?\)',
+    re.IGNORECASE,
+)
+_SOURCE_PATTERN = re.compile(
+    r'\(.*?[Ss]ource:\s*([^,)]+)',
+    re.IGNORECASE,
+)
+
+
+class ResearchCache:
+    '''
+    LFU cache of research tool results, backed by a JSON-lines file.
+
+    Entries are keyed on (tool, query, max_results) and expire after a
+    per-tool TTL.  When full, expired entries go first, then the entry with
+    the lowest count, least recently used first among ties.  Counts use
+    dynamic aging: a new entry starts at the last victim's count, so
+    queries that were popular long ago cannot pin the cache while fresh
+    entries evict each other.
+
+    Counts live in memory; lookups never touch the file.  The file is
+    append-only between compactions, which rewrite it with current counts
+    on load, once it holds more than COMPACT_FACTOR lines per slot, and on
+    compact().
+    '''
+
+    # Appended lines per cache slot before the file is compacted
+    COMPACT_FACTOR = 2
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        capacity: int = RESEARCH_CACHE_SIZE,
+    ):
+        if cache_dir is None:
+            cache_dir = os.getenv('RESEARCH_CACHE_DIR', '')
+        self.path = (
+            os.path.join(os.path.expanduser(cache_dir), RESEARCH_CACHE_FILE)
+            if cache_dir else None
+        )
+        self.capacity = capacity
+        # key -> (expires at, data, hits); most recently used last
+        self._entries: 'OrderedDict[str, Tuple[float, Any, int]]' = OrderedDict()
+        # Count of the last evicted entry; new entries start here
+        self._age = 0
+        # Lines currently in the file
+        self._lines = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    @staticmethod
+    def make_key(
+        tool_name: str,
+        query: str,
+        max_results: Optional[int],
+        version: str = '',
+    ) -> str:
+        '''
+        Build the cache key for one tool call.
+
+        Input:
+            version: Fingerprint of the tool's backing data, if any; a new
+                     version makes earlier entries unreachable.
+        '''
+        raw = f'{tool_name}\0{query}\0{max_results}\0{version}'
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Any:
+        '''Return the cached data for key, or None if missing or expired.'''
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, data, hits = entry
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries[key] = (expires, data, hits + 1)
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: str, data: Any, ttl: float) -> None:
+        '''Store data under key for ttl seconds, keeping its hit count.'''
+        expires = time.time() + ttl
+        with self._lock:
+            self._load()
+            hits = self._entries[key][2] if key in self._entries else None
+            self._remember(key, expires, data, hits)
+            if not self.path:
+                return
+            if self._lines >= self.COMPACT_FACTOR * self.capacity:
+                self._compact()
+            else:
+                self._write_lines([self._record(key)], mode='a')
+                self._lines += 1
+
+    def compact(self) -> None:
+        '''Rewrite the cache file with the live entries and their counts.'''
+        with self._lock:
+            self._load()
+            if self.path:
+                self._compact()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _remember(
+        self,
+        key: str,
+        expires: float,
+        data: Any,
+        hits: Optional[int] = None,
+    ) -> None:
+        '''
+        Insert an entry, evicting when full.  hits=None starts a new entry
+        at the current age.
+        '''
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.capacity:
+            now = time.time()
+            for stale in [k for k, v in self._entries.items() if v[0] <= now]:
+                del self._entries[stale]
+        while len(self._entries) >= self.capacity:
+            # min() keeps the first (least recently used) of equal counts
+            victim = min(self._entries, key=lambda k: self._entries[k][2])
+            self._age = self._entries.pop(victim)[2]
+        self._entries[key] = (expires, data, self._age if hits is None else hits)
+
+    def _compact(self) -> None:
+        '''Rewrite the file from the live entries; caller holds the lock.'''
+        now = time.time()
+        self._write_lines(
+            [self._record(key) for key, entry in self._entries.items()
+             if entry[0] > now],
+            mode='w',
+        )
+        self._lines = len(self._entries)
+
+    def _record(self, key: str) -> Dict[str, Any]:
+        '''Serializable form of one entry.'''
+        expires, data, hits = self._entries[key]
+        return {'key': key, 'expires': expires, 'data': data, 'hits': hits}
+
+    def _load(self) -> None:
+        '''Populate the cache from disk once; caller holds the lock.'''
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        # Replay the log; a later record for a key supersedes earlier ones
+        now = time.time()
+        lines = 0
+        records: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        record = json_utils.loads(line)
+                    except ValueError:
+                        continue
+                    key = record.get('key')
+                    if 'data' in record:
+                        records[key] = record
+                        records.move_to_end(key)
+        except OSError as e:
+            log.warning(f'Failed to load research cache {self.path}: {e}')
+            return
+
+        for key, record in records.items():
+            if record.get('expires', 0) > now:
+                self._remember(key, record['expires'], record['data'],
+                               record.get('hits', 0))
+
+        # Drop expired, evicted and superseded lines
+        self._lines = lines
+        if lines > len(self._entries):
+            self._compact()
+
+    def _write_lines(self, records: List[Dict[str, Any]], mode: str) -> None:
+        '''Write records to the cache file, one JSON object per line.'''
+        # Encode before opening so an unencodable record is skipped rather
+        # than truncating the file or failing the caller's search.
+        lines = []
+        for record in records:
+            try:
+                lines.append(json_utils.dumps(record, default=str) + b'\n')
+            except json_utils.ENCODE_ERRORS as e:
+                log.debug(f'Not caching unencodable record: {e}')
+        flags = os.O_WRONLY | os.O_CREAT | (
+            os.O_APPEND if mode == 'a' else os.O_TRUNC
+        )
+        try:
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+            with os.fdopen(os.open(self.path, flags, 0o600), 'wb') as f:
+                f.writelines(lines)
+        except OSError as e:
+            log.debug(f'Failed to write research cache {self.path}: {e}')
+
+
+def _report_from_dict(data: Dict[str, Any]) -> ResearchReport:
+    '''Rebuild a ResearchReport from its to_dict() form.'''
+    return ResearchReport(
+        domain_overview=data.get('domain_overview', ''),
+        standards_and_specs=[
+            ResearchFinding(**f) for f in data.get('standards_and_specs', [])
+        ],
+        existing_implementations=[
+            ResearchFinding(**f) for f in data.get('existing_implementations', [])
+        ],
+        internal_knowledge=[
+            ResearchFinding(**f) for f in data.get('internal_knowledge', [])
+        ],
+        open_questions=list(data.get('open_questions', [])),
+    )
+
+
+_research_cache: Optional[ResearchCache] = None
+_research_cache_lock = threading.Lock()
+
+
+def get_research_cache() -> ResearchCache:
+    '''Return the process-wide research cache, creating it on first use.'''
+    global _research_cache
+    with _research_cache_lock:
+        if _research_cache is None:
+            _research_cache = ResearchCache()
+        return _research_cache
+
+
+def reset_research_cache() -> None:
+    '''
+    Drop the in-memory research cache after saving its hit counts; the
+    next use reloads from disk.
+    '''
+    global _research_cache
+    with _research_cache_lock:
+        if _research_cache is not None:
+            _research_cache.compact()
+        _research_cache = None
+
+
+def _knowledge_version() -> str:
+    '''Current knowledge-base fingerprint, or '' when the tools are absent.'''
+    if knowledge_tools is None:
+        return ''
+    return knowledge_tools.knowledge_base_version()
+
+
+def _report_cache_key(keywords: List[str]) -> str:
+    '''
+    Cache key for a request's search report: its normalized keyword set, so
+    requests differing only in case, word order, stop words or repeated
+    words share an entry.  Reports embed knowledge-base results, so the
+    key also covers the knowledge files' fingerprint.
+    '''
+    return ResearchCache.make_key(
+        'research_report', ' '.join(sorted(set(keywords))), None,
+        version=_knowledge_version(),
+    )
+
+
+def _cached_search(
+    tool_name: str,
+    fn: Callable,
+    query: str,
+    version: str = '',
+    **kwargs,
+) -> Any:
+    '''
+    Call fn(query=query, **kwargs) through the research cache.
+
+    Input:
+        tool_name: Cache namespace and RESEARCH_CACHE_TTL key.
+        fn:        The search tool to call on a miss.
+        query:     Search query.
+        version:   Fingerprint of the data fn searches; see make_key().
+
+    Output:
+        The tool's data payload.  Only successful dict payloads without an
+        'error' key are cached.
+    '''
+    cache = get_research_cache()
+    key = cache.make_key(tool_name, query, kwargs.get('max_results'), version)
+    data = cache.get(key)
+    if data is not None:
+        log.debug(f'Research cache hit: {tool_name} "{query}"')
+        return data
+
+    result = fn(query=query, **kwargs)
+    data = result.data if hasattr(result, 'data') else result
+    if (getattr(result, 'is_success', True) and isinstance(data, dict)
+            and 'error' not in data):
+        cache.put(key, data, RESEARCH_CACHE_TTL[tool_name])
+    return data
+
+
+def _truncated_json(data: Any, limit: int) -> str:
+    '''
+    Return json.dumps(data, indent=2)[:limit] without encoding the rest.
+
+    The indented encoder yields its output in chunks; stop pulling them
+    once limit characters have been collected.
+    '''
+    buf = io.StringIO()
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        buf.write(chunk)
+        if buf.tell() >= limit:
+            break
+    return buf.getvalue()[:limit]
 
 
 class ResearchAgent(BaseAgent):
@@ -37,11 +426,15 @@ class ResearchAgent(BaseAgent):
     documents to build a ResearchReport with confidence-tagged findings.
     '''
 
-    def __init__(self, **kwargs):
+    def __init__(self, reuse_reports: bool = False, **kwargs):
         '''
         Initialize the Research Agent.
 
         Registers web search, MCP, and knowledge tools.
+
+        Input:
+            reuse_reports: Let research() reuse the cached search findings of
+                           an earlier request with the same keyword set.
         '''
         # Load the system prompt from config/prompts/research_agent.md.
         # No hardcoded fallback — the external file is the sole source.
@@ -60,6 +453,7 @@ class ResearchAgent(BaseAgent):
         )
 
         super().__init__(config=config, **kwargs)
+        self._reuse_reports = reuse_reports
 
         # Register tool collections
         self._register_research_tools()
@@ -110,13 +504,11 @@ class ResearchAgent(BaseAgent):
     def _load_prompt_file() -> Optional[str]:
         '''Load the research agent prompt from config/prompts/.'''
         prompt_path = os.path.join('config', 'prompts', 'research_agent.md')
-        if os.path.exists(prompt_path):
-            try:
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except Exception as e:
-                log.warning(f'Failed to load research agent prompt: {e}')
-        return None
+        try:
+            return load_prompt_file(prompt_path)
+        except Exception as e:
+            log.warning(f'Failed to load research agent prompt: {e}')
+            return None
 
     # ------------------------------------------------------------------
     # Main entry point
@@ -175,6 +567,7 @@ class ResearchAgent(BaseAgent):
         self,
         feature_request: str,
         doc_paths: Optional[List[str]] = None,
+        doc_texts: Optional[Dict[str, str]] = None,
     ) -> ResearchReport:
         '''
         Perform research programmatically without LLM reasoning.
@@ -185,6 +578,8 @@ class ResearchAgent(BaseAgent):
         Input:
             feature_request: The feature description.
             doc_paths:       Optional list of document paths to read.
+            doc_texts:       Optional path → text map of documents the
+                             caller already extracted; those are not re-read.
 
         Output:
             ResearchReport with findings from all available sources.
@@ -194,18 +589,49 @@ class ResearchAgent(BaseAgent):
         report = ResearchReport()
         keywords = self._extract_keywords(feature_request)
 
-        # --- Web search ---------------------------------------------------
-        report = self._do_web_search(report, feature_request, keywords)
-
-        # --- MCP search ---------------------------------------------------
-        report = self._do_mcp_search(report, feature_request, keywords)
-
-        # --- Knowledge base search ----------------------------------------
-        report = self._do_knowledge_search(report, keywords)
-
-        # --- Read user documents ------------------------------------------
-        if doc_paths:
-            report = self._do_document_read(report, doc_paths)
+        # --- Web / MCP / knowledge base search + user documents -----------
+        # Every source is an independent network / disk lookup, so fan them
+        # all out at once.  Each fills its own partial report and the
+        # partials are merged in a fixed order so findings stay deterministic.
+        # With reuse_reports, a recent request with the same keyword set
+        # supplies the search findings outright; user documents are always
+        # read.
+        searched = None
+        if self._reuse_reports:
+            report_key = _report_cache_key(keywords)
+            cached = get_research_cache().get(report_key)
+            if cached is not None:
+                log.debug(f'Research report cache hit: "{feature_request[:80]}"')
+                searched = _report_from_dict(cached)
+        with ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='research-search'
+        ) as pool:
+            search_futures = [] if searched is not None else [
+                pool.submit(self._do_web_search, ResearchReport(),
+                            feature_request, keywords),
+                pool.submit(self._do_mcp_search, ResearchReport(),
+                            feature_request, keywords),
+                pool.submit(self._do_knowledge_search, ResearchReport(),
+                            keywords),
+            ]
+            doc_future = pool.submit(
+                self._do_document_read, ResearchReport(), doc_paths, doc_texts,
+            ) if doc_paths else None
+
+            if searched is None:
+                searched = ResearchReport()
+                for future in search_futures:
+                    self._merge_findings(searched, future.result())
+                # Only complete searches are worth reusing
+                if (self._reuse_reports and searched.all_findings
+                        and not searched.open_questions):
+                    get_research_cache().put(
+                        report_key, searched.to_dict(),
+                        RESEARCH_CACHE_TTL['research_report'],
+                    )
+            self._merge_findings(report, searched)
+            if doc_future is not None:
+                self._merge_findings(report, doc_future.result())
 
         # --- Build domain overview ----------------------------------------
         report.domain_overview = self._build_domain_overview(
@@ -267,35 +693,11 @@ class ResearchAgent(BaseAgent):
 
         Filters out common stop words and short tokens.
         '''
-        stop_words = {
-            'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been',
-            'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'could', 'should', 'may', 'might', 'can', 'shall',
-            'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
-            'as', 'into', 'through', 'during', 'before', 'after', 'above',
-            'below', 'between', 'out', 'off', 'over', 'under', 'again',
-            'further', 'then', 'once', 'and', 'but', 'or', 'nor', 'not',
-            'so', 'yet', 'both', 'each', 'few', 'more', 'most', 'other',
-            'some', 'such', 'no', 'only', 'own', 'same', 'than', 'too',
-            'very', 'just', 'because', 'if', 'when', 'where', 'how',
-            'what', 'which', 'who', 'whom', 'this', 'that', 'these',
-            'those', 'it', 'its', 'we', 'our', 'us', 'i', 'me', 'my',
-            'you', 'your', 'he', 'she', 'they', 'them', 'their',
-        }
-
-        # Tokenize on non-alphanumeric boundaries
-        tokens = re.split(r'[^a-zA-Z0-9]+', text.lower())
-        keywords = [t for t in tokens if len(t) >= 2 and t not in stop_words]
-
-        # Deduplicate while preserving order
-        seen = set()
-        unique = []
-        for kw in keywords:
-            if kw not in seen:
-                seen.add(kw)
-                unique.append(kw)
-
-        return unique
+        # Tokenize on non-alphanumeric boundaries, deduplicating in order
+        return list(dict.fromkeys(
+            t for t in _TOKEN_SPLIT_PATTERN.split(text.lower())
+            if len(t) >= 2 and t not in _STOP_WORDS
+        ))
 
     # ------------------------------------------------------------------
     # Internal helpers — tool-based research steps
@@ -308,13 +710,12 @@ class ResearchAgent(BaseAgent):
         keywords: List[str],
     ) -> ResearchReport:
         '''Run web searches and add findings to the report.'''
-        try:
-            from tools.web_search_tools import web_search
-        except ImportError:
+        if web_search_tools is None:
             report.open_questions.append(
                 'Web search unavailable — could not research public information'
             )
             return report
+        web_search = web_search_tools.web_search
 
         # Build search queries from different angles
         queries = [
@@ -324,10 +725,20 @@ class ResearchAgent(BaseAgent):
             ' '.join(keywords[:5]) + ' firmware driver implementation',
         ]
 
-        for query in queries:
+        # Fire all queries at once; results are consumed in query order so
+        # a failure in one query only drops that query's findings.
+        with ThreadPoolExecutor(
+            max_workers=len(queries), thread_name_prefix='research-web'
+        ) as pool:
+            futures = [
+                (query, pool.submit(_cached_search, 'web_search', web_search,
+                                    query, max_results=5))
+                for query in queries
+            ]
+
+        for query, future in futures:
             try:
-                result = web_search(query=query, max_results=5)
-                data = result.data if hasattr(result, 'data') else result
+                data = future.result()
                 if isinstance(data, dict):
                     for item in data.get('results', []):
                         finding = ResearchFinding(
@@ -351,18 +762,15 @@ class ResearchAgent(BaseAgent):
         keywords: List[str],
     ) -> ResearchReport:
         '''Query the Cornelis MCP server and add findings to the report.'''
-        try:
-            from tools.mcp_tools import mcp_search
-        except ImportError:
+        if mcp_tools is None:
             return report
 
         query = ' '.join(keywords[:8])
         try:
-            result = mcp_search(query=query)
-            data = result.data if hasattr(result, 'data') else result
+            data = _cached_search('mcp_search', mcp_tools.mcp_search, query)
             if isinstance(data, dict) and 'error' not in str(data):
                 finding = ResearchFinding(
-                    content=json.dumps(data, indent=2)[:2000],
+                    content=_truncated_json(data, MCP_FINDING_CHARS),
                     source='mcp',
                     source_url='cornelis-mcp',
                     confidence='medium',
@@ -381,15 +789,15 @@ class ResearchAgent(BaseAgent):
         keywords: List[str],
     ) -> ResearchReport:
         '''Search the local knowledge base and add findings to the report.'''
-        try:
-            from tools.knowledge_tools import search_knowledge
-        except ImportError:
+        if knowledge_tools is None:
             return report
 
         query = ' '.join(keywords[:8])
         try:
-            result = search_knowledge(query=query, max_results=5)
-            data = result.data if hasattr(result, 'data') else result
+            data = _cached_search(
+                'search_knowledge', knowledge_tools.search_knowledge, query,
+                version=_knowledge_version(), max_results=5,
+            )
             if isinstance(data, dict):
                 for item in data.get('results', []):
                     finding = ResearchFinding(
@@ -411,24 +819,57 @@ class ResearchAgent(BaseAgent):
         self,
         report: ResearchReport,
         doc_paths: List[str],
+        doc_texts: Optional[Dict[str, str]] = None,
     ) -> ResearchReport:
         '''Read user-provided documents and add findings to the report.'''
-        try:
-            from tools.knowledge_tools import read_document
-        except ImportError:
-            report.open_questions.append(
-                'Document reader unavailable — could not read user-provided docs'
-            )
-            return report
+        doc_texts = doc_texts or {}
+        read_document = (
+            knowledge_tools.read_document if knowledge_tools is not None else None
+        )
+        if read_document is None:
+            if any(path not in doc_texts for path in doc_paths):
+                report.open_questions.append(
+                    'Document reader unavailable — could not read user-provided docs'
+                )
 
+        # Read everything the caller did not pre-extract concurrently; each
+        # read returns (data, exc) so failures stay isolated per document.
+        to_read = (
+            [path for path in doc_paths if path not in doc_texts]
+            if read_document is not None else []
+        )
+
+        def _safe_read(path: str):
+            try:
+                result = read_document(file_path=path, max_chars=DOC_FINDING_CHARS)
+                return (result.data if hasattr(result, 'data') else result), None
+            except Exception as e:
+                return None, e
+
+        fetched = {}
+        if to_read:
+            with ThreadPoolExecutor(
+                max_workers=min(DOC_READ_WORKERS, len(to_read)),
+                thread_name_prefix='research-docs',
+            ) as pool:
+                fetched = dict(zip(to_read, pool.map(_safe_read, to_read)))
+
+        # Build findings on this thread, in input order
         for path in doc_paths:
             try:
-                result = read_document(file_path=path)
-                data = result.data if hasattr(result, 'data') else result
+                if path in doc_texts:
+                    # Already extracted by the caller
+                    data = {'content': doc_texts[path]}
+                elif read_document is None:
+                    continue
+                else:
+                    data, exc = fetched[path]
+                    if exc is not None:
+                        raise exc
                 if isinstance(data, dict) and data.get('content'):
                     # Treat user-provided docs as high-confidence
                     finding = ResearchFinding(
-                        content=data['content'][:3000],
+                        content=data['content'][:DOC_FINDING_CHARS],
                         source='user_doc',
                         source_url=path,
                         confidence='high',
@@ -448,6 +889,14 @@ class ResearchAgent(BaseAgent):
     # Internal helpers — synthesis
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _merge_findings(report: ResearchReport, partial: ResearchReport) -> None:
+        '''Append the findings and open questions of partial to report.'''
+        report.standards_and_specs.extend(partial.standards_and_specs)
+        report.existing_implementations.extend(partial.existing_implementations)
+        report.internal_knowledge.extend(partial.internal_knowledge)
+        report.open_questions.extend(partial.open_questions)
+
     @staticmethod
     def _build_domain_overview(
         feature_request: str,
@@ -534,20 +983,10 @@ class ResearchAgent(BaseAgent):
         log.info('ResearchAgent: no JSON block found — falling back to Markdown parser')
 
         # Extract domain overview (text before the first section heading)
-        sections = re.split(r'\n(?=#{1,3}\s|[A-Z][A-Z\s&]+:)', llm_output)
+        sections = _SECTION_SPLIT_PATTERN.split(llm_output)
         if sections:
             report.domain_overview = sections[0].strip()[:3000]
 
-        # Extract findings by looking for bullet points with confidence tags
-        confidence_pattern = re.compile(
-            r'[-*]\s+(.+?)\s*\(.*?[Cc]onfidence:\s*(HIGH|MEDIUM|LOW).*?\)',
-            re.IGNORECASE,
-        )
-        source_pattern = re.compile(
-            r'\(.*?[Ss]ource:\s*([^,)]+)',
-            re.IGNORECASE,
-        )
-
         current_section = ''
         for line in llm_output.splitlines():
             line_stripped = line.strip()
@@ -563,14 +1002,19 @@ class ResearchAgent(BaseAgent):
             elif 'open question' in lower or 'gap' in lower:
                 current_section = 'questions'
 
-            # Parse findings with confidence tags
-            match = confidence_pattern.search(line_stripped)
+            # Parse findings with confidence tags.  Cheap substring test
+            # first: most lines carry no tag, and the lazy pattern
+            # backtracks over every "(" on the line.
+            match = (
+                _CONFIDENCE_PATTERN.search(line_stripped)
+                if 'confidence' in lower else None
+            )
             if match:
                 content = match.group(1).strip()
                 confidence = match.group(2).lower()
 
                 # Try to extract source
-                source_match = source_pattern.search(line_stripped)
+                source_match = _SOURCE_PATTERN.search(line_stripped)
                 source_url = source_match.group(1).strip() if source_match else ''
 
                 finding = ResearchFinding(
@@ -10,8 +10,11 @@
 ##########################################################################################
 
 import logging
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any, Dict, List, Optional
 
 from agents.base import BaseAgent, AgentConfig, AgentResponse
@@ -21,6 +24,17 @@ from tools.file_tools import FileTools
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
+# Start method for analyze_multiple_parallel's workers.  Callers run it from
+# threads (the orchestrator's pools), and forking a threaded process can
+# copy held locks into the child; spawned workers start clean.
+_WORKER_CONTEXT = multiprocessing.get_context('spawn')
+
+
+def _analyze_file_in_worker(file_path: str) -> Dict[str, Any]:
+    '''Process-pool entry point: analyze one roadmap file (picklable).'''
+    return VisionAnalyzerAgent._analyze_path(file_path)
+
+
 class VisionAnalyzerAgent(BaseAgent):
     '''
     Agent for analyzing roadmap slides and images.
@@ -154,12 +168,20 @@ Use the appropriate tool to extract information from this {file_type} file, then
         Output:
             Dictionary with extracted roadmap data.
         '''
+        return self._analyze_path(file_path)
+    
+    @classmethod
+    def _analyze_path(cls, file_path: str) -> Dict[str, Any]:
+        '''
+        analyze_file() without agent state, so it can also run in a
+        worker process.
+        '''
         log.debug(f'analyze_file(file_path={file_path})')
         
         if not os.path.exists(file_path):
             return {'error': f'File not found: {file_path}'}
         
-        file_type = self._detect_file_type(file_path)
+        file_type = cls._detect_file_type(file_path)
         
         from tools.vision_tools import (
             analyze_image,
@@ -179,7 +201,7 @@ Use the appropriate tool to extract information from this {file_type} file, then
         
         if file_type == 'image':
             # Use vision analysis — load the prompt from an external file
-            vision_prompt = self._load_vision_roadmap_prompt()
+            vision_prompt = cls._load_vision_roadmap_prompt()
             analysis = analyze_image(
                 file_path,
                 prompt=vision_prompt
@@ -188,7 +210,7 @@ Use the appropriate tool to extract information from this {file_type} file, then
             if analysis.is_success:
                 result['raw_data'] = analysis.data
                 # Parse the LLM response to extract structured data
-                result = self._parse_vision_response(result, analysis.data)
+                result = cls._parse_vision_response(result, analysis.data)
             else:
                 result['errors'].append(analysis.error)
                 
@@ -232,6 +254,83 @@ Use the appropriate tool to extract information from this {file_type} file, then
         '''
         log.debug(f'analyze_multiple(files={len(file_paths)})')
         
+        results = [self.analyze_file(file_path) for file_path in file_paths]
+        return self._combine_results(file_paths, results)
+    
+    def analyze_multiple_parallel(
+        self,
+        file_paths: List[str],
+        workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        '''
+        Analyze multiple files in worker processes and combine results.
+        
+        Slide/spreadsheet extraction is CPU-bound Python, so separate
+        processes sidestep the GIL.  Falls back to analyze_multiple() for a
+        single file or when a process pool cannot be used.
+        
+        Input:
+            file_paths: List of file paths to analyze.
+            workers: Worker process count (default: min(files, CPUs)).
+        
+        Output:
+            Combined dictionary with all extracted data.
+        '''
+        if len(file_paths) <= 1:
+            return self.analyze_multiple(file_paths)
+        
+        workers = workers or min(len(file_paths), os.cpu_count() or 1)
+        log.debug(f'analyze_multiple_parallel(files={len(file_paths)}, workers={workers})')
+        
+        # Only a pool that cannot start or that breaks (a worker dying) falls
+        # back to analyzing in this process; one file failing is reported
+        # against that file like analyze_multiple() would
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=_WORKER_CONTEXT
+            ) as pool:
+                futures = [
+                    pool.submit(_analyze_file_in_worker, file_path)
+                    for file_path in file_paths
+                ]
+                results = [
+                    self._worker_result(file_path, future)
+                    for file_path, future in zip(file_paths, futures)
+                ]
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            log.warning(f'Process pool unavailable ({e}); analyzing files serially')
+            return self.analyze_multiple(file_paths)
+        
+        return self._combine_results(file_paths, results)
+    
+    @classmethod
+    def _worker_result(cls, file_path: str, future) -> Dict[str, Any]:
+        '''
+        Result of one worker future, with a per-file exception turned into
+        an error entry for that file.  A broken pool is re-raised.
+        '''
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            raise
+        except Exception as e:
+            log.warning(f'Failed to analyze {file_path}: {e}')
+            return {
+                'file_path': file_path,
+                'file_type': cls._detect_file_type(file_path),
+                'releases': [],
+                'features': [],
+                'timeline': [],
+                'raw_data': None,
+                'errors': [f'{file_path}: {e}'],
+            }
+    
+    def _combine_results(
+        self,
+        file_paths: List[str],
+        results: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        '''Merge per-file analysis results, in file order.'''
         combined = {
             'files_analyzed': [],
             'releases': [],
@@ -243,9 +342,7 @@ Use the appropriate tool to extract information from this {file_type} file, then
         seen_releases = set()
         seen_features = set()
         
-        for file_path in file_paths:
-            result = self.analyze_file(file_path)
-            
+        for file_path, result in zip(file_paths, results):
             combined['files_analyzed'].append({
                 'path': file_path,
                 'type': result.get('file_type'),
@@ -277,7 +374,8 @@ Use the appropriate tool to extract information from this {file_type} file, then
         
         return combined
     
-    def _detect_file_type(self, file_path: str) -> str:
+    @staticmethod
+    def _detect_file_type(file_path: str) -> str:
         '''Detect the type of file based on extension.'''
         ext = os.path.splitext(file_path)[1].lower()
         
@@ -296,8 +394,8 @@ Use the appropriate tool to extract information from this {file_type} file, then
         else:
             return 'unknown'
     
+    @staticmethod
     def _parse_vision_response(
-        self,
         result: Dict[str, Any],
         vision_data: Dict[str, Any]
     ) -> Dict[str, Any]:
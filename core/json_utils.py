@@ -0,0 +1,71 @@
+##########################################################################################
+#
+# Module: core/json_utils.py
+#
+# Description: JSON encode/decode helpers shared by the agents and state modules.
+#              Uses orjson when it is installed and the stdlib json module
+#              otherwise; both paths produce the same JSON data.
+#
+# Functions:
+#   dumps()  — serialize to UTF-8 JSON bytes
+#   loads()  — parse JSON text or bytes
+#
+# Author: Cornelis Networks
+#
+##########################################################################################
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional, Union
+
+# orjson is optional — much faster for the large plan/state dicts and cache
+# files.  Fall back to the stdlib json module when absent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# What dumps() raises for data it cannot encode: stdlib json raises
+# TypeError/ValueError, orjson raises its JSONEncodeError (a TypeError).
+ENCODE_ERRORS = (TypeError, ValueError, OverflowError, RecursionError)
+
+
+def dumps(
+    data: Any,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    '''
+    Serialize data to UTF-8 JSON bytes.
+
+    Input:
+        data:      Value to encode; non-str dict keys are allowed.
+        indent:    Indent nested values by two spaces.
+        sort_keys: Sort dict keys (for stable fingerprints).
+        default:   Called for values JSON cannot represent.
+
+    Output:
+        The encoded JSON.  Raises one of ENCODE_ERRORS on failure.
+    '''
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, default=default, option=option)
+    return json.dumps(
+        data,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        default=default,
+    ).encode('utf-8')
+
+
+def loads(raw: Union[str, bytes]) -> Any:
+    '''Parse JSON text or bytes; raises ValueError on malformed input.'''
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
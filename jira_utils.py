@@ -27,6 +27,8 @@ import csv
 from datetime import date, datetime
 import re
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -54,6 +56,10 @@ DEFAULT_JIRA_URL = 'https://cornelisnetworks.atlassian.net'
 # Jira configuration (allow override via env / .env)
 JIRA_URL = os.getenv('JIRA_URL', DEFAULT_JIRA_URL)
 
+# Keep-alive connections held per host by the shared Jira client; sized for
+# the agents' concurrent lookups (requests' default of 10 would churn)
+JIRA_POOL_SIZE = 16
+
 # Logging config
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 log.setLevel(logging.DEBUG)
@@ -465,6 +471,11 @@ def connect_to_jira():
             basic_auth=(email, api_token),
             options={'rest_api_version': '3'}
         )
+        # Reuse TCP/TLS connections across threads sharing this client.
+        # Retries stay with the client's ResilientSession.
+        adapter = HTTPAdapter(pool_connections=JIRA_POOL_SIZE, pool_maxsize=JIRA_POOL_SIZE)
+        jira._session.mount('https://', adapter)
+        jira._session.mount('http://', adapter)
         log.info('Successfully connected to Jira')
         return jira
     except Exception as e:
@@ -476,6 +487,8 @@ def connect_to_jira():
 # ---------------------------------------------------------------------------
 
 _cached_connection = None
+# Guards first-time creation when several threads ask for the connection
+_connection_lock = threading.Lock()
 
 
 def get_connection():
@@ -494,7 +507,9 @@ def get_connection():
     '''
     global _cached_connection
     if _cached_connection is None:
-        _cached_connection = connect_to_jira()
+        with _connection_lock:
+            if _cached_connection is None:
+                _cached_connection = connect_to_jira()
     return _cached_connection
 
 
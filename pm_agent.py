@@ -1301,7 +1301,10 @@ def _workflow_feature_plan(args):
         from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
 
         output('Starting workflow...')
-        orchestrator = FeaturePlanningOrchestrator(output_dir=output_dir)
+        orchestrator = FeaturePlanningOrchestrator(
+            output_dir=output_dir,
+            skip_llm_min_findings=getattr(args, 'skip_llm_min_findings', 0) or 0,
+        )
 
         response = orchestrator.run({
             'feature_request': feature_request,
@@ -1311,6 +1314,7 @@ def _workflow_feature_plan(args):
             'execute': execute,
             'initiative_key': initiative_key,
             'force': force,
+            'reuse_cache': getattr(args, 'reuse_cache', False),
             'scope_doc': scope_doc,
             'output_dir': output_dir,
             'feature_tag': getattr(args, 'feature_tag', None),
@@ -1592,6 +1596,8 @@ Examples:
     parser.add_argument('--scope-doc', default=None, metavar='FILE',
                        dest='scope_doc',
                        help='Pre-existing scope document (JSON, Markdown, PDF, DOCX). '
+                            'Accepts a comma-separated list to merge several documents '
+                            '(used when every entry is an existing file). '
                             'Skips research/HW-analysis/scoping phases and jumps '
                             'straight to Jira plan generation. '
                             'Used by --workflow feature-plan.')
@@ -1619,6 +1625,19 @@ Examples:
                             'Without --force, the agent pauses and asks before '
                             'creating a ticket whose summary already exists in '
                             'the project. Used by --workflow feature-plan.')
+    parser.add_argument('--reuse-cache', action='store_true',
+                       dest='reuse_cache',
+                       help='Reuse research/HW-analysis/scoping results cached '
+                            'under <output-dir>/cache/phase by an earlier run '
+                            'with identical inputs, skipping those phases. '
+                            'Used by --workflow feature-plan.')
+    parser.add_argument('--skip-llm-min-findings', type=int, default=0, metavar='N',
+                       dest='skip_llm_min_findings',
+                       help='Skip the LLM enrichment pass in research / HW '
+                            'analysis when the deterministic pass already finds '
+                            'at least N items (research: half high-confidence; '
+                            'HW: no knowledge gaps). Default 0: always enrich. '
+                            'Used by --workflow feature-plan.')
     parser.add_argument('--feature-tag', default=None, metavar='TAG',
                        dest='feature_tag',
                        help='Override the auto-generated [Tag] prefix for Epic '
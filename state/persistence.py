@@ -9,7 +9,6 @@
 #
 ##########################################################################################
 
-import json
 import logging
 import os
 import sys
@@ -18,12 +17,23 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from core import json_utils
 from state.session import SessionState
 
 # Logging config - follows jira_utils.py pattern
 log = logging.getLogger(os.path.basename(sys.argv[0]))
 
 
+def _dumps(data: Any, indent: bool = False) -> str:
+    '''Serialize session data to JSON text, stringifying unknown types.'''
+    return json_utils.dumps(data, indent=indent, default=str).decode('utf-8')
+
+
+def _loads(raw: str) -> Any:
+    '''Parse JSON text written by _dumps().'''
+    return json_utils.loads(raw)
+
+
 class StatePersistence(ABC):
     '''
     Abstract base class for state persistence backends.
@@ -86,7 +96,7 @@ class JSONPersistence(StatePersistence):
             path = self._get_session_path(session.session_id)
             
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(session.to_dict(), f, indent=2, default=str)
+                f.write(_dumps(session.to_dict(), indent=True))
             
             log.debug(f'Saved session to: {path}')
             return True
@@ -112,7 +122,7 @@ class JSONPersistence(StatePersistence):
                 return None
             
             with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = _loads(f.read())
             
             log.debug(f'Loaded session from: {path}')
             return SessionState.from_dict(data)
@@ -225,7 +235,7 @@ class SQLitePersistence(StatePersistence):
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
-            data = json.dumps(session.to_dict(), default=str)
+            data = _dumps(session.to_dict())
             
             cursor.execute('''
                 INSERT OR REPLACE INTO sessions 
@@ -276,7 +286,7 @@ class SQLitePersistence(StatePersistence):
             conn.close()
             
             if row:
-                data = json.loads(row[0])
+                data = _loads(row[0])
                 log.debug(f'Loaded session from database: {session_id}')
                 return SessionState.from_dict(data)
             
@@ -304,6 +304,22 @@ def reset_jira_utils_state():
     jira_state._no_formatting = False
 
 
+@pytest.fixture(autouse=True)
+def reset_research_cache(monkeypatch):
+    try:
+        from agents import research_agent
+    except Exception:
+        yield
+        return
+
+    monkeypatch.delenv("RESEARCH_CACHE_DIR", raising=False)
+    research_agent.reset_research_cache()
+
+    yield
+
+    research_agent.reset_research_cache()
+
+
 @pytest.fixture
 def import_mcp_server(monkeypatch):
     fake_mcp = cast(Any, ModuleType("mcp"))
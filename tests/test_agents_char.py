@@ -163,6 +163,213 @@ def test_jira_analyst_analyze_project_collects_summary_and_errors(monkeypatch: p
     assert analysis['summary']['has_errors'] is True
 
 
+def test_jira_analyst_analyze_project_runs_lookups_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import threading
+
+    from agents.jira_analyst import JiraAnalystAgent
+    from tools import jira_tools as jira_tools_module
+
+    monkeypatch.setattr(
+        JiraAnalystAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'jira analyst prompt'),
+    )
+    # Every lookup blocks until all five are in flight
+    barrier = threading.Barrier(5, timeout=5)
+
+    def _lookup(data):
+        def _call(_project_key):
+            barrier.wait()
+            return ToolResult.success(data)
+        return _call
+
+    for name, data in (
+        ('get_project_info', {'key': 'STL'}),
+        ('get_releases', [{'name': '12.0', 'released': False}]),
+        ('get_components', []),
+        ('get_project_workflows', []),
+        ('get_project_issue_types', [{'name': 'Bug'}]),
+    ):
+        monkeypatch.setattr(jira_tools_module, name, _lookup(data))
+
+    agent = JiraAnalystAgent(llm=_DummyLLM([]))
+    analysis = agent.analyze_project('STL')
+
+    assert analysis['errors'] == []
+    assert analysis['summary']['unreleased_count'] == 1
+
+
+def test_jira_analyst_metadata_cache_reuses_success_until_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from agents import jira_analyst
+
+    calls = []
+
+    def _components(project_key):
+        calls.append(project_key)
+        if len(calls) == 1:
+            return ToolResult.failure('timeout')
+        return ToolResult.success([{'name': 'Fabric'}])
+
+    jira_analyst.invalidate_metadata_cache()
+
+    # Failures are not cached; the next call refetches and caches success
+    assert jira_analyst._cached_metadata(_components, 'STL').is_error
+    assert jira_analyst._cached_metadata(_components, 'STL').data == [{'name': 'Fabric'}]
+    jira_analyst._cached_metadata(_components, 'STL')
+    assert calls == ['STL', 'STL']
+
+    monkeypatch.setattr(jira_analyst, 'METADATA_CACHE_TTL', 0.0)
+    jira_analyst._cached_metadata(_components, 'STL')
+    assert len(calls) == 3
+
+    monkeypatch.setattr(jira_analyst, 'METADATA_CACHE_TTL', 600.0)
+    jira_analyst.invalidate_metadata_cache('STL')
+    jira_analyst._cached_metadata(_components, 'STL')
+    assert len(calls) == 4
+
+
+def test_jira_analyst_release_structure_uses_one_search(monkeypatch: pytest.MonkeyPatch):
+    from agents.jira_analyst import JiraAnalystAgent
+    from tools import jira_tools as jira_tools_module
+
+    monkeypatch.setattr(
+        JiraAnalystAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'jira analyst prompt'),
+    )
+    monkeypatch.setattr(
+        jira_tools_module,
+        'get_releases',
+        lambda project_key, pattern=None, include_released=True: ToolResult.success([
+            {'id': '1', 'name': '12.0', 'releaseDate': '2026-06-01'},
+            {'id': '2', 'name': '12.1'},
+        ]),
+    )
+    searches = []
+
+    def _search(jql, limit=100, fields=None, batch_size=None):
+        searches.append((jql, fields))
+        return ToolResult.success([
+            {'key': 'STL-1', 'type': 'Bug', 'status': 'Open', 'fix_versions': ['12.0']},
+            {'key': 'STL-2', 'type': 'Story', 'status': 'Done', 'fix_versions': ['12.0', '12.1']},
+            {'key': 'STL-3', 'type': 'Bug', 'status': 'Open', 'fix_versions': ['11.9']},
+        ])
+
+    monkeypatch.setattr(jira_tools_module, 'search_tickets', _search)
+
+    agent = JiraAnalystAgent(llm=_DummyLLM([]))
+    structure = agent.get_release_structure('STL')
+
+    assert searches == [(
+        'project = STL AND fixVersion IN ("12.0", "12.1") ORDER BY created DESC',
+        ['summary', 'issuetype', 'status', 'fixVersions'],
+    )]
+    first, second = structure['releases']
+    assert first['ticket_count'] == 2
+    assert first['by_type'] == {'Bug': 1, 'Story': 1}
+    assert first['by_status'] == {'Open': 1, 'Done': 1}
+    assert [t['key'] for t in second['tickets']] == ['STL-2']
+
+
+def test_jira_analyst_release_structure_refetches_starved_releases(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from agents import jira_analyst
+    from agents.jira_analyst import JiraAnalystAgent
+    from tools import jira_tools as jira_tools_module
+
+    monkeypatch.setattr(
+        JiraAnalystAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'jira analyst prompt'),
+    )
+    monkeypatch.setattr(jira_analyst, 'RELEASE_TICKET_LIMIT', 2)
+    monkeypatch.setattr(
+        jira_tools_module,
+        'get_releases',
+        lambda project_key, pattern=None, include_released=True: ToolResult.success([
+            {'id': '1', 'name': '12.0'},
+            {'id': '2', 'name': 'Q3 "beta" \\ lab'},
+        ]),
+    )
+    searches = []
+
+    def _search(jql, limit=100, fields=None, batch_size=None):
+        searches.append((jql, limit))
+        if 'IN (' in jql:
+            # The busy release fills the shared limit on its own
+            return ToolResult.success([
+                {'key': f'STL-{n}', 'type': 'Bug', 'status': 'Open',
+                 'fix_versions': ['12.0']}
+                for n in range(4)
+            ])
+        return ToolResult.success([
+            {'key': 'STL-9', 'type': 'Story', 'status': 'Done',
+             'fix_versions': ['Q3 "beta" \\ lab']},
+        ])
+
+    monkeypatch.setattr(jira_tools_module, 'search_tickets', _search)
+
+    structure = JiraAnalystAgent(llm=_DummyLLM([])).get_release_structure('STL')
+
+    assert searches == [
+        ('project = STL AND fixVersion IN ("12.0", "Q3 \\"beta\\" \\\\ lab") '
+         'ORDER BY created DESC', 4),
+        ('project = STL AND fixVersion = "Q3 \\"beta\\" \\\\ lab" '
+         'ORDER BY created DESC', 2),
+    ]
+    busy, starved = structure['releases']
+    assert [t['key'] for t in busy['tickets']] == ['STL-0', 'STL-1']
+    assert [t['key'] for t in starved['tickets']] == ['STL-9']
+    assert starved['by_status'] == {'Done': 1}
+
+
+def test_jira_analyst_release_structure_reuses_analyzed_releases(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from agents.jira_analyst import JiraAnalystAgent, invalidate_metadata_cache
+    from tools import jira_tools as jira_tools_module
+
+    monkeypatch.setattr(
+        JiraAnalystAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'jira analyst prompt'),
+    )
+    release_calls = []
+
+    def _releases(project_key, pattern=None, include_released=True):
+        release_calls.append(project_key)
+        return ToolResult.success([
+            {'id': '1', 'name': '12.0', 'released': True},
+            {'id': '2', 'name': '12.1', 'released': False},
+            {'id': '3', 'name': 'Backlog', 'released': False},
+        ])
+
+    monkeypatch.setattr(jira_tools_module, 'get_releases', _releases)
+    for name in ('get_project_info', 'get_components', 'get_project_workflows',
+                 'get_project_issue_types'):
+        monkeypatch.setattr(jira_tools_module, name, lambda _key: ToolResult.success([]))
+    monkeypatch.setattr(
+        jira_tools_module, 'search_tickets', lambda *args, **kwargs: ToolResult.success([])
+    )
+    invalidate_metadata_cache()
+
+    agent = JiraAnalystAgent(llm=_DummyLLM([]))
+    agent.analyze_project('STL')
+    structure = agent.get_release_structure('STL', release_pattern='^12')
+
+    assert [r['name'] for r in structure['releases']] == ['12.1']
+    assert release_calls == ['STL']
+
+    agent.clear_release_cache('STL')
+    agent.get_release_structure('STL')
+    assert release_calls == ['STL', 'STL']
+
+
 def test_research_agent_registers_search_related_tools(monkeypatch: pytest.MonkeyPatch):
     from agents.research_agent import ResearchAgent
 
@@ -225,7 +432,7 @@ def test_research_agent_research_aggregates_findings(monkeypatch: pytest.MonkeyP
     monkeypatch.setattr(
         knowledge_tools,
         'read_document',
-        lambda file_path: ToolResult.success({
+        lambda file_path, max_chars=None: ToolResult.success({
             'content': 'User spec document content',
             'file_path': file_path,
         }),
@@ -245,71 +452,1980 @@ def test_research_agent_research_aggregates_findings(monkeypatch: pytest.MonkeyP
     assert 'Found 7 relevant findings' in report.domain_overview
 
 
-def test_review_agent_create_session_and_execute_approved_items(monkeypatch: pytest.MonkeyPatch):
-    from agents.review_agent import ApprovalStatus, ReviewAgent
-    from tools import jira_tools as jira_tools_module
+def test_research_agent_sources_run_concurrently(monkeypatch: pytest.MonkeyPatch):
+    import threading
+
+    from agents.research_agent import ResearchAgent
+    from tools import knowledge_tools, mcp_tools, web_search_tools
 
     monkeypatch.setattr(
-        ReviewAgent,
+        ResearchAgent,
         '_load_prompt_file',
-        staticmethod(lambda: 'review prompt'),
+        staticmethod(lambda: 'research prompt'),
     )
+    # Four web queries, the MCP and knowledge searches and the document read
+    # must all be in flight at once to get past the barrier.
+    barrier = threading.Barrier(7, timeout=5)
 
-    create_release_calls = []
-    create_ticket_calls = []
+    def _web_search(query, max_results=5):
+        barrier.wait()
+        if query.endswith('datasheet'):
+            raise RuntimeError('search backend down')
+        return ToolResult.success({'results': [{'title': query, 'snippet': 's'}]})
+
+    def _mcp_search(query):
+        barrier.wait()
+        return ToolResult.success({'tool': 'internal-search'})
+
+    def _search_knowledge(query, max_results=5):
+        barrier.wait()
+        return ToolResult.success({'results': [{'heading': 'KB', 'content': 'c'}]})
+
+    monkeypatch.setattr(web_search_tools, 'web_search', _web_search)
+    monkeypatch.setattr(mcp_tools, 'mcp_search', _mcp_search)
+    def _read_document(file_path, max_chars=None):
+        barrier.wait()
+        return ToolResult.success({'content': f'Read {file_path}'})
+
+    monkeypatch.setattr(knowledge_tools, 'search_knowledge', _search_knowledge)
+    monkeypatch.setattr(knowledge_tools, 'read_document', _read_document)
+
+    agent = ResearchAgent(llm=_DummyLLM([]))
+    report = agent.research(
+        feature_request='PCIe loopback diagnostics',
+        doc_paths=['specs/loopback.md'],
+    )
+
+    assert [f.content.split(':')[0] for f in report.existing_implementations] == [
+        'PCIe loopback diagnostics',
+        'pcie loopback diagnostics specification',
+        'pcie loopback diagnostics firmware driver implementation',
+    ]
+    assert [f.source for f in report.internal_knowledge] == ['mcp', 'knowledge_base']
+    assert [f.content for f in report.standards_and_specs] == ['Read specs/loopback.md']
+
+
+def test_web_search_multi_runs_queries_concurrently(monkeypatch: pytest.MonkeyPatch):
+    import threading
+
+    from tools import web_search_tools
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _web_search(query, max_results=10):
+        barrier.wait()
+        if query == 'broken':
+            return ToolResult.failure('backend down')
+        return ToolResult.success({'result_count': 2, 'results': [query]})
+
+    monkeypatch.setattr(web_search_tools, 'web_search', _web_search)
+
+    result = web_search_tools.web_search_multi(['spec', 'broken', 'driver'])
+
+    assert list(result.data['results_by_query']) == ['spec', 'driver']
+    assert result.data['total_results'] == 4
+    assert result.data['errors'] == [{'query': 'broken', 'error': 'backend down'}]
+
+
+def test_http_session_created_once_across_threads(monkeypatch: pytest.MonkeyPatch):
+    import threading
+
+    from tools import http_session
+
+    monkeypatch.setattr(http_session, '_session', None)
+    barrier = threading.Barrier(4, timeout=5)
+    sessions = []
+
+    def _worker():
+        barrier.wait()
+        sessions.append(http_session.get_session())
+
+    threads = [threading.Thread(target=_worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(sessions) == 4
+    assert all(s is sessions[0] for s in sessions)
+    adapter = sessions[0].get_adapter('https://api.tavily.com')
+    assert adapter._pool_maxsize == http_session.HTTP_POOL_SIZE
+
+
+def test_search_tools_send_requests_through_shared_session(monkeypatch: pytest.MonkeyPatch):
+    from tools import http_session, mcp_tools, web_search_tools
+
+    calls = []
+
+    class _Response:
+        headers = {'Content-Type': 'application/json'}
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {'web': {'results': []}, 'results': [], 'result': {'ok': True}}
+
+    class _Session:
+        def get(self, url, **kwargs):
+            calls.append(('get', url))
+            return _Response()
+
+        def post(self, url, **kwargs):
+            calls.append(('post', url))
+            return _Response()
+
+    monkeypatch.setattr(http_session, 'get_session', lambda: _Session())
+    monkeypatch.setenv('BRAVE_SEARCH_API_KEY', 'brave-key')
+    monkeypatch.setenv('TAVILY_API_KEY', 'tavily-key')
+    monkeypatch.setenv('CORNELIS_MCP_URL', 'http://mcp.example/mcp')
+
+    assert web_search_tools._search_via_brave('pcie')['source'] == 'brave_search'
+    assert web_search_tools._search_via_tavily('pcie')['source'] == 'tavily_search'
+    assert mcp_tools._mcp_request('tools/list') == {'ok': True}
+    assert calls == [
+        ('get', 'https://api.search.brave.com/res/v1/web/search'),
+        ('post', 'https://api.tavily.com/search'),
+        ('post', 'http://mcp.example/mcp'),
+    ]
+
+
+def test_research_agent_reuses_cached_search_results(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from agents import research_agent
+    from agents.research_agent import ResearchAgent
+    from tools import knowledge_tools, mcp_tools, web_search_tools
 
+    monkeypatch.setenv('RESEARCH_CACHE_DIR', str(tmp_path))
     monkeypatch.setattr(
-        jira_tools_module,
-        'create_release',
-        lambda **kwargs: (
-            create_release_calls.append(kwargs) or
-            ToolResult.success({'id': 'rel-1', 'name': kwargs['name']})
-        ),
+        ResearchAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'research prompt'),
     )
+    calls = []
     monkeypatch.setattr(
-        jira_tools_module,
-        'create_ticket',
-        lambda **kwargs: (
-            create_ticket_calls.append(kwargs) or
-            ToolResult.success({'key': 'STL-900', 'summary': kwargs['summary']})
-        ),
+        web_search_tools,
+        'web_search',
+        lambda query, max_results=5: calls.append(('web', query)) or ToolResult.success({
+            'results': [{'title': query, 'snippet': 's'}],
+        }),
+    )
+    monkeypatch.setattr(
+        mcp_tools,
+        'mcp_search',
+        lambda query: calls.append(('mcp', query)) or ToolResult.failure('offline'),
+    )
+    monkeypatch.setattr(
+        knowledge_tools,
+        'search_knowledge',
+        lambda query, max_results=5: calls.append(('kb', query)) or ToolResult.success({
+            'results': [{'heading': 'KB', 'content': 'c'}],
+        }),
     )
 
-    agent = ReviewAgent(llm=_DummyLLM([]))
-    session = agent.create_session_from_plan({
-        'project_key': 'STL',
-        'releases': [
-            {
-                'name': '12.2.0',
-                'description': 'Q2 release',
-                'release_date': '2026-06-01',
-                'tickets': [
-                    {
-                        'summary': 'Initial summary',
-                        'description': 'Implement feature',
-                        'issue_type': 'Story',
-                        'components': ['Fabric'],
-                        'fix_versions': ['12.2.0'],
-                        'labels': ['agentic'],
-                    }
-                ],
-            }
-        ],
-    })
+    agent = ResearchAgent(llm=_DummyLLM([]))
+    first = agent.research(feature_request='PCIe loopback diagnostics')
+    assert len(calls) == 6
 
-    assert len(session.items) == 2
-    assert session.items[0].id == 'R1'
-    assert session.items[1].id == 'T2'
+    # Second run in the same process: only the failed MCP lookup is retried
+    second = agent.research(feature_request='PCIe loopback diagnostics')
+    assert calls[6:] == [('mcp', 'pcie loopback diagnostics')]
+    assert second.to_dict() == first.to_dict()
 
-    assert agent.approve_item(session, 'R1') is True
-    assert agent.modify_item(session, 'T2', {'summary': 'Revised summary'}) is True
-    assert session.items[0].status == ApprovalStatus.APPROVED
-    assert session.items[1].status == ApprovalStatus.MODIFIED
+    # A fresh process reloads the successful results from disk
+    research_agent.reset_research_cache()
+    agent.research(feature_request='PCIe loopback diagnostics')
+    assert [name for name, _ in calls[7:]] == ['mcp']
 
-    results = agent.execute_approved(session)
 
-    assert [result['item_id'] for result in results] == ['R1', 'T2']
-    assert create_release_calls[0]['name'] == '12.2.0'
-    assert create_ticket_calls[0]['summary'] == 'Revised summary'
-    assert session.items[0].status == ApprovalStatus.EXECUTED
-    assert session.items[1].status == ApprovalStatus.EXECUTED
+def test_research_agent_reuses_reports_for_same_keywords(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from agents import research_agent
+    from agents.research_agent import ResearchAgent
+    from tools import knowledge_tools, mcp_tools, web_search_tools
+
+    monkeypatch.setenv('RESEARCH_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(
+        ResearchAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'research prompt'),
+    )
+    calls = []
+    monkeypatch.setattr(
+        web_search_tools,
+        'web_search',
+        lambda query, max_results=5: calls.append(query) or ToolResult.success({
+            'results': [{'title': query, 'snippet': 's'}],
+        }),
+    )
+    monkeypatch.setattr(
+        mcp_tools,
+        'mcp_search',
+        lambda query: calls.append(query) or ToolResult.success({'tool': 'mcp'}),
+    )
+    monkeypatch.setattr(
+        knowledge_tools,
+        'search_knowledge',
+        lambda query, max_results=5: calls.append(query) or ToolResult.success({
+            'results': [{'heading': 'KB', 'content': 'c'}],
+        }),
+    )
+    monkeypatch.setattr(
+        knowledge_tools,
+        'read_document',
+        lambda file_path, max_chars=None: ToolResult.success({'content': f'Read {file_path}'}),
+    )
+
+    agent = ResearchAgent(llm=_DummyLLM([]), reuse_reports=True)
+    first = agent.research(feature_request='PCIe Gen5 link training')
+    assert len(calls) == 6
+
+    # Same keyword set: case, order, stop words and repeats are ignored
+    research_agent.reset_research_cache()
+    second = agent.research(
+        feature_request='Training of the PCIe link, gen5 link',
+        doc_paths=['specs/gen5.md'],
+    )
+
+    assert len(calls) == 6
+    assert second.existing_implementations == first.existing_implementations
+    assert second.internal_knowledge == first.internal_knowledge
+    assert [f.content for f in second.standards_and_specs] == ['Read specs/gen5.md']
+    assert 'Training of the PCIe link, gen5 link' in second.domain_overview
+
+    # A different generation is a different request
+    agent.research(feature_request='PCIe Gen6 link training')
+    assert len(calls) == 12
+
+    # Reuse is opt-in
+    ResearchAgent(llm=_DummyLLM([])).research(
+        feature_request='Training of the PCIe link, gen5 link',
+    )
+    assert len(calls) > 12
+
+
+def test_research_agent_parse_report_markdown_fallback():
+    from agents.research_agent import ResearchAgent
+
+    report = ResearchAgent._parse_report(
+        'PCIe loopback overview (see notes)\n'
+        '## Standards\n'
+        '- PCIe Base Spec 5.0 (Confidence: HIGH, Source: https://pcisig.com)\n'
+        '- Untagged bullet (see appendix)\n'
+        '## Internal Knowledge\n'
+        '* CN5000 loopback notes (source: wiki, confidence: medium)\n'
+        '## Open Questions\n'
+        '- Which lanes support loopback?\n'
+    )
+
+    assert report.domain_overview == 'PCIe loopback overview (see notes)'
+    assert [(f.content, f.confidence, f.source, f.source_url)
+            for f in report.standards_and_specs] == [
+        ('PCIe Base Spec 5.0', 'high', 'web', 'https://pcisig.com'),
+    ]
+    assert [(f.content, f.source_url) for f in report.internal_knowledge] == [
+        ('CN5000 loopback notes', 'wiki'),
+    ]
+    assert report.open_questions == ['Which lanes support loopback?']
+
+
+def test_research_agent_extract_keywords_dedupes_in_order():
+    from agents.research_agent import ResearchAgent
+
+    assert ResearchAgent._extract_keywords(
+        'Add the PCIe loopback test to PCIe-Gen5 cards, a loopback for CN5000'
+    ) == ['add', 'pcie', 'loopback', 'test', 'gen5', 'cards', 'cn5000']
+
+
+def test_research_agent_prompt_file_read_once(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    import os
+
+    from agents import base, research_agent
+
+    prompt = tmp_path / 'config' / 'prompts' / 'research_agent.md'
+    prompt.parent.mkdir(parents=True)
+    prompt.write_text('research v1', encoding='utf-8')
+    os.utime(prompt, (1_000_000, 1_000_000))
+    monkeypatch.chdir(tmp_path)
+    base._read_prompt.cache_clear()
+
+    for _ in range(3):
+        research_agent.ResearchAgent(llm=_DummyLLM([]))
+    info = base._read_prompt.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+    prompt.write_text('research v2', encoding='utf-8')
+    os.utime(prompt, (2_000_000, 2_000_000))
+    assert research_agent.ResearchAgent._load_prompt_file() == 'research v2'
+
+    prompt.unlink()
+    assert research_agent.ResearchAgent._load_prompt_file() is None
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_research_cache_file_round_trips(tmp_path, monkeypatch: pytest.MonkeyPatch, use_orjson):
+    from agents.research_agent import ResearchCache
+    from core import json_utils
+
+    if not use_orjson:
+        monkeypatch.setattr(json_utils, 'orjson', None)
+
+    payload = {'results': [{'title': 'PCIe Base Spec', 'snippet': 'Gen5 — 32 GT/s'}]}
+    ResearchCache(cache_dir=str(tmp_path)).put('k', payload, ttl=60)
+    with (tmp_path / 'results.jsonl').open('a', encoding='utf-8') as f:
+        f.write('not json\n')
+
+    assert ResearchCache(cache_dir=str(tmp_path)).get('k') == payload
+
+
+def test_research_cache_stays_in_memory_by_default(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from agents.research_agent import ResearchCache
+
+    monkeypatch.setenv('HOME', str(tmp_path))
+    cache = ResearchCache()
+    cache.put('k', {'n': 1}, ttl=60)
+
+    assert cache.path is None
+    assert cache.get('k') == {'n': 1}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_research_agent_knowledge_cache_follows_file_edits(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from agents.feature_planning_models import ResearchReport
+    from agents.research_agent import ResearchAgent
+    from tools import knowledge_tools
+
+    monkeypatch.setattr(
+        ResearchAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'research prompt'),
+    )
+    kb_file = tmp_path / 'pcie.md'
+    kb_file.write_text('# PCIe\nGen5\n', encoding='utf-8')
+    monkeypatch.setattr(knowledge_tools, 'KNOWLEDGE_DIR', str(tmp_path))
+    calls = []
+    monkeypatch.setattr(
+        knowledge_tools,
+        'search_knowledge',
+        lambda query, max_results=5: calls.append(query) or ToolResult.success({
+            'results': [{'heading': 'PCIe', 'content': kb_file.read_text()}],
+        }),
+    )
+
+    agent = ResearchAgent(llm=_DummyLLM([]))
+    agent._do_knowledge_search(ResearchReport(), ['pcie'])
+    agent._do_knowledge_search(ResearchReport(), ['pcie'])
+    assert len(calls) == 1
+
+    kb_file.write_text('# PCIe\nGen5 and Gen6\n', encoding='utf-8')
+    report = agent._do_knowledge_search(ResearchReport(), ['pcie'])
+
+    assert len(calls) == 2
+    assert 'Gen6' in report.internal_knowledge[0].content
+
+
+def test_research_cache_skips_unencodable_results(tmp_path):
+    from agents.research_agent import ResearchCache
+
+    cache = ResearchCache(cache_dir=str(tmp_path))
+    cache.put('big', {'n': 2 ** 70, 'nested': [[[]]]}, ttl=60)
+    cache.put('ok', {'n': 1}, ttl=60)
+
+    assert cache.get('big') == {'n': 2 ** 70, 'nested': [[[]]]}
+    assert ResearchCache(cache_dir=str(tmp_path)).get('ok') == {'n': 1}
+
+
+def test_research_agent_mcp_finding_truncates_while_encoding(monkeypatch: pytest.MonkeyPatch):
+    import json
+
+    from agents.feature_planning_models import ResearchReport
+    from agents.research_agent import MCP_FINDING_CHARS, ResearchAgent
+    from tools import mcp_tools
+
+    monkeypatch.setattr(
+        ResearchAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'research prompt'),
+    )
+    payload = {'items': [{'id': n, 'text': 'loopback ' * 10} for n in range(5000)]}
+    monkeypatch.setattr(mcp_tools, 'mcp_search', lambda query: ToolResult.success(payload))
+
+    agent = ResearchAgent(llm=_DummyLLM([]))
+    report = agent._do_mcp_search(ResearchReport(), 'PCIe loopback', ['pcie', 'loopback'])
+
+    [finding] = report.internal_knowledge
+    assert finding.content == json.dumps(payload, indent=2)[:MCP_FINDING_CHARS]
+
+
+def test_research_cache_evicts_lfu_and_expires(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from agents import research_agent
+    from agents.research_agent import ResearchCache
+
+    cache = ResearchCache(cache_dir=str(tmp_path), capacity=2)
+    cache.put('a', {'n': 1}, ttl=60)
+    cache.put('b', {'n': 2}, ttl=60)
+    assert cache.get('a') == {'n': 1}
+    assert cache.get('a') == {'n': 1}
+    assert cache.get('b') == {'n': 2}
+    cache.put('c', {'n': 3}, ttl=60)
+
+    # b was used more recently, but a has more hits
+    assert cache.get('b') is None
+    assert cache.get('a') == {'n': 1}
+
+    # Lookups stay in memory; compact() persists the counts
+    lines = (tmp_path / 'results.jsonl').read_text().splitlines()
+    assert len(lines) == 3
+    cache.compact()
+    reloaded = ResearchCache(cache_dir=str(tmp_path), capacity=2)
+    reloaded.put('d', {'n': 4}, ttl=60)
+    assert reloaded.get('c') is None
+    assert reloaded.get('a') == {'n': 1}
+
+    now = research_agent.time.time()
+    monkeypatch.setattr(research_agent.time, 'time', lambda: now + 61)
+    expired = ResearchCache(cache_dir=str(tmp_path), capacity=2)
+    assert expired.get('a') is None
+    assert (tmp_path / 'results.jsonl').read_text() == ''
+
+
+def test_research_cache_ages_out_stale_and_expired_entries(monkeypatch: pytest.MonkeyPatch):
+    from agents import research_agent
+    from agents.research_agent import ResearchCache
+
+    cache = ResearchCache(cache_dir='', capacity=2)
+    cache.put('old', {'n': 0}, ttl=60)
+    for _ in range(3):
+        cache.get('old')
+
+    # Newer entries inherit the victims' counts and overtake it
+    for key in ['b', 'c', 'd']:
+        cache.put(key, {'n': key}, ttl=60)
+        cache.get(key)
+        cache.get(key)
+    assert cache.get('old') is None
+    assert cache.get('d') == {'n': 'd'}
+
+    # An expired entry is evicted before any live one, whatever its count
+    cache.put('short', {'n': 's'}, ttl=1)
+    for _ in range(10):
+        cache.get('short')
+    now = research_agent.time.time()
+    monkeypatch.setattr(research_agent.time, 'time', lambda: now + 2)
+    cache.put('e', {'n': 'e'}, ttl=60)
+    assert cache.get('d') == {'n': 'd'}
+    assert cache.get('e') == {'n': 'e'}
+
+
+def test_research_cache_compacts_growing_file(tmp_path):
+    from agents.research_agent import ResearchCache
+
+    cache = ResearchCache(cache_dir=str(tmp_path), capacity=2)
+    for n in range(10):
+        cache.put('k', {'n': n}, ttl=60)
+
+    lines = (tmp_path / 'results.jsonl').read_text().splitlines()
+    assert len(lines) <= ResearchCache.COMPACT_FACTOR * 2
+    assert ResearchCache(cache_dir=str(tmp_path)).get('k') == {'n': 9}
+
+
+def test_review_agent_create_session_and_execute_approved_items(monkeypatch: pytest.MonkeyPatch):
+    from agents.review_agent import ApprovalStatus, ReviewAgent
+    from tools import jira_tools as jira_tools_module
+
+    monkeypatch.setattr(
+        ReviewAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'review prompt'),
+    )
+
+    create_release_calls = []
+    create_ticket_calls = []
+
+    monkeypatch.setattr(
+        jira_tools_module,
+        'create_release',
+        lambda **kwargs: (
+            create_release_calls.append(kwargs) or
+            ToolResult.success({'id': 'rel-1', 'name': kwargs['name']})
+        ),
+    )
+    monkeypatch.setattr(
+        jira_tools_module,
+        'create_ticket',
+        lambda **kwargs: (
+            create_ticket_calls.append(kwargs) or
+            ToolResult.success({'key': 'STL-900', 'summary': kwargs['summary']})
+        ),
+    )
+
+    agent = ReviewAgent(llm=_DummyLLM([]))
+    session = agent.create_session_from_plan({
+        'project_key': 'STL',
+        'releases': [
+            {
+                'name': '12.2.0',
+                'description': 'Q2 release',
+                'release_date': '2026-06-01',
+                'tickets': [
+                    {
+                        'summary': 'Initial summary',
+                        'description': 'Implement feature',
+                        'issue_type': 'Story',
+                        'components': ['Fabric'],
+                        'fix_versions': ['12.2.0'],
+                        'labels': ['agentic'],
+                    }
+                ],
+            }
+        ],
+    })
+
+    assert len(session.items) == 2
+    assert session.items[0].id == 'R1'
+    assert session.items[1].id == 'T2'
+
+    assert agent.approve_item(session, 'R1') is True
+    assert agent.modify_item(session, 'T2', {'summary': 'Revised summary'}) is True
+    assert session.items[0].status == ApprovalStatus.APPROVED
+    assert session.items[1].status == ApprovalStatus.MODIFIED
+
+    results = agent.execute_approved(session)
+
+    assert [result['item_id'] for result in results] == ['R1', 'T2']
+    assert create_release_calls[0]['name'] == '12.2.0'
+    assert create_ticket_calls[0]['summary'] == 'Revised summary'
+    assert session.items[0].status == ApprovalStatus.EXECUTED
+    assert session.items[1].status == ApprovalStatus.EXECUTED
+
+
+def test_feature_planning_orchestrator_merge_scope_dedups_open_questions():
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    merged = FeaturePlanningOrchestrator._merge_scope(
+        {
+            'summary': 'baseline summary',
+            'open_questions': [
+                {'question': 'Which PCIe GEN?'},
+                'STRASSE support?',
+                {'question': None},
+                'New baseline question',
+            ],
+        },
+        {
+            'firmware_items': [{'title': 'Boot loader'}],
+            'open_questions': [
+                {'question': 'which pcie gen?'},
+                'strasse support?',
+            ],
+        },
+    )
+
+    assert merged['summary'] == 'baseline summary'
+    assert merged['open_questions'] == [
+        {'question': 'which pcie gen?'},
+        'strasse support?',
+        'New baseline question',
+    ]
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_feature_planning_orchestrator_intermediate_json_round_trip(
+    monkeypatch: pytest.MonkeyPatch, tmp_path, use_orjson
+):
+    from agents import feature_planning_orchestrator as fpo
+    from core import json_utils
+
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_utils, 'orjson', None)
+    monkeypatch.setattr(
+        fpo.FeaturePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    agent = fpo.FeaturePlanningOrchestrator(
+        output_dir=str(tmp_path), llm=_DummyLLM([])
+    )
+
+    data = {
+        'feature_name': 'Fabric telemetry',
+        'firmware_items': [{'title': 'Counters'}],
+        'confidence_report': {1: 'non-str key'},
+    }
+    path = agent._save_intermediate('scope.json', data)
+    # The write is queued; later mutation must not leak into the file
+    data['firmware_items'].append({'title': 'Added later'})
+    agent.flush_writes()
+    scope = agent._parse_scope_document(path)
+
+    assert path == str(tmp_path / 'scope.json')
+    assert scope['feature_name'] == 'Fabric telemetry'
+    assert scope['firmware_items'] == [{'title': 'Counters'}]
+    assert scope['confidence_report'] == {'1': 'non-str key'}
+    assert scope['driver_items'] == []
+
+
+def test_feature_planning_orchestrator_fits_scope_text_to_token_budget():
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    fit = FeaturePlanningOrchestrator._fit_scope_text_to_budget
+    short = '# Scope\nSmall document'
+    long_text = 'A' * 400 + '\n## Middle Section\n' + 'B' * 400 + '\n' + 'C' * 400
+
+    assert fit(short, max_tokens=100) is short
+
+    trimmed = fit(long_text, max_tokens=100)
+
+    assert len(trimmed) < len(long_text)
+    assert trimmed.startswith('A' * 200)
+    assert trimmed.endswith('C' * 100)
+    assert '## Middle Section' in trimmed
+    assert 'characters omitted' in trimmed
+
+
+def test_feature_planning_orchestrator_parses_and_merges_multiple_scope_docs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    agent = FeaturePlanningOrchestrator(llm=_DummyLLM([]))
+    primary = tmp_path / 'primary.json'
+    extra = tmp_path / 'extra.json'
+    primary.write_text(json.dumps({
+        'feature_name': 'Primary feature',
+        'firmware_items': [{'title': 'Boot loader'}],
+    }))
+    extra.write_text(json.dumps({
+        'feature_name': 'Extra feature',
+        'firmware_items': [{'title': 'boot loader'}],
+        'test_items': [{'title': 'Soak test'}],
+    }))
+
+    scope = agent._parse_scope_documents([str(primary), str(extra)])
+
+    assert scope['feature_name'] == 'Primary feature'
+    assert scope['firmware_items'] == [{'title': 'Boot loader'}]
+    assert scope['test_items'] == [{'title': 'Soak test'}]
+    assert agent._parse_scope_documents(
+        [str(primary), str(tmp_path / 'missing.json')]
+    ) is None
+
+
+def test_feature_planning_orchestrator_splits_scope_doc_only_when_every_piece_exists(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    agent = FeaturePlanningOrchestrator(llm=_DummyLLM([]))
+    calls = []
+    monkeypatch.setattr(
+        agent, '_parse_scope_document', lambda path: calls.append(path)
+    )
+    monkeypatch.setattr(
+        agent, '_parse_scope_documents', lambda paths: calls.append(paths)
+    )
+    single = tmp_path / 'scope, v2.md'
+    single.write_text('# Scope')
+    primary = tmp_path / 'primary.md'
+    extra = tmp_path / 'extra.md'
+    primary.write_text('# Primary')
+    extra.write_text('# Extra')
+
+    agent._run_scope_to_plan(str(single))
+    agent._run_scope_to_plan(f'{primary}, {extra}')
+
+    assert calls == [str(single), [str(primary), str(extra)]]
+
+
+def test_feature_planning_orchestrator_scope_document_dispatch_reads_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    agent = FeaturePlanningOrchestrator(llm=_DummyLLM([]))
+    parsed_text = []
+    monkeypatch.setattr(
+        agent,
+        '_parse_scope_text',
+        lambda text, source='': parsed_text.append(text) or {'feature_name': source},
+    )
+    monkeypatch.setattr(
+        agent,
+        '_extract_document_text',
+        lambda doc_path, data=None, max_chars=None: f'extracted {len(data)} bytes',
+    )
+    no_ext_json = tmp_path / 'scope'
+    no_ext_json.write_text('{"feature_name": "Sniffed", "tool_items": [{"title": "CLI"}]}')
+    markdown = tmp_path / 'scope.md'
+    markdown.write_text('# Scope\n- item')
+    pdf = tmp_path / 'scope.bin'
+    pdf.write_bytes(b'%PDF-1.7 fake')
+
+    assert agent._parse_scope_document(str(no_ext_json))['feature_name'] == 'Sniffed'
+    assert agent._parse_scope_document(str(markdown)) == {'feature_name': str(markdown)}
+    assert agent._parse_scope_document(str(pdf)) == {'feature_name': str(pdf)}
+    assert parsed_text == ['# Scope\n- item', 'extracted 13 bytes']
+    assert agent._parse_scope_document(str(tmp_path / 'missing.md')) is None
+
+
+def test_feature_planning_orchestrator_caches_extracted_document_text(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    extract_calls = []
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator,
+        '_extract_document_text',
+        staticmethod(
+            lambda doc_path, data=None, max_chars=None:
+                extract_calls.append(doc_path) or 'spec text'
+        ),
+    )
+    pdf = tmp_path / 'spec.pdf'
+    pdf.write_bytes(b'%PDF-1.7 spec')
+    copy = tmp_path / 'copy.pdf'
+    copy.write_bytes(b'%PDF-1.7 spec')
+    cache_dir = tmp_path / 'cache'
+
+    agent = FeaturePlanningOrchestrator(doc_cache_dir=str(cache_dir), llm=_DummyLLM([]))
+    assert agent._cached_extract(str(pdf)) == 'spec text'
+    assert agent._cached_extract(str(copy)) == 'spec text'
+
+    # A fresh instance (e.g. a rerun) reads from the on-disk cache
+    rerun = FeaturePlanningOrchestrator(doc_cache_dir=str(cache_dir), llm=_DummyLLM([]))
+    assert rerun._cached_extract(str(pdf), data=pdf.read_bytes()) == 'spec text'
+
+    assert extract_calls == [str(pdf)]
+    assert [p.suffix for p in cache_dir.iterdir()] == ['.txt']
+
+
+def test_research_agent_document_read_uses_preextracted_text(monkeypatch: pytest.MonkeyPatch):
+    from agents.feature_planning_models import ResearchReport
+    from agents.research_agent import ResearchAgent
+    from tools import knowledge_tools
+
+    monkeypatch.setattr(
+        ResearchAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'research prompt'),
+    )
+    read_calls = []
+    monkeypatch.setattr(
+        knowledge_tools,
+        'read_document',
+        lambda file_path, max_chars=None: read_calls.append(file_path) or ToolResult.success({
+            'content': f'Read {file_path}',
+        }),
+    )
+
+    agent = ResearchAgent(llm=_DummyLLM([]))
+    report = agent._do_document_read(
+        ResearchReport(),
+        ['specs/datasheet.pdf', 'specs/notes.md'],
+        {'specs/datasheet.pdf': 'Extracted datasheet text'},
+    )
+
+    assert read_calls == ['specs/notes.md']
+    assert [f.content for f in report.standards_and_specs] == [
+        'Extracted datasheet text',
+        'Read specs/notes.md',
+    ]
+
+
+def test_read_document_stops_at_max_chars(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from tools import knowledge_tools
+
+    doc = tmp_path / 'spec.md'
+    doc.write_text('line one\nline two\n' * 1000, encoding='utf-8')
+
+    result = knowledge_tools.read_document(file_path=str(doc), max_chars=12)
+    assert result.data['content'] == 'line one\nlin'
+    assert result.data['truncated'] is True
+    assert (result.data['line_count'], result.data['word_count']) == (2, 3)
+    full = knowledge_tools.read_document(file_path=str(doc))
+    assert full.data['content'] == doc.read_text(encoding='utf-8')
+    assert full.data['truncated'] is False
+    exact = knowledge_tools.read_document(file_path=str(doc), max_chars=18000)
+    assert exact.data['truncated'] is False
+
+    # Zero is a limit, not "unlimited"
+    empty = knowledge_tools.read_document(file_path=str(doc), max_chars=0)
+    assert (empty.data['content'], empty.data['truncated']) == ('', True)
+
+    # Paged formats stop extracting once enough text has been collected
+    extracted = []
+
+    def _pages():
+        for n in range(100):
+            extracted.append(n)
+            yield f'page {n}'
+
+    assert knowledge_tools._join_until(_pages(), 14) == 'page 0\n\npage 1'
+    assert extracted == [0, 1]
+
+
+def test_research_agent_document_read_runs_concurrently(monkeypatch: pytest.MonkeyPatch):
+    import threading
+
+    from agents.feature_planning_models import ResearchReport
+    from agents.research_agent import ResearchAgent
+    from tools import knowledge_tools
+
+    monkeypatch.setattr(
+        ResearchAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'research prompt'),
+    )
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _read_document(file_path, max_chars=None):
+        barrier.wait()
+        if file_path == 'specs/b.md':
+            raise OSError('unreadable')
+        return ToolResult.success({'content': f'Read {file_path}'})
+
+    monkeypatch.setattr(knowledge_tools, 'read_document', _read_document)
+
+    agent = ResearchAgent(llm=_DummyLLM([]))
+    report = agent._do_document_read(
+        ResearchReport(),
+        ['specs/a.md', 'specs/b.md', 'specs/c.md'],
+    )
+
+    assert [f.source_url for f in report.standards_and_specs] == [
+        'specs/a.md',
+        'specs/c.md',
+    ]
+    assert report.open_questions == ['Could not read document: specs/b.md (unreadable)']
+
+
+def test_feature_planning_orchestrator_hw_phase_merges_concurrent_passes(
+    monkeypatch: pytest.MonkeyPatch
+):
+    import threading
+
+    from agents.base import AgentResponse
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+    from agents.feature_planning_models import FeaturePlanningState
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    both_started = threading.Barrier(2, timeout=5)
+
+    class _FakeHwAnalyst:
+        def analyze(self, feature_request, project_key, research_report=None):
+            both_started.wait()
+            return SimpleNamespace(
+                components=[{'name': 'ASIC'}],
+                existing_firmware=[],
+                to_dict=lambda: {'product_name': 'CN5000', 'components': [{'name': 'ASIC'}]},
+            )
+
+        def run(self, input_data):
+            both_started.wait()
+            return AgentResponse.success_response(
+                'llm profile',
+                metadata={'hw_profile': {'components': [{'name': 'PHY'}, {'name': 'asic'}]}},
+            )
+
+    agent = FeaturePlanningOrchestrator(llm=_DummyLLM([]))
+    agent.state = FeaturePlanningState(feature_request='Telemetry', project_key='STL')
+    agent._hw_analyst = _FakeHwAnalyst()
+
+    summary = agent._phase_hw_analysis()
+
+    assert summary.startswith('PHASE 2: Hardware Analysis — COMPLETE')
+    assert [c['name'] for c in agent.state.hw_profile['components']] == ['ASIC', 'PHY']
+    assert 'hw_analysis' in agent.state.completed_phases
+
+
+def test_feature_planning_orchestrator_execution_creates_stories_in_plan_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    import itertools
+    import threading
+
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+    from agents.feature_planning_models import FeaturePlanningState
+    from tools import jira_tools as jira_tools_module
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    counter = itertools.count(100)
+    lock = threading.Lock()
+
+    def _create_ticket(**kwargs):
+        with lock:
+            key = f'STL-{next(counter)}'
+        return ToolResult.success({'key': key, 'summary': kwargs['summary']})
+
+    links = []
+    monkeypatch.setattr(jira_tools_module, 'create_ticket', _create_ticket)
+    monkeypatch.setattr(
+        jira_tools_module,
+        'link_tickets',
+        lambda **kwargs: links.append((kwargs['from_key'], kwargs['to_key'])) or ToolResult.success({}),
+    )
+    monkeypatch.setattr(
+        jira_tools_module, 'search_tickets', lambda **kwargs: ToolResult.success([])
+    )
+
+    agent = FeaturePlanningOrchestrator(output_dir=str(tmp_path), llm=_DummyLLM([]))
+    agent._force = True
+    agent.state = FeaturePlanningState(feature_request='Telemetry', project_key='STL')
+    agent.state.jira_plan = {
+        'project_key': 'STL',
+        'feature_name': 'Telemetry',
+        'epics': [{
+            'summary': 'Collect counters',
+            'stories': [{'summary': f'Story {i}'} for i in range(5)],
+        }],
+    }
+
+    response = agent._phase_execution()
+
+    stories = [t for t in response.metadata['created_tickets'] if t['type'] == 'Story']
+    assert [t['summary'] for t in stories] == [f'[Telemetry] Story {i}' for i in range(5)]
+    assert {t['parent'] for t in stories} == {'STL-101'}
+    assert links == [(a['key'], b['key']) for a, b in zip(stories, stories[1:])]
+    assert response.metadata['execution_errors'] == []
+    assert response.content.startswith('PHASE 6: Jira Execution — COMPLETE\n')
+    assert '\n\nCreated Tickets:\n' in response.content
+    assert response.content.endswith(
+        f'--cleanup {response.metadata["created_csv_path"]} --execute'
+    )
+
+
+def test_feature_planning_orchestrator_extracts_docx_paragraphs_and_tables(tmp_path):
+    docx = pytest.importorskip('docx')
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    document = docx.Document()
+    document.add_paragraph('Scope overview')
+    paragraph = document.add_paragraph('Firmware ')
+    paragraph.add_run('update')
+    table = document.add_table(rows=1, cols=1)
+    table.cell(0, 0).text = 'PCIe Gen5'
+    path = tmp_path / 'scope.docx'
+    document.save(str(path))
+
+    text = FeaturePlanningOrchestrator._extract_document_text(str(path))
+
+    assert text.splitlines() == ['Scope overview', 'Firmware update', 'PCIe Gen5']
+    assert FeaturePlanningOrchestrator._extract_document_text(
+        'scope.docx', data=path.read_bytes()
+    ) == text
+
+
+def test_feature_planning_orchestrator_summarize_counts_treats_missing_as_zero():
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    counts = FeaturePlanningOrchestrator._summarize_counts(
+        {'firmware_items': [1, 2], 'driver_items': None},
+        ('firmware_items', 'driver_items', 'tool_items'),
+    )
+
+    assert counts == {'firmware_items': 2, 'driver_items': 0, 'tool_items': 0}
+
+
+def test_feature_planning_orchestrator_lazy_import_caches_missing_backend(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import agents.feature_planning_orchestrator as fpo
+
+    monkeypatch.setattr(fpo, '_LAZY_MODULES', {})
+    calls = []
+    real_import = fpo.importlib.import_module
+
+    def _fake_import(name):
+        calls.append(name)
+        return real_import(name)
+
+    monkeypatch.setattr(fpo.importlib, 'import_module', _fake_import)
+
+    assert fpo._lazy_import('no_such_pdf_backend_xyz') is None
+    assert fpo._lazy_import('no_such_pdf_backend_xyz') is None
+    assert fpo._lazy_import('json') is json
+    assert fpo._lazy_import('json') is json
+    assert calls == ['no_such_pdf_backend_xyz', 'json']
+
+
+def test_feature_planning_orchestrator_pdf_backend_order_from_env(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import agents.feature_planning_orchestrator as fpo
+
+    monkeypatch.delenv('JIRA_PDF_BACKEND_ORDER', raising=False)
+    assert fpo._pdf_extractors() == fpo._PDF_EXTRACTORS
+
+    monkeypatch.setenv('JIRA_PDF_BACKEND_ORDER', 'pdfplumber, bogus,PyMuPDF')
+    assert fpo._pdf_extractors() == (
+        fpo._extract_pdfplumber, fpo._extract_pymupdf,
+        fpo._extract_pdfium, fpo._extract_pypdf2,
+    )
+
+    tried = []
+    monkeypatch.setattr(fpo, '_PDF_BACKENDS', {
+        'first': lambda p, d, m: tried.append('first') or '',
+        'second': lambda p, d, m: tried.append('second') or 'page text',
+    })
+    monkeypatch.setenv('JIRA_PDF_BACKEND_ORDER', 'first,second')
+    assert fpo.FeaturePlanningOrchestrator._extract_document_text(
+        'doc.pdf', data=b'%PDF-1.4'
+    ) == 'page text'
+    assert tried == ['first', 'second']
+
+
+def test_feature_planning_orchestrator_reuses_cached_phase_result(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    from agents.feature_planning_models import FeaturePlanningState
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator, '_load_prompt_file', staticmethod(lambda: 'prompt')
+    )
+    agent = FeaturePlanningOrchestrator(output_dir=str(tmp_path), llm=_DummyLLM([]))
+    agent._reuse_cache = True
+    agent.state = FeaturePlanningState(feature_request='Telemetry', project_key='STL')
+
+    inputs = {'feature_request': 'Telemetry', 'docs': [], 'skip_llm_min_findings': 0}
+    assert agent._load_phase_cache('research', inputs) is None
+
+    agent._store_phase_cache(
+        'research', inputs, {'domain_overview': 'cached'}, 'PHASE 1: Research — COMPLETE'
+    )
+    agent.flush_writes()
+
+    cached = agent._load_phase_cache('research', inputs)
+    assert cached == {
+        'result': {'domain_overview': 'cached'},
+        'summary': 'PHASE 1: Research — COMPLETE',
+    }
+    assert agent._load_phase_cache('research', {**inputs, 'docs': ['x']}) is None
+    assert agent._load_phase_cache(
+        'research', {**inputs, 'skip_llm_min_findings': 3}
+    ) is None
+    assert not any('cache' in f for f in agent._created_files)
+
+    def _must_not_run(*args, **kwargs):
+        raise AssertionError('cached phase should not re-run its passes')
+
+    monkeypatch.setattr(agent, '_run_two_pass', _must_not_run)
+    result = agent._phase_research()
+
+    assert agent.state.research_report == {'domain_overview': 'cached'}
+    assert result.endswith('(reused cached result)')
+
+    # A run that may skip the LLM pass does not reuse a full two-pass result
+    lookups = []
+    load = agent._load_phase_cache
+    monkeypatch.setattr(
+        agent, '_load_phase_cache',
+        lambda phase, phase_inputs: lookups.append(load(phase, phase_inputs)),
+    )
+    agent._skip_llm_min_findings = 3
+    agent._phase_research()
+    assert lookups == [None]
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_feature_planning_orchestrator_save_plan_to_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path, use_orjson
+):
+    from agents import feature_planning_orchestrator as fpo
+    from core import json_utils
+
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_utils, 'orjson', None)
+    monkeypatch.setattr(
+        fpo.FeaturePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    agent = fpo.FeaturePlanningOrchestrator(llm=_DummyLLM([]))
+    plan = {'feature_name': 'Fabric — telemetry', 'epics': [{'summary': 'FW'}]}
+    agent.state.jira_plan = plan
+
+    path = agent.save_plan_to_file(str(tmp_path / 'plan.json'), sync=True)
+
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == plan
+
+
+def test_feature_planning_orchestrator_save_plan_writes_in_background(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator, '_load_prompt_file', staticmethod(lambda: 'prompt')
+    )
+    agent = FeaturePlanningOrchestrator(llm=_DummyLLM([]))
+    agent.state.jira_plan = {'epics': [], 'summary_markdown': '# Plan\n'}
+
+    json_path = agent.save_plan_to_file(str(tmp_path / 'plan.json'))
+    md_path = agent.save_markdown_to_file(str(tmp_path / 'plan.md'))
+    agent.flush_writes()
+
+    with open(json_path, encoding='utf-8') as f:
+        assert json.load(f) == agent.state.jira_plan
+    with open(md_path, encoding='utf-8') as f:
+        assert f.read() == '# Plan\n'
+    assert agent._created_files == []
+
+
+def test_feature_planning_orchestrator_skips_llm_pass_on_sufficient_baseline(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from agents.feature_planning_models import FeaturePlanningState, HardwareProfile
+    from agents.feature_planning_orchestrator import FeaturePlanningOrchestrator
+
+    monkeypatch.setattr(
+        FeaturePlanningOrchestrator, '_load_prompt_file', staticmethod(lambda: 'prompt')
+    )
+    agent = FeaturePlanningOrchestrator(llm=_DummyLLM([]), skip_llm_min_findings=2)
+    agent.state = FeaturePlanningState(feature_request='Telemetry', project_key='STL')
+
+    baseline = HardwareProfile(
+        product_name='CN5000',
+        components=[{'name': 'ASIC'}],
+        existing_firmware=[{'name': 'boot'}],
+    )
+
+    def _llm_run(_input):
+        raise AssertionError('LLM pass should be skipped')
+
+    agent._hw_analyst = SimpleNamespace(analyze=lambda *a: baseline, run=_llm_run)
+
+    result = agent._phase_hw_analysis()
+
+    assert result.startswith('PHASE 2: Hardware Analysis — COMPLETE')
+    assert agent.state.hw_profile == baseline.to_dict()
+
+    # A baseline with gaps still gets enriched
+    baseline.gaps.append('No register map')
+    assert not agent._hw_baseline_sufficient(baseline)
+
+
+def test_feature_planning_state_unwraps_read_only_phase_outputs():
+    from types import MappingProxyType
+
+    from agents.feature_planning_models import FeaturePlanningState
+
+    report = {'domain_overview': 'Telemetry', 'open_questions': []}
+    state = FeaturePlanningState(research_report=MappingProxyType(report))
+
+    with pytest.raises(TypeError):
+        state.research_report['domain_overview'] = 'changed'
+
+    data = state.to_dict()
+    assert type(data['research_report']) is dict
+    assert json.loads(json.dumps(data))['research_report'] == report
+
+
+def test_feature_planning_orchestrator_join_page_text_stops_at_budget():
+    from agents.feature_planning_orchestrator import TRUNCATED_MARKER, _join_page_text
+
+    pulled = []
+
+    def _pages():
+        for i in range(100):
+            pulled.append(i)
+            yield 'x' * 10
+
+    text = _join_page_text(_pages(), max_chars=25)
+
+    assert text == 'x' * 10 + '\n' + 'x' * 10 + '\n' + 'xxx' + TRUNCATED_MARKER
+    assert pulled == [0, 1, 2]
+    assert _join_page_text(['a', 'b'], max_chars=25) == 'a\nb'
+
+
+def test_feature_planning_orchestrator_join_page_text_skips_blank_pages():
+    from agents.feature_planning_orchestrator import _join_page_text
+
+    assert _join_page_text([None, 'title', '', None, 'body', '']) == 'title\nbody'
+    assert _join_page_text([None, '']) == ''
+
+
+def test_hardware_analyst_analyze_runs_jira_lookups_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import threading
+
+    from agents import hardware_analyst
+    from agents.hardware_analyst import HardwareAnalystAgent
+
+    monkeypatch.setattr(
+        HardwareAnalystAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'hardware analyst prompt'),
+    )
+    # Project, components and the three ticket searches must all be in
+    # flight at once to pass the barrier
+    barrier = threading.Barrier(5, timeout=5)
+
+    def _project_info(project_key):
+        barrier.wait()
+        return ToolResult.success({'key': project_key, 'name': 'Jira Project'})
+
+    def _components(project_key):
+        barrier.wait()
+        return ToolResult.success([
+            {'name': 'Firmware Core', 'description': 'fw'},
+            {'name': 'HFI Driver', 'description': 'drv'},
+            {'name': 'Fabric', 'description': ''},
+        ])
+
+    def _search(jql, limit=100, fields=None, batch_size=None):
+        barrier.wait()
+        assert fields == ['summary', 'status']
+        assert (limit, batch_size) == (20, 500)
+        shared = {'key': 'STL-2', 'summary': 'Driver firmware handshake', 'status': 'Open'}
+        if '"diagnostic"' in jql:
+            return ToolResult.success([
+                {'key': 'STL-1', 'summary': 'Diagnostic tool rework', 'status': 'Open'},
+            ])
+        return ToolResult.success([shared])
+
+    monkeypatch.setattr(hardware_analyst, 'get_project_info', _project_info)
+    monkeypatch.setattr(hardware_analyst, 'get_components', _components)
+    monkeypatch.setattr(hardware_analyst, 'search_tickets', _search)
+    monkeypatch.setattr(
+        hardware_analyst,
+        'read_knowledge_file',
+        lambda file_path: ToolResult.success({'content': 'Omni-Path fabric'}),
+    )
+    hardware_analyst._read_cornelis_products.cache_clear()
+
+    agent = HardwareAnalystAgent(llm=_DummyLLM([]))
+    profile = agent.analyze('feature', 'STL')
+
+    # Knowledge base naming wins over the Jira project name
+    assert profile.product_name == 'Omni-Path Express (OPX)'
+    assert profile.description == 'Omni-Path fabric'
+    assert [c['name'] for c in profile.existing_firmware] == [
+        'Firmware Core', 'Driver firmware handshake',
+    ]
+    # STL-2 came back from both firmware and driver searches; filed once
+    assert [c['name'] for c in profile.existing_drivers] == ['HFI Driver']
+    assert [c['jira_key'] for c in profile.existing_tools] == ['STL-1']
+    assert [c['name'] for c in profile.components] == ['Fabric']
+
+
+def test_hardware_analyst_parse_profile_markdown_fallback_sections():
+    from agents.hardware_analyst import HardwareAnalystAgent
+
+    profile = HardwareAnalystAgent._parse_profile(
+        '## Product Overview\n'
+        '- Product name: CN5000\n'
+        '## Hardware Architecture\n'
+        '- ASIC: switch silicon\n'
+        '## Drivers and Firmware\n'
+        '- Boot loader\n'
+        '- Hands off to the kernel driver\n'
+        '**Knowledge Gaps**\n'
+        '- Unknown PHY vendor\n'
+        '```mermaid\ngraph TD\n  A-->B\n```\n'
+    )
+
+    assert profile.product_name == 'CN5000'
+    assert [c['name'] for c in profile.components] == ['ASIC']
+    # 'firmware' outranks 'driver' regardless of position on the line
+    # A bullet mentioning 'driver' stays under the current heading
+    assert [f['name'] for f in profile.existing_firmware] == [
+        'Boot loader', 'Hands off to the kernel driver',
+    ]
+    assert profile.existing_drivers == []
+    assert profile.gaps == ['Unknown PHY vendor']
+    assert profile.block_diagram == 'graph TD\n  A-->B'
+
+
+def test_hardware_analyst_enrich_from_research_canonicalizes_buses(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from agents.feature_planning_models import HardwareProfile
+    from agents.hardware_analyst import HardwareAnalystAgent
+
+    monkeypatch.setattr(
+        HardwareAnalystAgent,
+        '_load_prompt_file',
+        staticmethod(lambda: 'hardware analyst prompt'),
+    )
+    agent = HardwareAnalystAgent(llm=_DummyLLM([]))
+    profile = HardwareProfile(bus_interfaces=[{'name': 'USB'}])
+
+    agent._enrich_from_research(profile, {
+        'standards_and_specs': [
+            {'content': 'Boot ROM loads over QSPI; host link is PCI Express.'},
+        ],
+        'existing_implementations': [
+            {'content': 'PCIe Gen5 endpoint, debug UARTs, USB console.'},
+        ],
+        'open_questions': ['Which PHY?'],
+    })
+
+    assert [b['name'] for b in profile.bus_interfaces] == [
+        'USB', 'QSPI', 'PCIe', 'UART',
+    ]
+    assert profile.gaps == ['Which PHY?']
+
+
+def test_hardware_analyst_prompt_file_cached_until_modified(
+    tmp_path, monkeypatch: pytest.MonkeyPatch,
+):
+    import os
+
+    from agents import base, hardware_analyst
+
+    prompt = tmp_path / 'config' / 'prompts' / 'hardware_analyst.md'
+    prompt.parent.mkdir(parents=True)
+    prompt.write_text('v1', encoding='utf-8')
+    os.utime(prompt, (1_000_000, 1_000_000))
+    monkeypatch.chdir(tmp_path)
+    base._read_prompt.cache_clear()
+
+    load = hardware_analyst.HardwareAnalystAgent._load_prompt_file
+    assert load() == 'v1'
+    assert load() == 'v1'
+    assert base._read_prompt.cache_info().hits == 1
+
+    prompt.write_text('v2', encoding='utf-8')
+    os.utime(prompt, (2_000_000, 2_000_000))
+    assert load() == 'v2'
+
+
+def test_hardware_analyst_product_knowledge_cached_by_mtime(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from agents import hardware_analyst
+    from agents.feature_planning_models import HardwareProfile
+
+    reads = []
+
+    def _read(file_path):
+        reads.append(file_path)
+        return ToolResult.success({'content': 'OPX product notes'})
+
+    mtime = [100.0]
+    monkeypatch.setattr(hardware_analyst, 'read_knowledge_file', _read)
+    monkeypatch.setattr(hardware_analyst.os.path, 'getmtime', lambda path: mtime[0])
+    hardware_analyst._read_cornelis_products.cache_clear()
+    load = hardware_analyst.HardwareAnalystAgent._load_product_knowledge
+
+    first = load(None, HardwareProfile())
+    second = load(None, HardwareProfile())
+    mtime[0] = 200.0
+    load(None, HardwareProfile())
+
+    assert first.product_name == second.product_name == 'Omni-Path Express (OPX)'
+    assert second.description == 'OPX product notes'
+    assert len(reads) == 2
+
+
+def test_hardware_analyst_classify_component_by_token():
+    from agents.hardware_analyst import _classify_component
+
+    assert _classify_component('FW-Mgmt') == 'existing_firmware'
+    assert _classify_component('hfi1_driver') == 'existing_drivers'
+    assert _classify_component('Diagnostics Tools') == 'existing_tools'
+    # Firmware outranks drivers when both appear
+    assert _classify_component('Driver / Firmware Interface') == 'existing_firmware'
+    # Substrings inside other words no longer match
+    assert _classify_component('Cable Clip') == ''
+
+
+def test_hardware_analyst_missing_prompt_file_raises(
+    tmp_path, monkeypatch: pytest.MonkeyPatch,
+):
+    from agents.hardware_analyst import HardwareAnalystAgent
+
+    monkeypatch.chdir(tmp_path)
+
+    assert HardwareAnalystAgent._load_prompt_file() is None
+    with pytest.raises(FileNotFoundError):
+        HardwareAnalystAgent(llm=_DummyLLM([]))
+
+
+def _bare_release_orchestrator(**sub_agents):
+    from agents.orchestrator import ReleasePlanningOrchestrator, WorkflowState
+
+    # Skip __init__: sub-agents and state are supplied directly
+    orchestrator = ReleasePlanningOrchestrator.__new__(ReleasePlanningOrchestrator)
+    for name, agent in sub_agents.items():
+        setattr(orchestrator, name, agent)
+    orchestrator.state = WorkflowState(project_key='STL')
+    return orchestrator
+
+
+def test_release_orchestrator_runs_analysis_tasks_concurrently():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _analyze_roadmaps(files):
+        barrier.wait()
+        return {'files_analyzed': files, 'releases': [{'version': '12.0'}]}
+
+    def _analyze_project(project_key):
+        barrier.wait()
+        return {'project_key': project_key, 'summary': {'total_releases': 3}}
+
+    orchestrator = _bare_release_orchestrator(
+        vision_analyzer=SimpleNamespace(analyze_multiple_parallel=_analyze_roadmaps),
+        jira_analyst=SimpleNamespace(analyze_project=_analyze_project),
+    )
+    orchestrator.state.roadmap_files = ['roadmap.png']
+
+    response = orchestrator._run_analysis()
+
+    assert response.success
+    assert orchestrator.state.roadmap_data['files_analyzed'] == ['roadmap.png']
+    assert orchestrator.state.jira_state['project_key'] == 'STL'
+    assert 'Existing releases: 3' in response.content
+
+
+def test_release_orchestrator_analysis_skips_populated_state():
+    def _unexpected(*args, **kwargs):
+        raise AssertionError('populated analysis was recomputed')
+
+    orchestrator = _bare_release_orchestrator(
+        vision_analyzer=SimpleNamespace(analyze_multiple_parallel=_unexpected),
+        jira_analyst=SimpleNamespace(
+            analyze_project=lambda key: {'project_key': key, 'summary': {}},
+        ),
+    )
+    orchestrator.state.roadmap_files = ['roadmap.png']
+    orchestrator.state.roadmap_data = {'releases': [{'version': '12.0'}]}
+
+    response = orchestrator._run_analysis()
+
+    assert response.success
+    assert orchestrator.state.roadmap_data == {'releases': [{'version': '12.0'}]}
+    assert orchestrator.state.jira_state == {'project_key': 'STL', 'summary': {}}
+
+    orchestrator.jira_analyst = SimpleNamespace(analyze_project=_unexpected)
+    assert orchestrator._run_analysis().success
+
+
+def test_release_orchestrator_workflow_summary_marks_each_step():
+    from agents.orchestrator import ReleasePlanningOrchestrator, StepResult
+
+    text = ReleasePlanningOrchestrator.__new__(
+        ReleasePlanningOrchestrator
+    )._format_full_workflow_results([
+        StepResult('analysis', SimpleNamespace(success=True)),
+        StepResult('review', SimpleNamespace(success=False)),
+    ])
+
+    assert '✓ ANALYSIS\n✗ REVIEW' in text
+
+
+def test_release_orchestrator_builds_sub_agents_on_first_use(monkeypatch: pytest.MonkeyPatch):
+    from agents import orchestrator as orchestrator_module
+    from agents import review_agent as review_module
+
+    monkeypatch.setattr(
+        orchestrator_module.ReleasePlanningOrchestrator,
+        '_load_prompt_file',
+        staticmethod(lambda: 'orchestrator prompt'),
+    )
+    built = []
+
+    class _FakeReviewAgent:
+        def __init__(self):
+            built.append('review')
+
+    monkeypatch.setattr(review_module, 'ReviewAgent', _FakeReviewAgent)
+
+    orchestrator = orchestrator_module.ReleasePlanningOrchestrator(llm=_DummyLLM([]))
+
+    assert built == []
+    assert orchestrator.review_agent is orchestrator.review_agent
+    assert built == ['review']
+    assert 'jira_analyst' not in vars(orchestrator)
+
+
+def test_orchestrator_import_defers_sub_agent_modules():
+    import subprocess
+    import sys
+
+    code = (
+        'import sys, agents.orchestrator, agents; '
+        'print(sorted(m for m in sys.modules if m in {'
+        '"agents.planning_agent", "agents.review_agent", '
+        '"agents.vision_analyzer", "agents.jira_analyst"})); '
+        'print(agents.PlanningAgent.__module__)'
+    )
+    out = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+    ).stdout.splitlines()
+
+    assert out[-2:] == ['[]', 'agents.planning_agent']
+
+
+def test_vision_analyzer_parallel_matches_serial_merge(tmp_path):
+    from agents.vision_analyzer import VisionAnalyzerAgent
+
+    paths = []
+    for name in ('a.txt', 'b.txt', 'c.txt'):
+        path = tmp_path / name
+        path.write_text('notes')
+        paths.append(str(path))
+
+    # Neither path uses agent state, so skip __init__ (LLM/tool setup)
+    agent = VisionAnalyzerAgent.__new__(VisionAnalyzerAgent)
+
+    parallel = agent.analyze_multiple_parallel(paths, workers=2)
+    serial = agent.analyze_multiple(paths)
+
+    assert parallel == serial
+    assert parallel['errors'] == ['Unsupported file type: unknown'] * 3
+
+
+def test_vision_analyzer_parallel_reports_file_errors_and_falls_back_on_broken_pool(
+    tmp_path, monkeypatch: pytest.MonkeyPatch,
+):
+    import pickle
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+
+    from agents import vision_analyzer
+    from agents.vision_analyzer import VisionAnalyzerAgent
+
+    contexts = []
+    failures = {}
+
+    class _Pool:
+        def __init__(self, max_workers=None, mp_context=None):
+            contexts.append(mp_context.get_start_method())
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def submit(self, fn, file_path):
+            future = Future()
+            if file_path in failures:
+                future.set_exception(failures[file_path])
+            else:
+                future.set_result(fn(file_path))
+            return future
+
+    monkeypatch.setattr(vision_analyzer, 'ProcessPoolExecutor', _Pool)
+    paths = [str(tmp_path / 'a.txt'), str(tmp_path / 'b.txt')]
+    agent = VisionAnalyzerAgent.__new__(VisionAnalyzerAgent)
+    calls = []
+    original = VisionAnalyzerAgent.analyze_multiple
+    monkeypatch.setattr(
+        VisionAnalyzerAgent, 'analyze_multiple',
+        lambda self, file_paths: calls.append(file_paths) or original(self, file_paths),
+    )
+
+    failures[paths[1]] = pickle.PicklingError('result does not pickle')
+    result = agent.analyze_multiple_parallel(paths)
+
+    assert contexts == ['spawn']
+    assert calls == []
+    assert [f['success'] for f in result['files_analyzed']] == [True, False]
+    assert any('result does not pickle' in e for e in result['errors'])
+
+    failures[paths[1]] = BrokenProcessPool('worker died')
+    result = agent.analyze_multiple_parallel(paths)
+
+    assert calls == [paths]
+    assert result == original(agent, paths)
+
+
+def test_release_workflow_state_to_dict_shares_nested_data():
+    from agents.orchestrator import WorkflowState
+
+    state = WorkflowState(project_key='STL', jira_state={'summary': {}})
+    data = state.to_dict()
+
+    assert list(data) == [
+        'roadmap_files', 'org_chart_file', 'project_key', 'roadmap_data',
+        'org_chart_data', 'jira_state', 'release_plan', 'execution_results',
+        'current_step', 'errors',
+    ]
+    assert data['jira_state'] is state.jira_state
+
+
+def test_release_orchestrator_format_plan_truncates_ticket_list():
+    orchestrator = _bare_release_orchestrator()
+    orchestrator.state.release_plan = {
+        'project_key': 'STL',
+        'releases': [
+            {'name': '12.0', 'tickets': [{'summary': f'T{i}'} for i in range(12)]},
+            {'name': '12.1', 'tickets': None},
+        ],
+    }
+
+    content = orchestrator._format_plan()
+
+    assert '    [Story] T9' in content
+    assert 'T10' not in content
+    assert '    ... and 2 more' in content
+    assert content.count('  Tickets: ') == 2
+
+
+def test_release_plan_to_dict_copies_ticket_lists():
+    from agents.planning_agent import PlannedRelease, PlannedTicket, ReleasePlan
+
+    ticket = PlannedTicket(summary='Epic', issue_type='Epic', fix_versions=['12.0'])
+    plan = ReleasePlan(
+        project_key='STL',
+        releases=[PlannedRelease(name='12.0', tickets=[ticket]), PlannedRelease(name='12.1')],
+    )
+
+    data = plan.to_dict()
+    data['releases'][0]['tickets'][0]['fix_versions'].append('12.1')
+
+    assert ticket.fix_versions == ['12.0']
+    assert (data['total_releases'], data['total_tickets']) == (2, 1)
+
+
+def test_planning_agent_templates_cached_until_directory_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    from agents import planning_agent
+
+    (tmp_path / 'epic.json').write_text('{"issue_type": "Epic"}')
+    (tmp_path / 'notes.txt').write_text('ignored')
+    monkeypatch.setattr(planning_agent, 'TEMPLATE_DIR', str(tmp_path))
+    planning_agent._read_templates.cache_clear()
+    load = planning_agent.PlanningAgent._load_templates
+
+    assert load(None) == {'epic': {'issue_type': 'Epic'}}
+    assert load(None) == {'epic': {'issue_type': 'Epic'}}
+    assert planning_agent._read_templates.cache_info().misses == 1
+
+    (tmp_path / 'story.json').write_text('{"issue_type": "Story"}')
+
+    assert sorted(load(None)) == ['epic', 'story']
+    assert planning_agent._read_templates.cache_info().misses == 2
+
+
+def test_planning_agent_templates_parse_without_orjson(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    from agents import planning_agent
+    from core import json_utils
+
+    (tmp_path / 'epic.json').write_text('{"summary": "Épica"}', encoding='utf-8')
+    (tmp_path / 'broken.json').write_text('{')
+    monkeypatch.setattr(json_utils, 'orjson', None)
+    monkeypatch.setattr(planning_agent, 'TEMPLATE_DIR', str(tmp_path))
+    planning_agent._read_templates.cache_clear()
+
+    assert planning_agent.PlanningAgent._load_templates(None) == {
+        'epic': {'summary': 'Épica'},
+    }
+
+
+def test_planning_agent_match_component_prefers_names_then_keywords():
+    from agents.planning_agent import PlanningAgent, _component_regex
+
+    components = ('Host Driver', 'Firmware', 'Docs')
+    match = PlanningAgent._match_component
+
+    assert match(None, 'Update firmware for the host driver', components) == 'Host Driver'
+    assert match(None, 'Kernel module rework', components) == 'Host Driver'
+    assert match(None, 'Embedded FW refresh', components) == 'Firmware'
+    assert match(None, 'Validation suite', components) is None
+    assert match(None, 'Install guide', ['Tools', 'Testing']) is None
+
+    # Priority follows component order, not position in the text
+    assert match(None, 'docs for the firmware', components) == 'Firmware'
+    assert match(None, 'Anything', []) is None
+
+    _component_regex.cache_clear()
+    for text in ('kernel', 'fw', 'guide'):
+        match(None, text, components)
+    assert _component_regex.cache_info().misses == 1
+
+
+def test_planning_agent_summary_counts_ticket_types():
+    from agents.planning_agent import PlannedRelease, PlannedTicket, PlanningAgent, ReleasePlan
+
+    plan = ReleasePlan(project_key='STL', releases=[
+        PlannedRelease(name='12.0', tickets=[
+            PlannedTicket(issue_type='Epic'),
+            PlannedTicket(issue_type='Story'),
+            PlannedTicket(issue_type='Task'),
+        ]),
+        PlannedRelease(name='12.1', tickets=[PlannedTicket(issue_type='Story')]),
+    ])
+
+    assert PlanningAgent._generate_summary(None, plan) == (
+        'Release Plan Summary:\n'
+        '- 2 releases to create\n'
+        '- 4 total tickets\n'
+        '- 1 Epics\n'
+        '- 2 Stories'
+    )
+
+
+def _planning_agent(monkeypatch):
+    from agents.planning_agent import PlanningAgent
+
+    monkeypatch.setattr(PlanningAgent, '_load_prompt_file', staticmethod(lambda: 'prompt'))
+    return PlanningAgent(llm=_DummyLLM([]))
+
+
+def test_planning_agent_create_plan_matches_each_feature_once(monkeypatch: pytest.MonkeyPatch):
+    from agents.planning_agent import PlanningAgent
+
+    matched = []
+    real_match = PlanningAgent._match_component
+
+    def _match(self, text, components):
+        matched.append(text)
+        return real_match(self, text, components)
+
+    monkeypatch.setattr(PlanningAgent, '_match_component', _match)
+    agent = _planning_agent(monkeypatch)
+
+    plan = agent.create_plan(
+        project_key='STL',
+        roadmap_data={
+            'releases': [{'version': '12.0'}, {'version': '11.9'}, {'version': '12.1'}],
+            'features': [{'text': 'Kernel driver update'}, {'text': ''}, {'text': 'CLI tool'}],
+            'timeline': [{'context': 'GA of 12.1', 'date': '2026-09-01'}],
+        },
+        jira_state={
+            'releases': [{'name': '11.9'}],
+            'components': [{'name': 'Driver'}, {'name': 'Tools'}],
+        },
+        org_chart={'by_area': {'driver': [{'name': 'Ann'}, {'name': 'Lee', 'is_lead': True}]}},
+    )
+
+    assert matched == ['Kernel driver update', 'CLI tool']
+    assert [r.name for r in plan.releases] == ['12.0', '12.1']
+    assert [r.release_date for r in plan.releases] == [None, '2026-09-01']
+    stories = plan.releases[1].tickets[1:]
+    assert [(t.components, t.assignee, t.fix_versions) for t in stories] == [
+        (['Driver'], 'Lee', ['12.1']),
+        (['Tools'], None, ['12.1']),
+    ]
+    assert stories[0].components is not plan.releases[0].tickets[1].components
+
+
+def test_planning_agent_run_without_llm_skips_prompt(monkeypatch: pytest.MonkeyPatch):
+    from agents.planning_agent import PlanningAgent
+
+    def _unexpected(*args, **kwargs):
+        raise AssertionError('prompt was built')
+
+    monkeypatch.setattr(PlanningAgent, '_format_roadmap', _unexpected)
+    monkeypatch.setattr(PlanningAgent, '_run_with_tools', _unexpected)
+    agent = _planning_agent(monkeypatch)
+
+    response = agent.run({
+        'project_key': 'STL',
+        'roadmap_data': {'releases': [{'version': '12.0'}], 'features': []},
+        'use_llm': False,
+    })
+
+    assert response.success
+    assert response.content.startswith('Release Plan Summary:')
+    assert [r['name'] for r in response.metadata['plan']['releases']] == ['12.0']
+
+
+def test_planning_agent_prompt_formatters_fall_back_when_empty():
+    from agents.planning_agent import PlanningAgent
+
+    agent = PlanningAgent.__new__(PlanningAgent)
+
+    assert agent._format_roadmap({}) == 'No roadmap data available'
+    assert agent._format_org_chart({'by_area': {}}) == 'No org chart available'
+    assert agent._format_jira_state({
+        'project_info': {'name': 'Storage'},
+        'releases': [{'name': '12.0', 'released': True}],
+    }) == 'Project: Storage\n\nExisting Releases (1):\n  - 12.0 (Released)'
+
+
+def test_planning_agent_assignee_uses_first_matching_area_owner():
+    from agents.planning_agent import PlanningAgent
+
+    area_owners = PlanningAgent._area_owners({
+        'Empty': [],
+        'Host Driver': [{'name': 'Ann'}, {'name': 'Lee', 'is_lead': True}],
+        'Driver': [{'name': 'Kim'}],
+    })
+    match = PlanningAgent._match_assignee
+
+    assert area_owners == [('host driver', 'Lee'), ('driver', 'Kim')]
+    assert match(None, 'Driver', area_owners) == 'Lee'
+    assert match(None, 'Driver Tools', area_owners) == 'Kim'
+    assert match(None, 'Empty', area_owners) is None
+    assert match(None, None, area_owners) is None
+
+
+def test_planning_agent_registers_file_tools_on_first_llm_run(monkeypatch: pytest.MonkeyPatch):
+    from agents.base import BaseAgent
+    from agents.planning_agent import PlanningAgent
+
+    monkeypatch.setattr(PlanningAgent, '_load_prompt_file', staticmethod(lambda: 'prompt'))
+    seen = []
+    monkeypatch.setattr(
+        BaseAgent,
+        '_run_with_tools',
+        lambda self, user_input, max_iterations=None, timeout=None: seen.append(set(self.tools)),
+    )
+
+    agent = PlanningAgent(llm=_DummyLLM([]))
+    assert agent.tools == {}
+
+    agent._run_with_tools('plan it')
+    agent._run_with_tools('again')
+
+    assert 'read_file' in seen[0]
+    assert seen[0] == seen[1]
+
+
+def test_planning_agent_registers_file_tools_for_external_tool_calls(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from agents.planning_agent import PlanningAgent
+
+    monkeypatch.setattr(PlanningAgent, '_load_prompt_file', staticmethod(lambda: 'prompt'))
+
+    schemas = PlanningAgent(llm=_DummyLLM([])).get_tool_schemas()
+    assert 'read_file' in {s['function']['name'] for s in schemas}
+
+    agent = PlanningAgent(llm=_DummyLLM([]))
+    result = agent.execute_tool('read_file', {'file_path': 'missing.md'})
+    assert 'read_file' in agent.tools
+    assert result.error != 'Unknown tool: read_file'
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_release_plan_to_json_matches_to_dict(monkeypatch: pytest.MonkeyPatch, use_orjson):
+    from agents import planning_agent
+    from core import json_utils
+
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_utils, 'orjson', None)
+
+    plan = planning_agent.ReleasePlan(
+        project_key='STL',
+        summary='Release Plan Summary',
+        releases=[planning_agent.PlannedRelease(name='12.0', release_date='2026-09-01', tickets=[
+            planning_agent.PlannedTicket(summary='Épic', issue_type='Epic', labels=['release-tracking']),
+            planning_agent.PlannedTicket(summary='Story', components=['Driver'], assignee='Lee'),
+        ])],
+    )
+
+    raw = plan.to_json()
+
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == plan.to_dict()
+    assert list(json.loads(raw)['releases'][0]['tickets'][0]) == list(
+        plan.releases[0].tickets[0].to_dict()
+    )
+
+
+def test_planning_agent_org_chart_prompt_lists_first_ten_areas():
+    from agents.planning_agent import PlanningAgent
+
+    by_area = {f'Area {i}': [{'name': f'P{i}a'}, {'name': f'P{i}b'}] for i in range(12)}
+
+    lines = PlanningAgent.__new__(PlanningAgent)._format_org_chart(
+        {'by_area': by_area}
+    ).splitlines()
+
+    assert lines[0] == 'Responsibilities by Area:'
+    assert lines[1:] == [f'  - Area {i}: P{i}a, P{i}b' for i in range(10)]
+
+
+def test_release_plan_bulk_payload_batches_create_ticket_arguments():
+    import inspect
+
+    from agents.planning_agent import PlannedRelease, PlannedTicket, ReleasePlan
+    from tools.jira_tools import create_ticket
+
+    plan = ReleasePlan(project_key='STL', releases=[
+        PlannedRelease(name='12.0', tickets=[PlannedTicket(summary=f'A{i}') for i in range(3)]),
+        PlannedRelease(name='12.1', tickets=[
+            PlannedTicket(summary='B0', components=['Driver'], fix_versions=['12.1']),
+        ]),
+    ])
+
+    batches = list(plan.to_bulk_payload(batch_size=2))
+
+    assert [[t['summary'] for t in b] for b in batches] == [['A0', 'A1'], ['A2', 'B0']]
+    last = batches[-1][-1]
+    inspect.signature(create_ticket).bind(**last)
+    assert (last['project_key'], last['components']) == ('STL', ['Driver'])
+    assert last['fix_versions'] is not plan.releases[1].tickets[0].fix_versions
+    assert len(next(plan.to_bulk_payload())) == 4
+
+
+def test_planning_agent_create_plan_reuses_plans_for_identical_inputs(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from agents import planning_agent
+
+    agent = _planning_agent(monkeypatch)
+    builds = []
+    real_build = planning_agent.PlanningAgent._build_plan
+
+    def _build(self, *args):
+        builds.append(args[0])
+        return real_build(self, *args)
+
+    monkeypatch.setattr(planning_agent.PlanningAgent, '_build_plan', _build)
+    monkeypatch.setattr(planning_agent, 'PLAN_CACHE_SIZE', 1)
+    roadmap = {'releases': [{'version': '12.0'}], 'features': [{'text': 'Driver'}]}
+
+    first = agent.create_plan('STL', roadmap, {}, {})
+    second = agent.create_plan('STL', {'features': [{'text': 'Driver'}], 'releases': [{'version': '12.0'}]}, {}, {})
+
+    # A hit neither rebuilds nor copies: the cached plan is shared
+    assert builds == ['STL']
+    assert second is first
+    assert len(second.releases[0].tickets) == 2
+    exported = second.to_dict()
+    exported['releases'][0]['tickets'].clear()
+    assert len(first.releases[0].tickets) == 2
+
+    agent.create_plan('STLSB', roadmap, {}, {})
+    agent.create_plan('STL', roadmap, {}, {})
+    agent.create_plan('STL', {'releases': [{'version': object()}]}, {}, {})
+    assert builds == ['STL', 'STLSB', 'STL', 'STL']
@@ -77,6 +77,126 @@ def test_get_project_fields_tool_delegates(monkeypatch: pytest.MonkeyPatch):
     assert result.data['selected_issue_types'] == ['Bug']
 
 
+def test_search_tickets_tool_pages_with_batch_size(monkeypatch: pytest.MonkeyPatch):
+    from tools import jira_tools
+
+    captured = {}
+
+    def _paginated(jira, jql, max_results=None, fields=None, page_size=100):
+        captured.update(max_results=max_results, fields=fields, page_size=page_size)
+        return []
+
+    jira = MagicMock()
+    monkeypatch.setattr(jira_tools, 'get_jira', lambda: jira)
+    monkeypatch.setattr(jira_tools, 'paginated_jql_search', _paginated)
+
+    result = jira_tools.search_tickets(
+        'project = STL', limit=40, fields=['summary'], batch_size=500
+    )
+
+    assert result.is_success
+    assert captured == {'max_results': 40, 'fields': ['summary'], 'page_size': 500}
+    jira.search_issues.assert_not_called()
+
+
+def test_search_tickets_tool_schema_keeps_full_batch_size_description():
+    from tools import jira_tools
+
+    params = {p.name: p.description for p in jira_tools.search_tickets._tool_definition.parameters}
+
+    assert params['batch_size'] == (
+        'Optional page size; when set, results are fetched in pages of this '
+        'many issues (fewer round trips for large limits).'
+    )
+
+
+def test_get_releases_accepts_string_or_compiled_pattern(monkeypatch: pytest.MonkeyPatch):
+    import re
+    from types import SimpleNamespace
+
+    from tools import jira_tools
+
+    jira = MagicMock()
+    jira.project_versions.return_value = [
+        SimpleNamespace(id='1', name='12.0.1', released=False),
+        SimpleNamespace(id='2', name='Backlog', released=False),
+        SimpleNamespace(id='3', name='12.1', released=True),
+    ]
+    monkeypatch.setattr(jira_tools, 'get_jira', lambda: jira)
+    monkeypatch.setattr(
+        jira_tools,
+        '_fetch_versions_by_status',
+        lambda project_key, status: jira.project_versions.return_value[:2],
+    )
+
+    by_string = jira_tools.get_releases('STL', pattern='^12\\.', include_released=False)
+    by_compiled = jira_tools.get_releases('STL', pattern=re.compile('backlog', re.IGNORECASE))
+
+    assert [r['name'] for r in by_string.data] == ['12.0.1']
+    assert [r['name'] for r in by_compiled.data] == ['Backlog']
+
+
+def test_get_releases_tool_schema_keeps_full_pattern_description():
+    from tools import jira_tools
+
+    params = {p.name: p.description for p in jira_tools.get_releases._tool_definition.parameters}
+
+    assert params['pattern'] == (
+        'Optional regex filter on release names; strings ignore case, '
+        'compiled patterns are used unchanged.'
+    )
+
+
+def test_get_releases_filters_release_status_server_side(monkeypatch: pytest.MonkeyPatch):
+    from types import SimpleNamespace
+
+    from tools import jira_tools
+
+    pages = [
+        {'values': [{'id': '1', 'name': '12.1', 'released': False}], 'isLast': False},
+        {'values': [{'id': '2', 'name': '12.2', 'released': False}], 'isLast': True},
+    ]
+    calls = []
+
+    def _get(url, **kwargs):
+        calls.append((url, kwargs['params']))
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: pages.pop(0))
+
+    jira = MagicMock()
+    monkeypatch.setattr(jira_tools, 'get_jira', lambda: jira)
+    monkeypatch.setattr(jira_tools.jira_utils, 'get_jira_credentials', lambda: ('me', 'token'))
+    monkeypatch.setattr(jira_tools.requests, 'get', _get)
+
+    result = jira_tools.get_releases('STL', include_released=False)
+
+    assert [r['name'] for r in result.data] == ['12.1', '12.2']
+    assert calls == [
+        (f'{jira_tools.JIRA_URL}/rest/api/3/project/STL/version',
+         {'status': 'unreleased', 'startAt': 0, 'maxResults': 50}),
+        (f'{jira_tools.JIRA_URL}/rest/api/3/project/STL/version',
+         {'status': 'unreleased', 'startAt': 1, 'maxResults': 50}),
+    ]
+    jira.project_versions.assert_not_called()
+
+    # Servers that reject the status parameter fall back to the full list
+    def _rejected(url, **kwargs):
+        raise RuntimeError('400 Bad Request')
+
+    monkeypatch.setattr(jira_tools.requests, 'get', _rejected)
+    jira.project_versions.return_value = [
+        SimpleNamespace(id='1', name='12.1', released=False),
+        SimpleNamespace(id='2', name='12.0', released=True),
+    ]
+    fallback = jira_tools.get_releases('STL', include_unreleased=False)
+
+    assert [r['name'] for r in fallback.data] == ['12.0']
+
+    # Both kinds requested: one unfiltered call
+    both = jira_tools.get_releases('STL')
+    assert [r['name'] for r in both.data] == ['12.0', '12.1']
+    assert jira.project_versions.call_count == 2
+
+
 def test_transition_ticket_tool_applies_transition_and_comment(
     monkeypatch: pytest.MonkeyPatch,
     fake_issue_resource_factory,
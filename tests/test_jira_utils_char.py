@@ -52,6 +52,23 @@ def test_get_jira_credentials_missing_token(monkeypatch: pytest.MonkeyPatch):
         jira_utils.get_jira_credentials()
 
 
+def test_connect_to_jira_widens_connection_pool(monkeypatch: pytest.MonkeyPatch):
+    import requests
+
+    class _FakeJira:
+        def __init__(self, **kwargs):
+            self._session = requests.Session()
+
+    monkeypatch.setattr(jira_utils, 'get_jira_credentials', lambda: ('e', 't'))
+    monkeypatch.setattr(jira_utils, 'JIRA', _FakeJira)
+
+    jira = jira_utils.connect_to_jira()
+    adapter = jira._session.get_adapter('https://example.atlassian.net')
+
+    assert adapter._pool_maxsize == jira_utils.JIRA_POOL_SIZE
+    assert jira._session.get_adapter('http://example') is adapter
+
+
 def test_get_connection_caches_and_reset(monkeypatch: pytest.MonkeyPatch):
     sentinel = object()
     call_count = {'count': 0}
@@ -0,0 +1,52 @@
+##########################################################################################
+#
+# Module: tools/http_session.py
+#
+# Description: Shared keep-alive HTTP session for the agent tools.
+#              The MCP client and the direct web-search fallbacks reuse one
+#              pooled requests.Session so concurrent research calls share
+#              TCP/TLS connections instead of opening one per request.
+#
+# Functions:
+#   get_session()  — the process-wide session, created on first use
+#
+# Author: Cornelis Networks
+#
+##########################################################################################
+
+import logging
+import os
+import sys
+import threading
+
+# Logging config - follows jira_utils.py pattern
+log = logging.getLogger(os.path.basename(sys.argv[0]))
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None  # type: ignore[assignment]
+    log.warning('requests library not available; HTTP tools will not function')
+
+# Keep-alive connections held per host; research fans several MCP and web
+# search calls out at once (requests' default of 10 would churn)
+HTTP_POOL_SIZE = 16
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    '''Return the shared keep-alive requests.Session, creating it on first use.'''
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
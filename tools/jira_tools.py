@@ -11,12 +11,16 @@
 
 import logging
 import os
+import re
 import sys
-from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Union
 
+import requests
 from dotenv import load_dotenv
 
 from tools.base import BaseTool, ToolResult, tool
+from core.queries import paginated_jql_search
 from core.tickets import issue_to_dict
 from core.utils import extract_text_from_adf
 
@@ -331,7 +335,7 @@ def get_project_issue_types(project_key: str) -> ToolResult:
 )
 def get_releases(
     project_key: str,
-    pattern: Optional[str] = None,
+    pattern: Optional[Union[str, re.Pattern]] = None,
     include_released: bool = True,
     include_unreleased: bool = True
 ) -> ToolResult:
@@ -340,7 +344,7 @@ def get_releases(
     
     Input:
         project_key: The project key.
-        pattern: Optional regex pattern to filter release names.
+        pattern: Optional regex filter on release names; strings ignore case, compiled patterns are used unchanged.
         include_released: Include already released versions.
         include_unreleased: Include unreleased versions.
     
@@ -351,7 +355,16 @@ def get_releases(
     
     try:
         jira = get_jira()
-        versions = jira.project_versions(project_key)
+        
+        # Let Jira drop the unwanted half when only one side is requested
+        status = None
+        if include_released != include_unreleased:
+            status = 'released' if include_released else 'unreleased'
+        versions = _project_versions(jira, project_key, status)
+        
+        # Compile once rather than per version
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, re.IGNORECASE) if pattern else None
         
         releases = []
         for v in versions:
@@ -363,10 +376,8 @@ def get_releases(
                 continue
             
             # Filter by pattern
-            if pattern:
-                import re
-                if not re.search(pattern, v.name, re.IGNORECASE):
-                    continue
+            if pattern is not None and not pattern.search(v.name):
+                continue
             
             releases.append({
                 'id': v.id,
@@ -452,7 +463,8 @@ def get_release_tickets(
 def search_tickets(
     jql: str,
     limit: int = 100,
-    fields: Optional[List[str]] = None
+    fields: Optional[List[str]] = None,
+    batch_size: Optional[int] = None,
 ) -> ToolResult:
     '''
     Search for tickets using JQL.
@@ -461,16 +473,22 @@ def search_tickets(
         jql: JQL query string.
         limit: Maximum number of results.
         fields: Optional list of fields to return.
+        batch_size: Optional page size; when set, results are fetched in pages of this many issues (fewer round trips for large limits).
     
     Output:
         ToolResult with list of matching tickets.
     '''
-    log.debug(f'search_tickets(jql={jql}, limit={limit})')
+    log.debug(f'search_tickets(jql={jql}, limit={limit}, batch_size={batch_size})')
     
     try:
         jira = get_jira()
         
-        issues = jira.search_issues(jql, maxResults=limit, fields=fields)
+        if batch_size:
+            issues = paginated_jql_search(
+                jira, jql, max_results=limit, fields=fields, page_size=batch_size
+            )
+        else:
+            issues = jira.search_issues(jql, maxResults=limit, fields=fields)
         
         tickets = []
         for issue in issues:
@@ -1901,6 +1919,59 @@ def _raw_issue_to_dict(raw: dict[str, Any]) -> Dict[str, Any]:
     return issue_to_dict(raw)
 
 
+# Page size for the status-scoped project version listing
+VERSION_PAGE_SIZE = 50
+
+
+def _project_versions(jira, project_key: str, status: Optional[str] = None) -> List[Any]:
+    '''
+    Fetch a project's versions, filtered server-side when status is given.
+    
+    python-jira's project_versions() uses the unpaged versions endpoint,
+    which has no status filter. With a status, the paged
+    GET /rest/api/3/project/{key}/version?status=... is used instead.
+    Without a status, or if the server rejects that call, the full
+    project_versions() list is returned and callers filter it themselves.
+    '''
+    if status:
+        try:
+            return _fetch_versions_by_status(project_key, status)
+        except Exception as e:
+            log.debug(f'Scoped version fetch failed, listing all versions: {e}')
+    return jira.project_versions(project_key)
+
+
+def _fetch_versions_by_status(project_key: str, status: str) -> List[SimpleNamespace]:
+    '''
+    Page /project/{key}/version?status=released|unreleased.
+    
+    Versions come back as SimpleNamespace objects so callers can read them
+    like python-jira Version resources. Raises on any HTTP error.
+    '''
+    email, api_token = jira_utils.get_jira_credentials()
+    versions: List[SimpleNamespace] = []
+    start_at = 0
+    while True:
+        response = requests.get(
+            f'{JIRA_URL}/rest/api/3/project/{project_key}/version',
+            auth=(email, api_token),
+            headers={'Accept': 'application/json'},
+            params={
+                'status': status,
+                'startAt': start_at,
+                'maxResults': VERSION_PAGE_SIZE,
+            },
+            timeout=30,
+        )
+        response.raise_for_status()
+        data = response.json()
+        values = data.get('values', [])
+        versions.extend(SimpleNamespace(**v) for v in values)
+        start_at += len(values)
+        if data.get('isLast', True) or not values:
+            return versions
+
+
 # ****************************************************************************************
 # Tool Collection Class
 # ****************************************************************************************
@@ -1952,8 +2023,9 @@ class JiraTools(BaseTool):
         jql: str,
         limit: int = 100,
         fields: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
     ) -> ToolResult:
-        return search_tickets(jql, limit, fields)
+        return search_tickets(jql, limit, fields, batch_size)
 
     @tool(description='Get a single Jira ticket')
     def get_ticket(
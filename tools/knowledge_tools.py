@@ -10,6 +10,7 @@
 #
 ##########################################################################################
 
+import hashlib
 import logging
 import os
 import re
@@ -69,10 +70,11 @@ def _find_knowledge_files() -> List[Path]:
     return sorted(files)
 
 
-def _read_text_file(path: Path) -> str:
-    '''Read a text file and return its contents.'''
+def _read_text_file(path: Path, max_chars: Optional[int] = None) -> str:
+    '''Read a text file and return its contents, or its first max_chars.'''
     try:
-        return path.read_text(encoding='utf-8')
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read() if max_chars is None else f.read(max_chars)
     except Exception as e:
         log.warning(f'Failed to read {path}: {e}')
         return ''
@@ -130,22 +132,42 @@ def _extract_sections(text: str) -> List[Dict[str, str]]:
 # PDF / DOCX extraction helpers
 # ---------------------------------------------------------------------------
 
-def _extract_pdf_text(file_path: str) -> Optional[str]:
+def _join_until(parts, max_chars: Optional[int] = None) -> str:
+    '''
+    Join text parts with blank lines, consuming parts lazily.
+
+    Stops pulling parts once max_chars characters have been collected, so
+    callers can pass a generator and skip extracting the rest.
+    '''
+    if max_chars is None:
+        return '\n\n'.join(parts)
+
+    joined: List[str] = []
+    size = -2  # no separator before the first part
+    for part in parts:
+        joined.append(part)
+        size += len(part) + 2
+        if size >= max_chars:
+            break
+    return '\n\n'.join(joined)[:max_chars]
+
+
+def _extract_pdf_text(file_path: str, max_chars: Optional[int] = None) -> Optional[str]:
     '''
     Extract text from a PDF file.
 
-    Tries PyMuPDF (fitz) first, then pdfplumber, then PyPDF2.
+    Tries PyMuPDF (fitz) first, then pdfplumber, then PyPDF2.  With
+    max_chars, pages are only extracted until that much text is collected.
     Returns None if no PDF library is available.
     '''
     # Strategy 1: PyMuPDF (fitz)
     try:
         import fitz  # PyMuPDF
         doc = fitz.open(file_path)
-        pages = []
-        for page in doc:
-            pages.append(page.get_text())
-        doc.close()
-        return '\n\n'.join(pages)
+        try:
+            return _join_until((page.get_text() for page in doc), max_chars)
+        finally:
+            doc.close()
     except ImportError:
         pass
     except Exception as e:
@@ -154,13 +176,9 @@ def _extract_pdf_text(file_path: str) -> Optional[str]:
     # Strategy 2: pdfplumber
     try:
         import pdfplumber
-        pages = []
         with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    pages.append(text)
-        return '\n\n'.join(pages)
+            pages = (page.extract_text() for page in pdf.pages)
+            return _join_until((text for text in pages if text), max_chars)
     except ImportError:
         pass
     except Exception as e:
@@ -170,12 +188,8 @@ def _extract_pdf_text(file_path: str) -> Optional[str]:
     try:
         from PyPDF2 import PdfReader
         reader = PdfReader(file_path)
-        pages = []
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                pages.append(text)
-        return '\n\n'.join(pages)
+        pages = (page.extract_text() for page in reader.pages)
+        return _join_until((text for text in pages if text), max_chars)
     except ImportError:
         pass
     except Exception as e:
@@ -184,17 +198,17 @@ def _extract_pdf_text(file_path: str) -> Optional[str]:
     return None
 
 
-def _extract_docx_text(file_path: str) -> Optional[str]:
+def _extract_docx_text(file_path: str, max_chars: Optional[int] = None) -> Optional[str]:
     '''
-    Extract text from a DOCX file.
+    Extract text from a DOCX file, or its first max_chars characters.
 
     Requires python-docx.
     '''
     try:
         from docx import Document
         doc = Document(file_path)
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        return '\n\n'.join(paragraphs)
+        paragraphs = (p.text for p in doc.paragraphs if p.text.strip())
+        return _join_until(paragraphs, max_chars)
     except ImportError:
         log.warning('python-docx not installed; cannot read DOCX files')
         return None
@@ -203,6 +217,31 @@ def _extract_docx_text(file_path: str) -> Optional[str]:
         return None
 
 
+def knowledge_base_version() -> str:
+    '''
+    Fingerprint of the knowledge directory's files and modification times.
+
+    Changes whenever a knowledge file is added, removed or edited, so
+    callers can key cached search_knowledge results on it.
+    '''
+    kb_dir = Path(KNOWLEDGE_DIR)
+    if not kb_dir.exists():
+        return ''
+
+    digest = hashlib.sha1()
+    for p in sorted(kb_dir.rglob('*')):
+        if p.suffix.lower() not in SUPPORTED_TEXT_EXTENSIONS:
+            continue
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        if not p.is_file():
+            continue
+        digest.update(f'{p}\0{st.st_mtime_ns}\0{st.st_size}\n'.encode('utf-8'))
+    return digest.hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # Public @tool functions
 # ---------------------------------------------------------------------------
@@ -343,7 +382,7 @@ def read_knowledge_file(file_path: str) -> ToolResult:
     name='read_document',
     description='Read and extract text from a document (PDF, DOCX, Markdown, TXT)',
 )
-def read_document(file_path: str) -> ToolResult:
+def read_document(file_path: str, max_chars: Optional[int] = None) -> ToolResult:
     '''
     Read a user-provided document and extract its text content.
 
@@ -355,9 +394,13 @@ def read_document(file_path: str) -> ToolResult:
 
     Input:
         file_path: Path to the document.
+        max_chars: Optional limit on the returned text; reading stops once
+                   this many characters have been extracted.
 
     Output:
-        ToolResult with extracted text, file type, and metadata.
+        ToolResult with extracted text, file type, and metadata.  truncated
+        is True when max_chars cut the text short; line and word counts
+        describe the returned content.
     '''
     log.info(f'read_document: {file_path}')
 
@@ -368,11 +411,13 @@ def read_document(file_path: str) -> ToolResult:
     suffix = fp.suffix.lower()
     text: Optional[str] = None
     file_type = 'unknown'
+    # One character past max_chars tells a cut document from one that fits
+    limit = None if max_chars is None else max_chars + 1
 
     # PDF
     if suffix == '.pdf':
         file_type = 'pdf'
-        text = _extract_pdf_text(file_path)
+        text = _extract_pdf_text(file_path, limit)
         if text is None:
             return ToolResult.failure(
                 f'Cannot read PDF: {file_path}. '
@@ -382,7 +427,7 @@ def read_document(file_path: str) -> ToolResult:
     # DOCX
     elif suffix == '.docx':
         file_type = 'docx'
-        text = _extract_docx_text(file_path)
+        text = _extract_docx_text(file_path, limit)
         if text is None:
             return ToolResult.failure(
                 f'Cannot read DOCX: {file_path}. '
@@ -392,7 +437,7 @@ def read_document(file_path: str) -> ToolResult:
     # Text-based formats
     elif suffix in SUPPORTED_TEXT_EXTENSIONS:
         file_type = suffix.lstrip('.')
-        text = _read_text_file(fp)
+        text = _read_text_file(fp, limit)
 
     else:
         return ToolResult.failure(
@@ -403,6 +448,10 @@ def read_document(file_path: str) -> ToolResult:
     if not text:
         return ToolResult.failure(f'No text content extracted from: {file_path}')
 
+    truncated = max_chars is not None and len(text) > max_chars
+    if truncated:
+        text = text[:max_chars]
+
     # Compute basic stats
     line_count = text.count('\n') + 1
     word_count = len(text.split())
@@ -415,6 +464,7 @@ def read_document(file_path: str) -> ToolResult:
         'line_count': line_count,
         'word_count': word_count,
         'content': text,
+        'truncated': truncated,
     })
 
 
@@ -438,5 +488,5 @@ class KnowledgeTools(BaseTool):
         return read_knowledge_file(file_path=file_path)
 
     @tool(description='Read and extract text from a document')
-    def read_document(self, file_path: str) -> ToolResult:
-        return read_document(file_path=file_path)
+    def read_document(self, file_path: str, max_chars: Optional[int] = None) -> ToolResult:
+        return read_document(file_path=file_path, max_chars=max_chars)
@@ -27,6 +27,8 @@ except ImportError:
     requests = None  # type: ignore[assignment]
     log.warning('requests library not available; MCP tools will not function')
 
+from tools import http_session
+
 try:
     from tools.base import tool, ToolResult, BaseTool
 except ImportError:
@@ -121,7 +123,9 @@ def _mcp_request(method: str, params: Optional[Dict[str, Any]] = None,
     log.debug(f'MCP request: {method} -> {url}')
 
     try:
-        resp = requests.post(url, json=payload, headers=_mcp_headers(), timeout=timeout)
+        resp = http_session.get_session().post(
+            url, json=payload, headers=_mcp_headers(), timeout=timeout
+        )
         resp.raise_for_status()
     except Exception as e:
         raise RuntimeError(f'MCP HTTP error: {e}') from e
@@ -14,6 +14,7 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 # Logging config - follows jira_utils.py pattern
@@ -25,6 +26,8 @@ except ImportError:
     requests = None  # type: ignore[assignment]
     log.warning('requests library not available; web search tools will not function')
 
+from tools import http_session
+
 try:
     from tools.base import tool, ToolResult, BaseTool
 except ImportError:
@@ -47,6 +50,10 @@ except ImportError:
     class BaseTool:  # type: ignore[no-redef]
         pass
 
+# Upper bound on web_search_multi's concurrent queries
+WEB_SEARCH_MULTI_WORKERS = 8
+
+
 # Lazy import — mcp_tools may not be available in all environments
 _mcp_tools = None
 
@@ -143,7 +150,9 @@ def _search_via_brave(query: str, max_results: int = 10) -> Optional[Dict[str, A
     }
 
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=15)
+        resp = http_session.get_session().get(
+            url, headers=headers, params=params, timeout=15
+        )
         resp.raise_for_status()
         data = resp.json()
 
@@ -195,7 +204,7 @@ def _search_via_tavily(query: str, max_results: int = 10) -> Optional[Dict[str,
     }
 
     try:
-        resp = requests.post(url, json=payload, timeout=15)
+        resp = http_session.get_session().post(url, json=payload, timeout=15)
         resp.raise_for_status()
         data = resp.json()
 
@@ -303,9 +312,20 @@ def web_search_multi(
         'errors': [],
     }
 
-    for query in queries:
-        result = web_search(query, max_results=max_results_per_query)
-
+    # Queries are independent round-trips over the shared keep-alive
+    # session, so issue them together and aggregate in query order.
+    results: List[Any] = []
+    if queries:
+        with ThreadPoolExecutor(
+            max_workers=min(WEB_SEARCH_MULTI_WORKERS, len(queries)),
+            thread_name_prefix='web-search',
+        ) as pool:
+            results = list(pool.map(
+                lambda q: web_search(q, max_results=max_results_per_query),
+                queries,
+            ))
+
+    for query, result in zip(queries, results):
         if hasattr(result, 'is_success') and result.is_success:
             data = result.data
             all_results['results_by_query'][query] = data